@@ -2,6 +2,7 @@
   config(
     materialized='table',
     tags=['marts', 'campaign', 'core'],
+    partition_by={'field': 'report_date', 'data_type': 'date', 'granularity': 'day'},
     cluster_by=['report_date', 'platform']
   )
 }}
@@ -7,6 +7,7 @@
 
 select
   date as report_date,
+  account_id,
   campaign_id,
   campaign_name,
   impressions,
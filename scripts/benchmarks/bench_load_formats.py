@@ -0,0 +1,113 @@
+"""
+Benchmark JSON vs Parquet raw loads.
+
+Generates synthetic Google Ads raw rows (enriched with run metadata), then
+measures for each load format the bytes that would be uploaded to BigQuery
+and the client-side serialization time. With --load, the payloads are also
+loaded into a scratch partitioned table to measure end-to-end load time.
+Figures are reported per 1M rows.
+
+Usage:
+    python scripts/benchmarks/bench_load_formats.py
+    python scripts/benchmarks/bench_load_formats.py --rows 200000
+    python scripts/benchmarks/bench_load_formats.py --load --project my-project
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add src/ to path so ingestion modules can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+# pylint: disable=wrong-import-position,import-error
+from google.cloud import bigquery  # noqa: E402
+from ingestion.columnar import to_parquet_bytes, to_record_batch  # noqa: E402
+from ingestion.schemas import coerce_rows, get_raw_schema  # noqa: E402
+
+TABLE_NAME = "google_ads_campaign_daily"
+
+
+def generate_rows(count: int) -> list[dict]:
+    """Generate enriched raw rows: 1,000 campaigns over as many days as needed."""
+    start = date(2023, 1, 1)
+    metadata = {
+        "ingested_at": "2025-01-01T00:00:00+00:00",
+        "extract_run_id": "00000000-0000-0000-0000-000000000000",
+        "source": "google_ads",
+    }
+    return [
+        {
+            "date": (start + timedelta(days=i // 1000)).isoformat(),
+            "campaign_id": f"campaign_{i % 1000:05d}",
+            "campaign_name": f"Campaign {i % 1000}",
+            "impressions": random.randint(5000, 50000),
+            "clicks": random.randint(50, 500),
+            "conversions": random.randint(5, 50),
+            "cost_usd": round(random.uniform(100, 1000), 2),
+            **metadata,
+        }
+        for i in range(count)
+    ]
+
+
+def serialize_json(rows: list[dict]) -> bytes:
+    """Serialize rows the way load_table_from_json does (newline-delimited JSON)."""
+    return "\n".join(json.dumps(row) for row in rows).encode("utf-8")
+
+
+def serialize_parquet(rows: list[dict]) -> bytes:
+    """Serialize rows as compressed Parquet through an Arrow record batch."""
+    return to_parquet_bytes(to_record_batch(rows, get_raw_schema(TABLE_NAME)))
+
+
+def load(client: bigquery.Client, table_id: str, payload: bytes, source_format: str) -> float:
+    """Load a payload into the scratch table and return the elapsed seconds."""
+    job_config = bigquery.LoadJobConfig(
+        source_format=source_format,
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+        schema=get_raw_schema(TABLE_NAME),
+        time_partitioning=bigquery.TimePartitioning(field="date"),
+    )
+    started = time.perf_counter()
+    client.load_table_from_file(io.BytesIO(payload), table_id, job_config=job_config).result()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs Parquet raw loads")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows to generate")
+    parser.add_argument("--load", action="store_true", help="Also run BigQuery load jobs")
+    parser.add_argument("--project", default="media-data-platform", help="GCP project ID")
+    parser.add_argument("--table", default="mdp_raw.bench_load_formats", help="Scratch table")
+    args = parser.parse_args()
+
+    rows = coerce_rows(generate_rows(args.rows), get_raw_schema(TABLE_NAME))
+    scale = 1_000_000 / args.rows
+    client = bigquery.Client(project=args.project) if args.load else None
+
+    print(f"{'format':<10}{'MB / 1M rows':>15}{'serialize s / 1M':>20}{'load s / 1M':>15}")
+    for name, serialize, source_format in [
+        ("json", serialize_json, bigquery.SourceFormat.NEWLINE_DELIMITED_JSON),
+        ("parquet", serialize_parquet, bigquery.SourceFormat.PARQUET),
+    ]:
+        started = time.perf_counter()
+        payload = serialize(rows)
+        serialize_seconds = time.perf_counter() - started
+
+        load_seconds = "-"
+        if client is not None:
+            elapsed = load(client, f"{args.project}.{args.table}", payload, source_format)
+            load_seconds = f"{elapsed * scale:.2f}"
+
+        print(f"{name:<10}{len(payload) * scale / 1e6:>15.1f}"
+              f"{serialize_seconds * scale:>20.2f}{load_seconds:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark the memory footprint of campaign-daily rows: dicts vs typed records.
+
+Builds N Google Ads campaign-day rows as plain dicts, then as slotted
+GoogleAdsCampaignDaily records, and reports the memory allocated for each
+representation (tracemalloc) along with the build time. Values are shared
+between both runs so only the container overhead is compared.
+
+Usage:
+    python scripts/benchmarks/bench_record_memory.py
+    python scripts/benchmarks/bench_record_memory.py --rows 200000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add src/ to path so ingestion modules can be imported
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+# pylint: disable=wrong-import-position,import-error
+from ingestion.records import GoogleAdsCampaignDaily  # noqa: E402
+
+FIELDS = ("date", "campaign_id", "campaign_name", "impressions", "clicks", "conversions", "cost_usd")
+
+
+def build_values(count: int) -> list[tuple]:
+    """Pre-build row values so their allocation is excluded from measurements."""
+    dates = [f"2024-01-{day:02d}" for day in range(1, 29)]
+    campaigns = [(f"campaign_{i:05d}", f"Campaign {i}") for i in range(1000)]
+    return [
+        (dates[i % 28], *campaigns[i % 1000], 10000 + i % 977, 100 + i % 53, i % 17, 100.0 + i % 89)
+        for i in range(count)
+    ]
+
+
+def measure(build, values: list[tuple]) -> tuple[float, float]:
+    """Return (allocated MB, seconds) needed to build the rows."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = build(values)
+    elapsed = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return allocated / 1e6, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dict vs record row memory")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows to build")
+    args = parser.parse_args()
+
+    values = build_values(args.rows)
+    representations = [
+        ("dict", lambda vals: [dict(zip(FIELDS, v)) for v in vals]),
+        ("record", lambda vals: [GoogleAdsCampaignDaily(*v) for v in vals]),
+    ]
+
+    print(f"{'representation':<16}{'MB':>10}{'bytes / row':>14}{'build s':>10}")
+    for name, build in representations:
+        megabytes, seconds = measure(build, values)
+        print(f"{name:<16}{megabytes:>10.1f}{megabytes * 1e6 / args.rows:>14.0f}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
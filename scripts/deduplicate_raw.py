@@ -1,8 +1,13 @@
 """
-Deduplicate BigQuery raw tables.
+Migrate legacy BigQuery raw tables to date-partitioned tables.
 
-Keeps the most recent row per (date, campaign_id) based on ingested_at.
-Safe to run multiple times — idempotent.
+Raw tables created before partition-scoped loads were unpartitioned and filled
+with WRITE_APPEND, so reruns produced duplicates. This one-off migration keeps
+the most recent row per (date, campaign_id) based on ingested_at and recreates
+the table partitioned by `date`. Connectors now replace one date partition per
+load, so no recurring deduplication pass is needed afterwards.
+
+Tables that are already partitioned are skipped — safe to run multiple times.
 
 Usage:
     python scripts/deduplicate_raw.py
@@ -12,10 +17,16 @@ Usage:
 
 import argparse
 import logging
+import sys
+from pathlib import Path
 
 from dotenv import load_dotenv
 from google.cloud import bigquery
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from ingestion.bigquery_clients import get_client  # noqa: E402
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -28,10 +39,19 @@ RAW_TABLES = [
 
 
 def deduplicate_table(client: bigquery.Client, project_id: str, table: str) -> int:
-    """Deduplicate a raw table, keeping the most recent row per (date, campaign_id)."""
-    full_table = f"`{project_id}.mdp_raw.{table}`"
+    """Deduplicate a legacy raw table and recreate it partitioned by date."""
+    table_id = f"{project_id}.mdp_raw.{table}"
+    legacy_table = client.get_table(table_id)
+    if legacy_table.time_partitioning is not None:
+        logger.info("  already partitioned, skipped")
+        return legacy_table.num_rows
+
+    # BigQuery cannot change the partitioning of an existing table in place:
+    # build the partitioned copy, then swap it with the legacy table
     query = f"""
-    CREATE OR REPLACE TABLE {full_table} AS
+    CREATE OR REPLACE TABLE `{table_id}__partitioned`
+    PARTITION BY date
+    AS
     SELECT * EXCEPT(rn)
     FROM (
         SELECT *,
@@ -39,23 +59,26 @@ def deduplicate_table(client: bigquery.Client, project_id: str, table: str) -> i
                 PARTITION BY date, campaign_id
                 ORDER BY ingested_at DESC
             ) AS rn
-        FROM {full_table}
+        FROM `{table_id}`
     )
-    WHERE rn = 1
+    WHERE rn = 1;
+
+    DROP TABLE `{table_id}`;
+    ALTER TABLE `{table_id}__partitioned` RENAME TO `{table}`;
     """
     job = client.query(query)
     job.result()
-    table_ref = client.get_table(f"{project_id}.mdp_raw.{table}")
+    table_ref = client.get_table(table_id)
     return table_ref.num_rows
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Deduplicate BigQuery raw tables")
+    parser = argparse.ArgumentParser(description="Migrate BigQuery raw tables to date partitions")
     parser.add_argument("--project", default="media-data-platform", help="GCP project ID")
-    parser.add_argument("--tables", nargs="+", default=RAW_TABLES, help="Tables to deduplicate")
+    parser.add_argument("--tables", nargs="+", default=RAW_TABLES, help="Tables to migrate")
     args = parser.parse_args()
 
-    client = bigquery.Client(project=args.project)
+    client = get_client(args.project)
 
     for table in args.tables:
         logger.info("Deduplicating %s ...", table)
@@ -66,4 +89,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
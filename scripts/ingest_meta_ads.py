@@ -7,6 +7,39 @@ and loads it into the BigQuery raw zone (mdp_raw.meta_ads_campaign_daily).
 Usage:
     python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31
     python scripts/ingest_meta_ads.py --start 2024-01-01 --end 2024-12-31 --fake
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --batch-size 5000
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --window-days 31 --max-workers 4
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --pipelined
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --insights-mode async
+    python scripts/ingest_meta_ads.py --start 2024-01-01 --end 2024-12-31 --accounts act_111,act_222
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --restart
+    python scripts/ingest_meta_ads.py --incremental
+    python scripts/ingest_meta_ads.py --incremental --start 2023-04-06 --lookback-days 14
+    python scripts/ingest_meta_ads.py --incremental --skip-unchanged
+    python scripts/ingest_meta_ads.py --start 2023-04-06 --end 2025-12-31 --replay
+
+The period is split into windows extracted concurrently, then rows are loaded
+in bounded batches, so memory usage does not depend on the length of the period.
+With --pipelined, the next batch is extracted while the previous one is loaded.
+
+Accounts come from --accounts, META_ADS_ACCOUNT_IDS, the ad accounts of
+META_ADS_BUSINESS_ID, or META_ADS_ACCOUNT_ID, in that order. They are extracted
+concurrently, largest first; the script exits with status 1 if any account failed.
+
+Progress is checkpointed in a local state file (--checkpoint-file): if a run
+fails, running the same command again resumes it and only extracts the
+(account, window) tasks that were not loaded yet. --restart starts over.
+
+With --incremental, the period is computed from the watermark of each account
+(last date loaded, --watermark-file): from the watermark minus --lookback-days
+(late data) to --end (default: yesterday). --start is then only used for
+accounts that were never loaded. Watermarks advance once the run succeeded.
+
+With --skip-unchanged, re-pulled dates whose rows are identical to the stored
+ones (same row fingerprints) are not rewritten.
+
+With RAW_ARCHIVE_URI set, every extraction is also archived; --replay rebuilds
+the raw table over the period from that archive, without calling the API.
 
 Requirements:
     - META_ADS_APP_ID, META_ADS_APP_SECRET, META_ADS_ACCESS_TOKEN, META_ADS_ACCOUNT_ID
@@ -39,13 +72,30 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--start",
-        required=True,
-        help="Start date in YYYY-MM-DD format",
+        default=None,
+        help="Start date in YYYY-MM-DD format (with --incremental: for accounts never loaded)",
     )
     parser.add_argument(
         "--end",
-        required=True,
-        help="End date in YYYY-MM-DD format (inclusive)",
+        default=None,
+        help="End date in YYYY-MM-DD format (inclusive, with --incremental: default yesterday)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        default=False,
+        help="Extract from each account's watermark minus the lookback instead of --start",
+    )
+    parser.add_argument(
+        "--lookback-days",
+        type=int,
+        default=None,
+        help="Days before the watermark extracted again for late data (default: LATE_DATA_DAYS)",
+    )
+    parser.add_argument(
+        "--watermark-file",
+        default=None,
+        help="Watermark state file (default: INGESTION_WATERMARK_PATH or .checkpoints/watermarks.json)",
     )
     parser.add_argument(
         "--fake",
@@ -53,7 +103,78 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Use fake API instead of real Meta Ads API (for testing)",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Maximum number of rows per BigQuery load (default: connector default)",
+    )
+    parser.add_argument(
+        "--window-days",
+        type=int,
+        default=None,
+        help="Days per extraction window (default: connector setting)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Number of windows extracted concurrently (default: connector setting)",
+    )
+    parser.add_argument(
+        "--insights-mode",
+        choices=["auto", "sync", "async"],
+        default=None,
+        help="Real API insights: sync calls, async report runs, or auto from estimated volume",
+    )
+    parser.add_argument(
+        "--accounts",
+        default=None,
+        help="Comma-separated ad account IDs (default: META_ADS_ACCOUNT_IDS or discovery)",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        default=None,
+        help="Checkpoint state file (default: INGESTION_CHECKPOINT_PATH or .checkpoints/ingestion.json)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        default=False,
+        help="Discard the checkpoint of an interrupted run of the same period and start over",
+    )
+    parser.add_argument(
+        "--no-checkpoint",
+        action="store_true",
+        default=False,
+        help="Neither record progress nor resume an interrupted run",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        default=False,
+        help="Do not rewrite date partitions whose rows match the stored fingerprints",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        default=False,
+        help="Rebuild the raw table from the payload archive (RAW_ARCHIVE_URI) without calling the API",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        default=False,
+        help="Overlap extraction and BigQuery loads (reports per-stage timings)",
+    )
+    args = parser.parse_args()
+    if not args.incremental and not (args.start and args.end):
+        parser.error("--start and --end are required unless --incremental is set")
+    if args.incremental and args.pipelined:
+        parser.error("--pipelined is not supported with --incremental")
+    if args.replay and (args.incremental or args.pipelined):
+        parser.error("--replay is not supported with --incremental or --pipelined")
+    return args
 
 
 def main() -> None:
@@ -64,20 +185,86 @@ def main() -> None:
     mode = "real API" if use_real_api else "fake API"
 
     logger.info("Starting Meta Ads ingestion")
-    logger.info("  Period : %s -> %s", args.start, args.end)
+    if args.incremental:
+        logger.info("  Period : from watermarks -> %s", args.end or "yesterday")
+    else:
+        logger.info("  Period : %s -> %s", args.start, args.end)
     logger.info("  Mode   : %s", mode)
 
-    from ingestion.meta_ads.connector import MetaAdsConnector  # pylint: disable=import-outside-toplevel,import-error
+    # pylint: disable=import-outside-toplevel,import-error
+    from ingestion.checkpoints import CheckpointStore
+    from ingestion.meta_ads.connector import MetaAdsConnector
+    from ingestion.run_modes import DEFAULT_BATCH_SIZE
+    from ingestion.watermarks import WatermarkStore
+    from ingestion.windowing import LATE_DATA_DAYS
+
+    checkpoints = None if args.no_checkpoint else CheckpointStore(args.checkpoint_file)
+    if checkpoints and args.restart and not args.incremental \
+            and checkpoints.discard("meta_ads", args.start, args.end):
+        logger.info("  Checkpoint of the interrupted run discarded")
 
-    connector = MetaAdsConnector(use_real_api=use_real_api)
-    result = connector.run(args.start, args.end)
+    accounts = [a.strip() for a in args.accounts.split(",") if a.strip()] if args.accounts else None
+    connector = MetaAdsConnector(use_real_api=use_real_api, insights_mode=args.insights_mode, accounts=accounts)
+    if args.skip_unchanged:
+        connector.skip_unchanged = True
+
+    if args.replay:
+        stats = connector.run_replay(args.start, args.end, batch_size=args.batch_size or DEFAULT_BATCH_SIZE)
+        logger.info("Replay completed")
+        logger.info("  Run id           : %s", stats["extract_run_id"])
+        logger.info("  Rows written     : %d (%d batches)", stats["rows"], stats["batches"])
+        logger.info("  Archived files   : %d (%d dates, %d not archived)",
+                    stats["files"], stats["dates"], len(stats["missing_dates"]))
+        logger.info("  Wall time        : %.1fs", stats["wall_seconds"])
+        return
+
+    if args.incremental:
+        stats = connector.run_incremental(
+            args.end,
+            lookback_days=LATE_DATA_DAYS if args.lookback_days is None else args.lookback_days,
+            initial_start_date=args.start,
+            watermarks=WatermarkStore(args.watermark_file),
+            batch_size=args.batch_size or DEFAULT_BATCH_SIZE,
+            window_days=args.window_days,
+            max_workers=args.max_workers,
+            checkpoints=checkpoints,
+        )
+        logger.info("  Extracted period : %s -> %s", stats["start_date"], stats["end_date"])
+    else:
+        run = connector.run_pipelined if args.pipelined else connector.run_streaming
+        stats = run(
+            args.start,
+            args.end,
+            batch_size=args.batch_size or DEFAULT_BATCH_SIZE,
+            window_days=args.window_days,
+            max_workers=args.max_workers,
+            checkpoints=checkpoints,
+        )
 
     logger.info("Ingestion completed")
-    logger.info("  Rows written     : %d", len(result))
-    if result:
-        logger.info("  Period covered   : %s -> %s", result[0]["date"], result[-1]["date"])
-        logger.info("  Unique campaigns : %d", len({r["campaign_id"] for r in result}))
-        logger.info("  Total spend      : %.2f USD", sum(r.get("spend_usd", 0) for r in result))
+    logger.info("  Run id           : %s", stats["extract_run_id"])
+    logger.info("  Rows written     : %d", stats["rows"])
+    logger.info("  Windows          : %d", stats["windows"])
+    if "skipped_partitions" in stats:
+        logger.info("  Unchanged        : %d partitions (%d rows) skipped",
+                    stats["skipped_partitions"], stats["skipped_rows"])
+    if stats.get("resumed"):
+        logger.info("  Resumed          : %d windows already loaded", stats["skipped_windows"])
+    logger.info("  Accounts         : %d (%d failed)", len(stats["accounts"]), len(stats["failed_accounts"]))
+    logger.info("  Batches loaded   : %d", stats["batches"])
+    logger.info("  API calls        : %d (%d throttled)", stats["api"]["calls"], stats["api"]["throttled_calls"])
+    logger.info("  API working      : %.1fs (throttled %.1fs)",
+                stats["api"]["working_seconds"], stats["api"]["throttled_seconds"])
+    logger.info("  BigQuery         : %d clients, %d connections opened",
+                stats["bigquery"]["clients_created"], stats["bigquery"]["connections_created"])
+    if args.pipelined:
+        logger.info("  Extract / load   : %.1fs / %.1fs", stats["extract_seconds"], stats["load_seconds"])
+        logger.info("  Wall / overlap   : %.1fs / %.1fs", stats["wall_seconds"], stats["overlap_seconds"])
+
+    if stats["failed_accounts"]:
+        for account in stats["failed_accounts"]:
+            logger.error("  Account %s failed: %s", account, "; ".join(stats["accounts"][account]["errors"]))
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -19,35 +19,23 @@ echo "=============================="
 echo "  Media Data Platform Pipeline"
 echo "=============================="
 
-# --- Meta Ads ingestion (par année pour éviter timeout API) ---
+# --- Meta Ads ingestion ---
+# Le planner ne charge que les dates manquantes ou chargées avant la fin de la
+# fenêtre late data (lecture des métadonnées de partitions, pas de scan)
+# Le connecteur découpe chaque plage en fenêtres extraites en parallèle
+# (META_ADS_WINDOW_DAYS / META_ADS_MAX_WORKERS pour ajuster)
 echo ""
-echo "[1/5] Meta Ads — 2023"
-python "$SCRIPT_DIR/ingest_meta_ads.py" --start 2023-04-01 --end 2023-12-31
-
-echo ""
-echo "[2/5] Meta Ads — 2024"
-python "$SCRIPT_DIR/ingest_meta_ads.py" --start 2024-01-01 --end 2024-12-31
-
-echo ""
-echo "[3/5] Meta Ads — 2025"
-python "$SCRIPT_DIR/ingest_meta_ads.py" --start 2025-01-01 --end 2025-09-15
+echo "[1/3] Meta Ads — 2023-2025 (dates manquantes uniquement)"
+python "$SCRIPT_DIR/plan_backfill.py" --source meta_ads --start 2023-04-01 --end 2025-09-15
 
 # --- Google Ads ingestion ---
 echo ""
-echo "[4/5] Google Ads — 2023-2025 (simulation)"
-python -c "
-import sys
-sys.path.insert(0, '$PROJECT_DIR/src')
-from dotenv import load_dotenv
-load_dotenv('$PROJECT_DIR/.env')
-from ingestion.google_ads.connector import run
-result = run('2023-04-23', '2025-08-25')
-print(f'Google Ads: {len(result)} lignes écrites')
-"
+echo "[2/3] Google Ads — 2023-2025 (simulation, dates manquantes uniquement)"
+python "$SCRIPT_DIR/plan_backfill.py" --source google_ads --start 2023-04-23 --end 2025-08-25 --fake
 
 # --- dbt transformations ---
 echo ""
-echo "[5/5] dbt run + test"
+echo "[3/3] dbt run + test"
 cd "$PROJECT_DIR/dbt/mdp"
 dbt run --profiles-dir . --no-partial-parse
 dbt test --profiles-dir . --no-partial-parse
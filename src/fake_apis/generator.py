@@ -0,0 +1,339 @@
+"""
+Vectorized campaign-daily data generator for the fake APIs.
+
+Generates campaign × day performance data with NumPy, one day-block at a time,
+for any number of accounts and campaigns — enough to load-test the ingestion
+path at 10M+ rows locally. Distributions are correlated like real ad data:
+
+- each campaign has its own size, CTR, CPC and conversion rate
+- impressions follow the campaign size with a weekday seasonality
+- clicks ~ Binomial(impressions, CTR), so clicks <= impressions
+- spend = clicks × CPC with a small daily noise, so spend follows clicks
+- conversions ~ Binomial(clicks, conversion rate)
+- Meta engagement (likes, comments, shares) is drawn from impressions
+
+Data is reproducible: with a seed, each account has its own random streams
+(its campaign parameters, then one stream per day), so the same date range
+yields the same rows whatever the chunking, and an account generated alone
+yields the same rows as within a multi-account generation.
+
+`FakeAdsAPI` wraps a generator with the interface shared by the fake Google
+Ads and Meta Ads APIs (see fake_apis.google_ads_api, fake_apis.meta_ads_api).
+"""
+
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import repeat, starmap
+import os
+import zlib
+
+import numpy as np
+
+from ingestion.records import GoogleAdsCampaignDaily, MetaAdsCampaignDaily
+
+# Default rows per chunk yielded by iter_chunks() / iter_records()
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Traffic multiplier per weekday (Monday → Sunday)
+WEEKDAY_FACTORS = np.array([1.0, 1.03, 1.04, 1.01, 0.96, 0.82, 0.78])
+
+_SOURCES = {
+    "google_ads": {"campaign_prefix": "campaign", "spend_column": "cost_usd",
+                   "record_class": GoogleAdsCampaignDaily},
+    "meta_ads": {"campaign_prefix": "fb_campaign", "spend_column": "spend_usd",
+                 "record_class": MetaAdsCampaignDaily},
+}
+
+
+class CampaignDailyGenerator:  # pylint: disable=too-many-instance-attributes
+    """Generates correlated campaign × day metrics for a fake ads source."""
+
+    def __init__(self, source: str, *, n_accounts: int = 1, campaigns_per_account: int = 5,  # pylint: disable=too-many-arguments
+                 seed: int | None = None, campaign_names: list[str] | None = None,
+                 account_ids: list[str] | None = None):
+        """
+        Initialize the campaign catalogue and per-campaign parameters.
+
+        Args:
+            source: "google_ads" or "meta_ads" (selects column names and ID prefixes)
+            n_accounts: Number of ad accounts
+            campaigns_per_account: Number of campaigns in each account
+            seed: Random seed — same seed, same data (random if None)
+            campaign_names: Optional names for the first campaigns of each account (others are generated)
+            account_ids: Optional account IDs (overrides n_accounts; default account_0001...)
+        """
+        if source not in _SOURCES:
+            raise ValueError(f"Unknown source '{source}', expected one of {sorted(_SOURCES)}")
+
+        self.source = source
+        self.config = _SOURCES[source]
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % 2**32)
+        accounts = list(account_ids or [f"account_{a + 1:04d}" for a in range(n_accounts)])
+        self.campaigns_per_account = campaigns_per_account
+        self.n_campaigns = len(accounts) * campaigns_per_account
+        # Identifies each account's random streams, whatever the other accounts generated
+        self._account_keys = [zlib.crc32(account.encode()) for account in accounts]
+
+        campaign_index = np.arange(self.n_campaigns)
+        account_index = campaign_index // campaigns_per_account
+        names = list(campaign_names or [])
+        prefix = self.config["campaign_prefix"]
+        if account_ids is None and n_accounts == 1:
+            self.campaign_ids = np.array([f"{prefix}_{i + 1:03d}" for i in campaign_index])
+        else:
+            # Numbered within each account, so an account's IDs don't depend on the others
+            self.campaign_ids = np.array([
+                f"{prefix}_{accounts[a]}_{i % campaigns_per_account + 1:03d}"
+                for a, i in zip(account_index, campaign_index)
+            ])
+        self.account_ids = np.array(accounts)[account_index]
+        position = campaign_index % campaigns_per_account
+        self.campaign_names = np.array([
+            names[p] if p < len(names) else f"Campaign {cid}" for p, cid in zip(position, self.campaign_ids)
+        ])
+
+        # Campaign-level parameters, fixed for the generator's lifetime, drawn per account
+        parameters = np.stack([self._campaign_parameters(key) for key in self._account_keys], axis=1)
+        self.daily_impressions, self.ctr, self.cpc, self.conversion_rate = parameters.reshape(4, -1)
+
+    def _campaign_parameters(self, account_key: int) -> np.ndarray:
+        """Draw the size, CTR, CPC and conversion rate of an account's campaigns, shape (4, campaigns)."""
+        rng = np.random.default_rng([self.seed, account_key])
+        size = self.campaigns_per_account
+        return np.array([
+            rng.lognormal(mean=9.5, sigma=1.0, size=size),
+            rng.beta(2.0, 120.0, size=size),
+            rng.lognormal(mean=0.0, sigma=0.5, size=size),
+            rng.beta(2.0, 40.0, size=size),
+        ])
+
+    def _generate_day(self, day: np.datetime64) -> dict[str, np.ndarray]:
+        """Draw the metrics of every campaign for one day, account by account."""
+        ordinal = int(day.astype("datetime64[D]").astype(np.int64))
+        blocks = [
+            self._generate_account_day(slice(a * self.campaigns_per_account, (a + 1) * self.campaigns_per_account),
+                                       np.random.default_rng([self.seed, key, ordinal]), ordinal)
+            for a, key in enumerate(self._account_keys)
+        ]
+        if len(blocks) == 1:
+            return blocks[0]
+        return {column: np.concatenate([block[column] for block in blocks]) for column in blocks[0]}
+
+    def _generate_account_day(self, campaigns: slice, rng: np.random.Generator,
+                              ordinal: int) -> dict[str, np.ndarray]:
+        """Draw the metrics of one account's campaigns for one day from that account-day's random stream."""
+        weekday = (ordinal + 3) % 7  # 1970-01-01 was a Thursday
+        size = self.campaigns_per_account
+
+        expected = self.daily_impressions[campaigns] * WEEKDAY_FACTORS[weekday]
+        impressions = rng.poisson(expected * rng.lognormal(0.0, 0.15, size))
+        clicks = rng.binomial(impressions, self.ctr[campaigns])
+        spend = np.round(clicks * self.cpc[campaigns] * rng.lognormal(0.0, 0.1, size), 2)
+        conversions = rng.binomial(clicks, self.conversion_rate[campaigns])
+
+        columns = {
+            "impressions": impressions,
+            "clicks": clicks,
+            "conversions": conversions,
+            self.config["spend_column"]: spend,
+        }
+        if self.source == "meta_ads":
+            likes = rng.binomial(impressions, 0.01)
+            columns["likes"] = likes
+            columns["comments"] = rng.binomial(likes, 0.08)
+            columns["shares"] = rng.binomial(likes, 0.04)
+        return columns
+
+    def iter_chunks(self, start_date: str, end_date: str,
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Generate the date range as columnar chunks of whole days.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            chunk_rows: Target rows per chunk (at least one full day per chunk)
+
+        Yields:
+            Dicts of NumPy arrays: date, account_id, campaign_id, campaign_name
+            and the source's metric columns
+        """
+        start = np.datetime64(datetime.strptime(start_date, "%Y-%m-%d").date(), "D")
+        end = np.datetime64(datetime.strptime(end_date, "%Y-%m-%d").date(), "D")
+        days = np.arange(start, end + 1)
+        days_per_chunk = max(1, chunk_rows // max(1, self.n_campaigns))
+
+        for offset in range(0, len(days), days_per_chunk):
+            chunk_days = days[offset:offset + days_per_chunk]
+            per_day = [self._generate_day(day) for day in chunk_days]
+
+            chunk = {
+                "date": np.repeat(chunk_days, self.n_campaigns),
+                "account_id": np.tile(self.account_ids, len(chunk_days)),
+                "campaign_id": np.tile(self.campaign_ids, len(chunk_days)),
+                "campaign_name": np.tile(self.campaign_names, len(chunk_days)),
+            }
+            for column in per_day[0]:
+                chunk[column] = np.concatenate([day[column] for day in per_day])
+            yield chunk
+
+    def generate(self, start_date: str, end_date: str) -> dict[str, np.ndarray]:
+        """
+        Generate the whole date range as a single columnar chunk.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            Dict of NumPy arrays (see iter_chunks)
+        """
+        chunks = list(self.iter_chunks(start_date, end_date, chunk_rows=2**62))
+        return chunks[0] if chunks else {}
+
+    def to_records(self, chunk: dict[str, np.ndarray]) -> list:
+        """
+        Convert a columnar chunk into typed campaign-daily records.
+
+        Args:
+            chunk: Chunk yielded by iter_chunks()
+
+        Returns:
+            List of GoogleAdsCampaignDaily or MetaAdsCampaignDaily records
+        """
+        record_class = self.config["record_class"]
+        columns = []
+        # Columns are passed positionally, in field order; fields the generator
+        # does not produce (ex: Meta video_views) are NULL
+        for name in record_class.__dataclass_fields__:
+            if name not in chunk:
+                columns.append(repeat(None))
+            elif name == "date":
+                columns.append(np.datetime_as_string(chunk["date"], unit="D").tolist())
+            else:
+                columns.append(chunk[name].tolist())
+        return list(starmap(record_class, zip(*columns)))
+
+    def iter_records(self, start_date: str, end_date: str,
+                     chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[list]:
+        """
+        Generate the date range as chunks of typed records.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            chunk_rows: Target rows per chunk
+
+        Yields:
+            Lists of typed campaign-daily records
+        """
+        for chunk in self.iter_chunks(start_date, end_date, chunk_rows):
+            yield self.to_records(chunk)
+
+
+def scale_from_env() -> dict[str, int | None]:
+    """
+    Scale of the fake APIs set by FAKE_ADS_ACCOUNTS, FAKE_ADS_CAMPAIGNS_PER_ACCOUNT and FAKE_ADS_SEED.
+
+    Returns:
+        n_accounts, campaigns_per_account and seed arguments of the fake APIs
+        (single account with the named campaigns by default)
+    """
+    return {
+        "n_accounts": int(os.getenv("FAKE_ADS_ACCOUNTS", "1")),
+        "campaigns_per_account": int(os.getenv("FAKE_ADS_CAMPAIGNS_PER_ACCOUNT", "0")) or None,
+        "seed": int(os.environ["FAKE_ADS_SEED"]) if os.getenv("FAKE_ADS_SEED") else None,
+    }
+
+
+class FakeAdsAPI:
+    """Fake ads API of one source, shared by the fake Google Ads and Meta Ads APIs."""
+
+    def __init__(self, source: str, campaigns: dict[str, str], n_accounts: int = 1,  # pylint: disable=too-many-arguments
+                 campaigns_per_account: int | None = None, seed: int | None = None):
+        """
+        Initialize with a set of fictional campaigns.
+
+        By default, a single account with the named campaigns. Set
+        `n_accounts` / `campaigns_per_account` to simulate production scale.
+
+        Args:
+            source: "google_ads" or "meta_ads"
+            campaigns: Named campaigns of each account (campaign ID -> name)
+            n_accounts: Number of ad accounts
+            campaigns_per_account: Campaigns per account (defaults to the named set)
+            seed: Random seed for reproducible data (random if None)
+        """
+        self.source = source
+        self.campaigns = campaigns
+        self.campaigns_per_account = campaigns_per_account or len(campaigns)
+        self._account_generators = {}
+        self.generator = CampaignDailyGenerator(
+            source,
+            n_accounts=n_accounts,
+            campaigns_per_account=self.campaigns_per_account,
+            seed=seed,
+            campaign_names=list(campaigns.values()),
+        )
+        # Fixed once, so the per-account generators draw the same streams as this one
+        self.seed = self.generator.seed
+
+    def get_campaign_daily_data(self, start_date: str, end_date: str) -> list:
+        """
+        Generate fake daily campaign data between two dates.
+
+        Returns one record per campaign per day with raw metrics only.
+        No derived KPIs — those are computed in dbt.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            List of daily campaign performance records (dict-like typed records)
+        """
+        return [
+            record
+            for chunk in self.generator.iter_records(start_date, end_date)
+            for record in chunk
+        ]
+
+    def iter_campaign_daily_data(self, start_date: str, end_date: str,
+                                 chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                                 account_id: str | None = None) -> Iterator[list]:
+        """
+        Generate fake daily campaign data in chunks of whole days.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            chunk_rows: Target number of records per chunk
+            account_id: Only generate this account's campaigns (default: every account)
+
+        Yields:
+            Lists of daily campaign performance records
+        """
+        generator = self.generator if account_id is None else self._account_generator(account_id)
+        yield from generator.iter_records(start_date, end_date, chunk_rows)
+
+    def list_accounts(self) -> list[str]:
+        """IDs of the simulated accounts (as discovered under a manager account)."""
+        return list(dict.fromkeys(self.generator.account_ids.tolist()))
+
+    def _account_generator(self, account_id: str) -> CampaignDailyGenerator:
+        """
+        Generator of a single account, so any account ID works.
+
+        Its rows match that account's rows in a multi-account generation with
+        the same seed (a single default account has the same metrics, under
+        un-prefixed campaign IDs).
+        """
+        if account_id not in self._account_generators:
+            self._account_generators[account_id] = CampaignDailyGenerator(
+                self.source,
+                campaigns_per_account=self.campaigns_per_account,
+                seed=self.seed,
+                campaign_names=list(self.campaigns.values()),
+                account_ids=[account_id],
+            )
+        return self._account_generators[account_id]
@@ -6,67 +6,47 @@ real Google Ads credentials. Only raw metrics are returned — KPI calculations
 (CTR, CPA, CPC, etc.) are handled downstream in dbt.
 """
 
-from datetime import datetime, timedelta
-import random
+from collections.abc import Iterator
 
+from fake_apis.generator import DEFAULT_CHUNK_ROWS, FakeAdsAPI, scale_from_env
+from ingestion.records import GoogleAdsCampaignDaily
 
-class FakeGoogleAdsAPI:  # pylint: disable=too-few-public-methods,duplicate-code
+# Named campaigns of each account (others are numbered)
+CAMPAIGNS = {
+    "campaign_001": "Summer Sale Campaign",
+    "campaign_002": "Black Friday Promotion",
+    "campaign_003": "Q1 Brand Awareness",
+    "campaign_004": "Product Launch",
+    "campaign_005": "Holiday Season",
+}
+
+
+class FakeGoogleAdsAPI(FakeAdsAPI):  # pylint: disable=too-few-public-methods
     """Simulates Google Ads API responses with randomly generated campaign data."""
 
-    def __init__(self):
-        """Initialize with a fixed set of fictional campaigns."""
-        self.campaigns = {
-            "campaign_001": "Summer Sale Campaign",
-            "campaign_002": "Black Friday Promotion",
-            "campaign_003": "Q1 Brand Awareness",
-            "campaign_004": "Product Launch",
-            "campaign_005": "Holiday Season",
-        }
-
-    def get_campaign_daily_data(self, start_date: str, end_date: str) -> list[dict]:
+    def __init__(self, n_accounts: int = 1, campaigns_per_account: int | None = None,
+                 seed: int | None = None):
         """
-        Generate fake daily campaign data between two dates.
-
-        Returns one record per campaign per day with raw metrics only.
-        No derived KPIs — those are computed in dbt.
+        Initialize with the named campaigns (see FakeAdsAPI).
 
         Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format (inclusive)
-
-        Returns:
-            List of daily campaign performance records
+            n_accounts: Number of ad accounts
+            campaigns_per_account: Campaigns per account (defaults to the named set)
+            seed: Random seed for reproducible data (random if None)
         """
-        data = []
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        current = start
-
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
-
-            for campaign_id, campaign_name in self.campaigns.items():
-                record = {
-                    "date": date_str,
-                    "campaign_id": campaign_id,
-                    "campaign_name": campaign_name,
-                    "impressions": random.randint(5000, 50000),
-                    "clicks": random.randint(50, 500),
-                    "conversions": random.randint(5, 50),
-                    "cost_usd": round(random.uniform(100, 1000), 2),
-                }
-                data.append(record)
+        super().__init__("google_ads", dict(CAMPAIGNS), n_accounts, campaigns_per_account, seed)
 
-            current += timedelta(days=1)
+    @classmethod
+    def from_env(cls) -> "FakeGoogleAdsAPI":
+        """Build the API at the scale set by the FAKE_ADS_* variables (see scale_from_env)."""
+        return cls(**scale_from_env())
 
-        return data
 
+# Singleton instance — scale and seed configurable for load tests
+google_ads_api = FakeGoogleAdsAPI.from_env()
 
-# Singleton instance
-google_ads_api = FakeGoogleAdsAPI()
 
-
-def get_campaign_daily(start_date: str, end_date: str) -> list[dict]:
+def get_campaign_daily(start_date: str, end_date: str) -> list[GoogleAdsCampaignDaily]:
     """
     Fetch daily campaign data from fake Google Ads API.
 
@@ -78,3 +58,31 @@ def get_campaign_daily(start_date: str, end_date: str) -> list[dict]:
         List of daily campaign performance records
     """
     return google_ads_api.get_campaign_daily_data(start_date, end_date)
+
+
+def iter_campaign_daily(start_date: str, end_date: str,
+                        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                        account_id: str | None = None) -> Iterator[list[GoogleAdsCampaignDaily]]:
+    """
+    Fetch daily campaign data from fake Google Ads API, in chunks of whole days.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        chunk_rows: Target number of records per chunk
+        account_id: Only fetch this account's campaigns (default: every account)
+
+    Yields:
+        Lists of daily campaign performance records
+    """
+    yield from google_ads_api.iter_campaign_daily_data(start_date, end_date, chunk_rows, account_id)
+
+
+def list_accounts() -> list[str]:
+    """
+    List the accounts of the fake API (FAKE_ADS_ACCOUNTS of them).
+
+    Returns:
+        Account IDs
+    """
+    return google_ads_api.list_accounts()
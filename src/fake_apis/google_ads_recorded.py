@@ -0,0 +1,189 @@
+"""
+Recorded-response stand-in for the Google Ads API client.
+
+Replays searchStream responses captured as REST JSON (the format returned by
+`googleAds:searchStream` and by `fake_apis.http_server`) through the same
+interface the connector uses on a real `GoogleAdsClient`:
+
+    client.get_service("GoogleAdsService").search_stream(customer_id=..., query=...)
+
+Streamed rows expose their fields as snake_case attributes, like the protobuf
+rows of the SDK (`row.metrics.cost_micros`). Metrics selected by a batch's
+`fieldMask` but absent from a row read as 0, the proto3 default (REST omits
+zero-valued metrics); any other missing field raises AttributeError.
+
+Lets the real-API extraction path run in tests and benchmarks without
+credentials or the google-ads package. RestGoogleAdsClient fetches the same
+JSON live from a REST searchStream endpoint instead — the google-ads SDK only
+speaks gRPC, so it is how the connector reaches `fake_apis.http_server`
+(GOOGLE_ADS_API_BASE_URL).
+"""
+
+import json
+import re
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+_CAMEL_CASE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _to_message(value: Any) -> Any:
+    """Recursively convert camelCase JSON objects into attribute messages."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{_CAMEL_CASE.sub("_", key).lower(): _to_message(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_to_message(item) for item in value]
+    return value
+
+
+def _to_batch(batch: dict) -> SimpleNamespace:
+    """Convert a searchStream batch, restoring the selected metrics the API left out as 0."""
+    zeros = {
+        path.removeprefix("metrics."): 0
+        for path in batch.get("fieldMask", "").split(",")
+        if path.startswith("metrics.")
+    }
+    if zeros:
+        results = [{**row, "metrics": {**zeros, **row.get("metrics", {})}} for row in batch.get("results", [])]
+        batch = {**batch, "results": results}
+    return _to_message(batch)
+
+
+class RecordedGoogleAdsService:  # pylint: disable=too-few-public-methods
+    """GoogleAdsService stand-in replaying recorded searchStream batches."""
+
+    def __init__(self, batches: list[dict]):
+        """
+        Args:
+            batches: Recorded searchStream response (list of {"results": [...]} batches)
+        """
+        # Converted once, so replays only cost what the consumer does with the rows
+        self.batches = [_to_batch(batch) for batch in batches]
+        self.requests = []
+
+    def search_stream(self, customer_id: str, query: str) -> Iterator[SimpleNamespace]:
+        """
+        Replay the recorded batches, whatever the query.
+
+        Args:
+            customer_id: Google Ads customer ID (recorded in `requests`)
+            query: GAQL query (recorded in `requests`)
+
+        Yields:
+            Batches with a `results` list of rows
+        """
+        self.requests.append({"customer_id": customer_id, "query": query})
+        yield from self.batches
+
+
+class RecordedGoogleAdsClient:  # pylint: disable=too-few-public-methods
+    """GoogleAdsClient stand-in serving a recorded searchStream response."""
+
+    def __init__(self, batches: list[dict]):
+        """
+        Args:
+            batches: Recorded searchStream response (list of {"results": [...]} batches)
+        """
+        self.service = RecordedGoogleAdsService(batches)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "RecordedGoogleAdsClient":
+        """
+        Load a recorded searchStream response from a JSON file.
+
+        Args:
+            path: JSON file holding the list of streamed batches
+
+        Returns:
+            Client replaying the recording
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def get_service(self, name: str) -> RecordedGoogleAdsService:
+        """
+        Get the recorded service.
+
+        Raises:
+            ValueError: For any service other than GoogleAdsService
+        """
+        if name != "GoogleAdsService":
+            raise ValueError(f"No recording for service '{name}'")
+        return self.service
+
+
+class ResourceExhausted(Exception):
+    """HTTP 429 from a REST searchStream endpoint (named after the google.api_core quota error)."""
+
+
+class RestGoogleAdsService:  # pylint: disable=too-few-public-methods
+    """GoogleAdsService stand-in calling a REST searchStream endpoint."""
+
+    def __init__(self, base_url: str, api_version: str = "v17"):
+        """
+        Args:
+            base_url: Root URL of the API (ex: http://127.0.0.1:8765)
+            api_version: Version segment of the request path
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_version = api_version
+
+    def search_stream(self, customer_id: str, query: str) -> Iterator[SimpleNamespace]:
+        """
+        POST the query to `customers/<id>/googleAds:searchStream` and yield its batches.
+
+        The request is sent on the first iteration, like the SDK stream.
+
+        Args:
+            customer_id: Google Ads customer ID
+            query: GAQL query
+
+        Yields:
+            Batches with a `results` list of rows
+
+        Raises:
+            ResourceExhausted: On HTTP 429
+            urllib.error.HTTPError: On other HTTP errors
+        """
+        request = urllib.request.Request(
+            f"{self.base_url}/{self.api_version}/customers/{customer_id}/googleAds:searchStream",
+            data=json.dumps({"query": query}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                batches = json.load(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                raise ResourceExhausted(e.read().decode("utf-8", "replace")) from e
+            raise
+        for batch in batches:
+            yield _to_batch(batch)
+
+
+class RestGoogleAdsClient:  # pylint: disable=too-few-public-methods
+    """GoogleAdsClient stand-in querying a REST searchStream endpoint."""
+
+    def __init__(self, base_url: str, api_version: str = "v17"):
+        """
+        Args:
+            base_url: Root URL of the API (ex: http://127.0.0.1:8765)
+            api_version: Version segment of the request path
+        """
+        self.service = RestGoogleAdsService(base_url, api_version)
+
+    def get_service(self, name: str) -> RestGoogleAdsService:
+        """
+        Get the REST service.
+
+        Raises:
+            ValueError: For any service other than GoogleAdsService
+        """
+        if name != "GoogleAdsService":
+            raise ValueError(f"No REST endpoint for service '{name}'")
+        return self.service
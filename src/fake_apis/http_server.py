@@ -0,0 +1,413 @@
+"""
+Local HTTP stand-in for the Meta and Google Ads APIs.
+
+The in-process fake APIs return data instantly; real runs are dominated by
+network behaviour instead: paging, throttling and slow responses. This server
+exposes the same generated data over HTTP with the response shapes of:
+
+- Meta Graph API insights:
+  GET /v<version>/act_<account_id>/insights?time_range=...&limit=...&after=...
+  → {"data": [...], "paging": {"cursors": {...}, "next": ...}}
+  with an `X-Business-Use-Case-Usage` header reporting quota usage
+- Google Ads REST searchStream:
+  POST /v<version>/customers/<customer_id>/googleAds:searchStream {"query": "..."}
+  → [{"results": [...], "fieldMask": ..., "requestId": ...}, ...]
+
+Latency, page size, error rate and the per-account rate limit are configurable.
+Over the limit, requests are rejected the way each API does it (Meta error
+code 80000, Google HTTP 429 RESOURCE_EXHAUSTED).
+
+The connectors are pointed at it with META_ADS_API_BASE_URL and
+GOOGLE_ADS_API_BASE_URL (real-API mode; Meta in sync insights mode, the
+server has no report runs).
+
+Usage:
+    python src/fake_apis/http_server.py --port 8765 --latency 0.2 --page-size 500 \\
+        --error-rate 0.01 --rate-limit 200
+"""
+
+import argparse
+import base64
+import json
+import logging
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+import zlib
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+if __name__ == "__main__":
+    # Allow running as a script: make src/ importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable=wrong-import-position
+from fake_apis.generator import CampaignDailyGenerator
+
+logger = logging.getLogger(__name__)
+
+_META_INSIGHTS = re.compile(r"^/v[\d.]+/(act_[^/]+)/insights$")
+_GOOGLE_SEARCH_STREAM = re.compile(r"^/v\d+/customers/(\d+)/googleAds:searchStream$")
+_GAQL_DATE_RANGE = re.compile(r"segments\.date\s+BETWEEN\s+'([\d-]+)'\s+AND\s+'([\d-]+)'", re.I)
+
+
+@dataclass
+class ServerConfig:  # pylint: disable=too-many-instance-attributes
+    """Behaviour of the fake ads HTTP server."""
+
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    page_size: int = 500
+    error_rate: float = 0.0
+    rate_limit_calls: int | None = None
+    rate_limit_window_seconds: float = 60.0
+    campaigns_per_account: int = 5
+    seed: int = 42
+
+
+class _RateLimiter:  # pylint: disable=too-few-public-methods
+    """Sliding-window call counter per account."""
+
+    def __init__(self, limit: int | None, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.calls = defaultdict(deque)
+        self.lock = threading.Lock()
+
+    def hit(self, account: str) -> tuple[bool, float, float]:
+        """
+        Record a call for an account.
+
+        Returns:
+            (allowed, usage percent of the window budget, seconds until a slot frees up)
+        """
+        if self.limit is None:
+            return True, 0.0, 0.0
+
+        now = time.monotonic()
+        with self.lock:
+            calls = self.calls[account]
+            while calls and now - calls[0] > self.window_seconds:
+                calls.popleft()
+            allowed = len(calls) < self.limit
+            if allowed:
+                calls.append(now)
+            usage = min(100.0, len(calls) / self.limit * 100)
+            retry_after = self.window_seconds - (now - calls[0]) if calls else 0.0
+        return allowed, usage, max(0.0, retry_after)
+
+
+class FakeAdsHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server serving generated ads data with injected latency and errors."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: ServerConfig | None = None):
+        """
+        Args:
+            address: (host, port) to bind — port 0 picks a free port
+            config: Server behaviour (defaults: no latency, no errors, no rate limit)
+        """
+        super().__init__(address, _Handler)
+        self.config = config or ServerConfig()
+        self.rate_limiter = _RateLimiter(self.config.rate_limit_calls,
+                                         self.config.rate_limit_window_seconds)
+        self.random = random.Random(self.config.seed)
+        self.stats = defaultdict(int)
+        self.stats_lock = threading.Lock()
+        self._rows_cache = {}
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server (ex: http://127.0.0.1:8765)."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str) -> None:
+        """Increment a request counter (requests, errors, throttled...)."""
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def campaign_rows(self, source: str, account: str, since: str, until: str) -> list:
+        """Generated records for an account and date range (cached across pages)."""
+        key = (source, account, since, until)
+        with self.stats_lock:
+            if key in self._rows_cache:
+                return self._rows_cache[key]
+
+        generator = CampaignDailyGenerator(
+            source,
+            campaigns_per_account=self.config.campaigns_per_account,
+            seed=self.config.seed,
+            account_ids=[account],
+        )
+        rows = [record for chunk in generator.iter_records(since, until) for record in chunk]
+        with self.stats_lock:
+            self._rows_cache[key] = rows
+        return rows
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes Meta insights and Google Ads searchStream requests."""
+
+    server: FakeAdsHTTPServer
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Meta insights endpoint."""
+        url = urlparse(self.path)
+        match = _META_INSIGHTS.match(url.path)
+        if not match:
+            self._send_json(404, {"error": {"message": f"Unknown path {url.path}", "code": 803}})
+            return
+        self._handle_meta_insights(match.group(1), url)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Google Ads searchStream endpoint."""
+        url = urlparse(self.path)
+        match = _GOOGLE_SEARCH_STREAM.match(url.path)
+        if not match:
+            self._send_json(404, {"error": {"code": 404, "status": "NOT_FOUND"}})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._handle_google_search_stream(match.group(1), body.get("query", ""))
+
+    def _simulate_network(self) -> bool:
+        """Apply latency, then decide whether to inject a server error."""
+        config = self.server.config
+        self.server.count("requests")
+        delay = config.latency_seconds + self.server.random.uniform(0, config.latency_jitter_seconds)
+        if delay > 0:
+            time.sleep(delay)
+        if self.server.random.random() < config.error_rate:
+            self.server.count("errors")
+            return True
+        return False
+
+    def _handle_meta_insights(self, account: str, url) -> None:
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        failed = self._simulate_network()
+        allowed, usage, retry_after = self.server.rate_limiter.hit(account)
+        headers = {"X-Business-Use-Case-Usage": json.dumps(_meta_usage(account, usage, allowed, retry_after))}
+
+        if not allowed:
+            self.server.count("throttled")
+            self._send_json(400, {"error": {
+                "message": "(#80000) There have been too many calls from this ad-account.",
+                "type": "OAuthException", "code": 80000, "error_subcode": 2446079,
+            }}, headers)
+            return
+        if failed:
+            self._send_json(500, {"error": {
+                "message": "An unexpected error has occurred. Please retry your request later.",
+                "type": "OAuthException", "code": 2, "is_transient": True,
+            }}, headers)
+            return
+        self._send_json(200, self._meta_insights_page(account, url.path, params), headers)
+
+    def _meta_insights_page(self, account: str, path: str, params: dict) -> dict:
+        """Insights page selected by the `limit` and `after` cursor parameters."""
+        time_range = json.loads(params.get("time_range", "{}"))
+        rows = self.server.campaign_rows("meta_ads", account, time_range["since"], time_range["until"])
+        limit = min(int(params.get("limit", self.server.config.page_size)), self.server.config.page_size)
+        offset = _decode_cursor(params.get("after"))
+        page = rows[offset:offset + limit]
+
+        paging = {"cursors": {"before": _encode_cursor(offset), "after": _encode_cursor(offset + len(page))}}
+        if offset + len(page) < len(rows):
+            next_params = {**params, "after": paging["cursors"]["after"]}
+            paging["next"] = f"{self.server.base_url}{path}?{urlencode(next_params)}"
+        return {"data": [_meta_row(account.removeprefix("act_"), row) for row in page], "paging": paging}
+
+    def _handle_google_search_stream(self, customer_id: str, query: str) -> None:
+        failed = self._simulate_network()
+        allowed, _, retry_after = self.server.rate_limiter.hit(customer_id)
+        if not allowed:
+            self.server.count("throttled")
+            self._send_json(429, {"error": {
+                "code": 429, "message": "Resource has been exhausted (e.g. check quota).",
+                "status": "RESOURCE_EXHAUSTED",
+            }}, {"Retry-After": str(max(1, round(retry_after)))})
+            return
+        if failed:
+            self._send_json(503, {"error": {
+                "code": 503, "message": "The service is currently unavailable.", "status": "UNAVAILABLE",
+            }})
+            return
+
+        match = _GAQL_DATE_RANGE.search(query)
+        if not match:
+            self._send_json(400, {"error": {
+                "code": 400, "message": "Query must filter on segments.date BETWEEN", "status": "INVALID_ARGUMENT",
+            }})
+            return
+
+        rows = self.server.campaign_rows("google_ads", customer_id, *match.groups())
+        self._send_json(200, google_search_stream_batches(customer_id, rows, self.server.config.page_size))
+
+    def _send_json(self, status: int, payload, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> int:
+    return int(base64.urlsafe_b64decode(cursor.encode()).decode()) if cursor else 0
+
+
+def _meta_usage(account: str, usage: float, allowed: bool, retry_after: float) -> dict:
+    """X-Business-Use-Case-Usage header value of an ad account."""
+    return {
+        account.removeprefix("act_"): [{
+            "type": "ads_insights",
+            "call_count": round(usage),
+            "total_cputime": round(usage * 0.6),
+            "total_time": round(usage * 0.8),
+            "estimated_time_to_regain_access": 0 if allowed else max(1, round(retry_after / 60)),
+        }]
+    }
+
+
+def _meta_row(account_id: str, record) -> dict:
+    """Shape a generated record like a Meta insights row (metrics as strings)."""
+    return {
+        "account_id": account_id,
+        "date_start": record.date,
+        "date_stop": record.date,
+        "campaign_id": record.campaign_id,
+        "campaign_name": record.campaign_name,
+        "impressions": str(record.impressions),
+        "clicks": str(record.clicks),
+        "spend": f"{record.spend_usd:.2f}",
+        "actions": [
+            {"action_type": "post_reaction", "value": str(record.likes)},
+            {"action_type": "comment", "value": str(record.comments)},
+            {"action_type": "post", "value": str(record.shares)},
+        ],
+    }
+
+
+def _google_row(customer_id: str, record) -> dict:
+    """Shape a generated record like a Google Ads searchStream row (REST JSON)."""
+    campaign_id = str(zlib.crc32(record.campaign_id.encode()))
+    return {
+        "customer": {"resourceName": f"customers/{customer_id}", "id": customer_id},
+        "campaign": {
+            "resourceName": f"customers/{customer_id}/campaigns/{campaign_id}",
+            "id": campaign_id,
+            "name": record.campaign_name,
+        },
+        "segments": {"date": record.date},
+        "metrics": {
+            "impressions": str(record.impressions),
+            "clicks": str(record.clicks),
+            "conversions": float(record.conversions),
+            "costMicros": str(round(record.cost_usd * 1_000_000)),
+        },
+    }
+
+
+def google_search_stream_batches(customer_id: str, records: list, batch_size: int) -> list[dict]:
+    """
+    Shape generated Google Ads records like a searchStream REST response.
+
+    Args:
+        customer_id: Google Ads customer ID (digits only)
+        records: GoogleAdsCampaignDaily records
+        batch_size: Rows per streamed batch
+
+    Returns:
+        List of {"results", "fieldMask", "requestId"} batches
+    """
+    request_id = uuid.uuid4().hex
+    return [
+        {
+            "results": [_google_row(customer_id, record) for record in records[offset:offset + batch_size]],
+            "fieldMask": "campaign.id,campaign.name,segments.date,metrics.impressions,"
+                         "metrics.clicks,metrics.conversions,metrics.costMicros",
+            "requestId": request_id,
+        }
+        for offset in range(0, len(records), batch_size)
+    ]
+
+
+@contextmanager
+def serve_in_background(config: ServerConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+    """
+    Run the fake ads server on a background thread for the duration of a block.
+
+    Args:
+        config: Server behaviour
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Yields:
+        The running FakeAdsHTTPServer (see its base_url and stats)
+    """
+    server = FakeAdsHTTPServer((host, port), config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve fake Meta / Google Ads API responses over HTTP")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fixed latency per request (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency (s)")
+    parser.add_argument("--page-size", type=int, default=500, help="Rows per page / stream batch")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing (0-1)")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Calls per account per window")
+    parser.add_argument("--rate-window", type=float, default=60.0, help="Rate limit window (s)")
+    parser.add_argument("--campaigns", type=int, default=5, help="Campaigns per account")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    config = ServerConfig(
+        latency_seconds=args.latency,
+        latency_jitter_seconds=args.jitter,
+        page_size=args.page_size,
+        error_rate=args.error_rate,
+        rate_limit_calls=args.rate_limit,
+        rate_limit_window_seconds=args.rate_window,
+        campaigns_per_account=args.campaigns,
+        seed=args.seed,
+    )
+    server = FakeAdsHTTPServer((args.host, args.port), config)
+    logger.info("Fake ads API listening on %s", server.base_url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,74 +4,52 @@ Fake Meta Ads API for development and testing.
 Generates realistic daily campaign performance data without requiring
 real Meta Ads credentials. Only raw metrics are returned — KPI calculations
 (CTR, CPA, CPC, etc.) are handled downstream in dbt.
+
+Meta-specific engagement metrics (likes, comments, shares) are included as
+raw signals, not computed ratios.
 """
 
-from datetime import datetime, timedelta
-import random
+from collections.abc import Iterator
+
+from fake_apis.generator import DEFAULT_CHUNK_ROWS, FakeAdsAPI, scale_from_env
+from ingestion.records import MetaAdsCampaignDaily
+
+# Named campaigns of each account (others are numbered)
+CAMPAIGNS = {
+    "fb_campaign_001": "Facebook - Product Showcase",
+    "fb_campaign_002": "Instagram - Influencer Partnership",
+    "fb_campaign_003": "Facebook - Retargeting",
+    "fb_campaign_004": "Instagram - Story Ads",
+    "fb_campaign_005": "Facebook - Lead Generation",
+}
 
 
-class FakeMetaAdsAPI:  # pylint: disable=too-few-public-methods,duplicate-code
+class FakeMetaAdsAPI(FakeAdsAPI):  # pylint: disable=too-few-public-methods
     """Simulates Meta Ads API (Facebook/Instagram) responses with generated campaign data."""
 
-    def __init__(self):
-        """Initialize with a fixed set of fictional campaigns."""
-        self.campaigns = {
-            "fb_campaign_001": "Facebook - Product Showcase",
-            "fb_campaign_002": "Instagram - Influencer Partnership",
-            "fb_campaign_003": "Facebook - Retargeting",
-            "fb_campaign_004": "Instagram - Story Ads",
-            "fb_campaign_005": "Facebook - Lead Generation",
-        }
-
-    def get_campaign_daily_data(self, start_date: str, end_date: str) -> list[dict]:
+    def __init__(self, n_accounts: int = 1, campaigns_per_account: int | None = None,
+                 seed: int | None = None):
         """
-        Generate fake daily campaign data between two dates.
-
-        Returns one record per campaign per day with raw metrics only.
-        No derived KPIs — those are computed in dbt.
-        Meta-specific engagement metrics (likes, comments, shares) are included
-        as raw signals, not computed ratios.
+        Initialize with the named campaigns (see FakeAdsAPI).
 
         Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format (inclusive)
-
-        Returns:
-            List of daily campaign performance records
+            n_accounts: Number of ad accounts
+            campaigns_per_account: Campaigns per account (defaults to the named set)
+            seed: Random seed for reproducible data (random if None)
         """
-        data = []
-        start = datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.strptime(end_date, "%Y-%m-%d")
-        current = start
-
-        while current <= end:
-            date_str = current.strftime("%Y-%m-%d")
+        super().__init__("meta_ads", dict(CAMPAIGNS), n_accounts, campaigns_per_account, seed)
 
-            for campaign_id, campaign_name in self.campaigns.items():
-                record = {
-                    "date": date_str,
-                    "campaign_id": campaign_id,
-                    "campaign_name": campaign_name,
-                    "impressions": random.randint(10000, 100000),
-                    "clicks": random.randint(100, 1000),
-                    "conversions": random.randint(10, 100),
-                    "spend_usd": round(random.uniform(500, 5000), 2),
-                    "likes": random.randint(200, 2000),
-                    "comments": random.randint(10, 200),
-                    "shares": random.randint(5, 100),
-                }
-                data.append(record)
+    @classmethod
+    def from_env(cls) -> "FakeMetaAdsAPI":
+        """Build the API at the scale set by the FAKE_ADS_* variables (see scale_from_env)."""
+        return cls(**scale_from_env())
 
-            current += timedelta(days=1)
 
-        return data
+# Singleton instance — scale and seed configurable for load tests
+meta_ads_api = FakeMetaAdsAPI.from_env()
 
 
-# Singleton instance
-meta_ads_api = FakeMetaAdsAPI()
-
-
-def get_campaign_daily(start_date: str, end_date: str) -> list[dict]:
+def get_campaign_daily(start_date: str, end_date: str) -> list[MetaAdsCampaignDaily]:
     """
     Fetch daily campaign data from fake Meta Ads API.
 
@@ -83,3 +61,31 @@ def get_campaign_daily(start_date: str, end_date: str) -> list[dict]:
         List of daily campaign performance records
     """
     return meta_ads_api.get_campaign_daily_data(start_date, end_date)
+
+
+def iter_campaign_daily(start_date: str, end_date: str,
+                        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                        account_id: str | None = None) -> Iterator[list[MetaAdsCampaignDaily]]:
+    """
+    Fetch daily campaign data from fake Meta Ads API, in chunks of whole days.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        chunk_rows: Target number of records per chunk
+        account_id: Only fetch this account's campaigns (default: every account)
+
+    Yields:
+        Lists of daily campaign performance records
+    """
+    yield from meta_ads_api.iter_campaign_daily_data(start_date, end_date, chunk_rows, account_id)
+
+
+def list_accounts() -> list[str]:
+    """
+    List the accounts of the fake API (FAKE_ADS_ACCOUNTS of them).
+
+    Returns:
+        Account IDs
+    """
+    return meta_ads_api.list_accounts()
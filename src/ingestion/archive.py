@@ -0,0 +1,180 @@
+"""
+Archive of extracted payloads, to rebuild the raw tables without calling the APIs.
+
+Every range a connector extracts from a source is also written to the archive,
+one gzip-compressed JSON Lines file per (source, date, account), under a
+date-partitioned layout:
+
+    <root>/<source>/date=YYYY-MM-DD/account=<account>/<timestamp>-<id>.jsonl.gz
+
+The rows are archived as the connector extracted them: before coercion,
+fingerprints and run metadata, so a change of schema or load logic can be
+replayed over the whole history (see `DataSourceConnector.run_replay()`).
+When a date is extracted again, the newest file of each (date, account) wins.
+
+The archive root is a local directory or a GCS URI (gs://bucket/prefix, needs
+google-cloud-storage), set by RAW_ARCHIVE_URI (see `PayloadArchive.from_env()`).
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+import gzip
+import json
+import logging
+import os
+import tempfile
+import uuid
+
+from ingestion.watermarks import DEFAULT_ACCOUNT
+
+try:
+    from google.cloud import storage  # pylint: disable=no-name-in-module
+    GCS_AVAILABLE = True
+except ImportError:
+    GCS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _LocalStore:
+    """Archive files in a local directory."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def write(self, name: str, data: bytes) -> None:
+        """Write a file atomically."""
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def read(self, name: str) -> bytes:
+        """Content of a file."""
+        return (self.root / name).read_bytes()
+
+    def list(self, prefix: str) -> list[str]:
+        """Names of the files under a prefix (a directory)."""
+        base = self.root / prefix
+        if not base.exists():
+            return []
+        return [path.relative_to(self.root).as_posix() for path in base.rglob("*.jsonl.gz")]
+
+
+class _GcsStore:
+    """Archive files in a GCS bucket, under an optional prefix."""
+
+    def __init__(self, uri: str):
+        if not GCS_AVAILABLE:
+            raise ImportError("google-cloud-storage is required for a gs:// archive")
+        bucket, _, prefix = uri.removeprefix("gs://").partition("/")
+        self.bucket = storage.Client().bucket(bucket)
+        self.prefix = f"{prefix.strip('/')}/" if prefix.strip("/") else ""
+
+    def write(self, name: str, data: bytes) -> None:
+        """Upload a file (GCS writes are atomic)."""
+        self.bucket.blob(self.prefix + name).upload_from_string(data, content_type="application/gzip")
+
+    def read(self, name: str) -> bytes:
+        """Content of a file."""
+        return self.bucket.blob(self.prefix + name).download_as_bytes()
+
+    def list(self, prefix: str) -> list[str]:
+        """Names of the files under a prefix."""
+        blobs = self.bucket.client.list_blobs(self.bucket, prefix=self.prefix + prefix)
+        return [blob.name[len(self.prefix):] for blob in blobs if blob.name.endswith(".jsonl.gz")]
+
+
+class PayloadArchive:
+    """Date-partitioned archive of extracted rows, per source and account."""
+
+    def __init__(self, uri: str | Path):
+        """
+        Args:
+            uri: Local directory, or gs://bucket/prefix
+
+        Raises:
+            ImportError: If uri is a GCS URI and google-cloud-storage is not installed
+        """
+        self.uri = str(uri)
+        self._store = _GcsStore(self.uri) if self.uri.startswith("gs://") else _LocalStore(self.uri)
+
+    @classmethod
+    def from_env(cls) -> "PayloadArchive | None":
+        """
+        Build the archive configured by RAW_ARCHIVE_URI.
+
+        Returns:
+            Archive, or None when RAW_ARCHIVE_URI is not set
+        """
+        uri = os.getenv("RAW_ARCHIVE_URI")
+        return cls(uri) if uri else None
+
+    def write(self, source: str, account: str | None, rows_by_day: dict[str, list[dict]]) -> int:
+        """
+        Archive the rows of an extracted range, one file per date.
+
+        Dates without rows are archived too (empty files), so that they
+        supersede older extractions of the same date.
+
+        Args:
+            source: Source name
+            account: Account ID (None: the connector's default account)
+            rows_by_day: {date (YYYY-MM-DD): rows extracted for that date}
+
+        Returns:
+            Number of files written
+        """
+        # Sortable name: the newest extraction of a date comes last
+        name = f"{datetime.now(tz=timezone.utc).strftime('%Y%m%dT%H%M%S%fZ')}-{uuid.uuid4().hex[:8]}.jsonl.gz"
+        for day, rows in rows_by_day.items():
+            payload = "".join(json.dumps(dict(row), separators=(",", ":"), default=str) + "\n" for row in rows)
+            self._store.write(f"{self._prefix(source, day)}account={account or DEFAULT_ACCOUNT}/{name}",
+                              gzip.compress(payload.encode(), compresslevel=6))
+        return len(rows_by_day)
+
+    def latest_files(self, source: str, days: Iterable[str],
+                     accounts: Iterable[str] | None = None) -> dict[str, list[str]]:
+        """
+        Newest archived file of each (date, account).
+
+        Args:
+            source: Source name
+            days: Dates in YYYY-MM-DD format
+            accounts: Only these accounts (default: every archived account)
+
+        Returns:
+            {date: file names, one per account}, for the dates that were archived
+        """
+        wanted = None if accounts is None else {account or DEFAULT_ACCOUNT for account in accounts}
+        files = {}
+        for day in days:
+            latest = {}
+            for name in self._store.list(self._prefix(source, day)):
+                account = name.split("/")[-2].removeprefix("account=")
+                if wanted is not None and account not in wanted:
+                    continue
+                latest[account] = max(latest.get(account, name), name)
+            if latest:
+                files[day] = [latest[account] for account in sorted(latest)]
+        return files
+
+    def read(self, name: str) -> list[dict]:
+        """
+        Rows of an archived file.
+
+        Args:
+            name: File name (see latest_files)
+
+        Returns:
+            Rows, as plain dictionaries
+        """
+        return [json.loads(line) for line in gzip.decompress(self._store.read(name)).splitlines() if line]
+
+    @staticmethod
+    def _prefix(source: str, day: str) -> str:
+        """Directory of a source's date partition."""
+        return f"{source}/date={day}/"
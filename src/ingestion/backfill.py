@@ -0,0 +1,240 @@
+"""
+Gap-aware backfill planning for the raw tables.
+
+Instead of re-ingesting a fixed period, the planner reads the partition
+metadata of a raw table (INFORMATION_SCHEMA.PARTITIONS: row count and last
+load time per date — no table scan) and only schedules the dates that need it:
+
+- missing: no partition, or an empty one
+- stale: the partition was last loaded before the date's late-data window
+  closed (less than `late_days` after the date), so late corrections may be
+  missing from it — unless a later re-pull found it identical to the source
+  and left it as is (see the `partition_checks` table, ingestion.fingerprints)
+
+Those dates are merged into contiguous ranges, each extracted by one
+connector run, and the plan estimates the number of API calls the
+extraction will take.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any
+import logging
+import math
+
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion.base import LATE_DATA_DAYS, DataSourceConnector, iter_days, merge_ranges, split_date_range
+from ingestion.checkpoints import CheckpointStore
+from ingestion.fingerprints import fetch_partition_checks
+
+logger = logging.getLogger(__name__)
+
+PARTITIONS_QUERY = """
+    SELECT partition_id, total_rows, last_modified_time
+    FROM `{project}.{dataset}.INFORMATION_SCHEMA.PARTITIONS`
+    WHERE table_name = @table_name
+      AND partition_id NOT IN ('__NULL__', '__UNPARTITIONED__')
+"""
+
+
+@dataclass
+class PartitionInfo:
+    """Metadata of one date partition of a raw table."""
+
+    total_rows: int
+    last_modified: datetime
+
+
+@dataclass
+class BackfillPlan:  # pylint: disable=too-many-instance-attributes
+    """Dates of a source to (re)load, as contiguous extraction ranges."""
+
+    source: str
+    table_id: str
+    start_date: str
+    end_date: str
+    missing_dates: list[str] = field(default_factory=list)
+    stale_dates: list[str] = field(default_factory=list)
+    ranges: list[tuple[str, str]] = field(default_factory=list)
+    accounts: int = 1
+    windows: int = 0
+    estimated_api_calls: int = 0
+
+    @property
+    def dates(self) -> int:
+        """Number of dates to load."""
+        return len(self.missing_dates) + len(self.stale_dates)
+
+    def describe(self) -> str:
+        """Human-readable plan, as printed by the dry run."""
+        lines = [
+            f"{self.source} ({self.table_id}) — {self.start_date} -> {self.end_date}",
+            f"  Missing dates        : {len(self.missing_dates)}",
+            f"  Stale dates          : {len(self.stale_dates)}",
+            f"  Ranges               : {len(self.ranges)}",
+        ]
+        lines += [f"    {start} -> {end}" for start, end in self.ranges]
+        lines += [
+            f"  Windows x accounts   : {self.windows} x {self.accounts}",
+            f"  Estimated API calls  : {self.estimated_api_calls}",
+        ]
+        return "\n".join(lines)
+
+
+def fetch_partitions(client: bigquery.Client, project_id: str, dataset_id: str,
+                     table_name: str) -> dict[str, PartitionInfo]:
+    """
+    Read the partition metadata of a date-partitioned table.
+
+    Args:
+        client: BigQuery client
+        project_id: GCP project of the table
+        dataset_id: Dataset of the table (ex: "mdp_raw")
+        table_name: Table name (ex: "meta_ads_campaign_daily")
+
+    Returns:
+        {date (YYYY-MM-DD): PartitionInfo}
+    """
+    query = PARTITIONS_QUERY.format(project=project_id, dataset=dataset_id)
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("table_name", "STRING", table_name)]
+    )
+    partitions = {}
+    for row in client.query(query, job_config=job_config).result():
+        day = datetime.strptime(row["partition_id"], "%Y%m%d").date().isoformat()
+        partitions[day] = PartitionInfo(int(row["total_rows"] or 0), row["last_modified_time"])
+    return partitions
+
+
+def _as_utc(moment: datetime) -> datetime:
+    """Naive times are UTC."""
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+def find_gaps(partitions: dict[str, PartitionInfo], start_date: str, end_date: str,
+              late_days: int = LATE_DATA_DAYS,
+              checks: dict[str, datetime] | None = None) -> tuple[list[str], list[str]]:
+    """
+    Find the dates of a range that are missing or stale.
+
+    A date is stale when its partition was last loaded — or last verified
+    unchanged, see `checks` — less than `late_days` days after the date: the
+    source could still correct it afterwards.
+
+    Args:
+        partitions: Partition metadata (see fetch_partitions)
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        late_days: Days after which a date's data no longer changes at the source
+        checks: Last time each date's partition was found identical to the
+            source (see ingestion.fingerprints.fetch_partition_checks)
+
+    Returns:
+        (missing dates, stale dates), in chronological order
+    """
+    missing, stale = [], []
+    for day in iter_days(start_date, end_date):
+        partition = partitions.get(day)
+        if partition is None or partition.total_rows == 0:
+            missing.append(day)
+            continue
+        settled_at = datetime.combine(date.fromisoformat(day) + timedelta(days=late_days), time(),
+                                      tzinfo=timezone.utc)
+        last_modified = _as_utc(partition.last_modified)
+        if checks and day in checks:
+            last_modified = max(last_modified, _as_utc(checks[day]))
+        if last_modified < settled_at:
+            stale.append(day)
+    return missing, stale
+
+
+def estimate_api_calls(ranges: list[tuple[str, str]], window_days: int, accounts: int = 1,
+                       rows_per_account_day: float = 0.0, page_size: int | None = None) -> tuple[int, int]:
+    """
+    Estimate the API calls needed to extract some date ranges.
+
+    Each (account, window) task makes one request, plus one per extra page
+    when the API pages its results (`page_size`).
+
+    Args:
+        ranges: Inclusive (start_date, end_date) ranges
+        window_days: Days per extraction window
+        accounts: Number of accounts extracted
+        rows_per_account_day: Average rows per account and date (0 if unknown)
+        page_size: Rows per API page (None: one call per window, ex: a stream)
+
+    Returns:
+        (number of windows, estimated API calls)
+    """
+    windows = [window for start, end in ranges for window in split_date_range(start, end, window_days)]
+    calls = 0
+    for start, end in windows:
+        days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
+        pages = math.ceil(rows_per_account_day * days / page_size) if page_size else 1
+        calls += accounts * max(1, pages)
+    return len(windows), calls
+
+
+def _rows_per_account_day(partitions: dict[str, PartitionInfo], accounts: int) -> float:
+    """Average rows of a loaded partition per account (0 when nothing is loaded)."""
+    loaded = [p.total_rows for p in partitions.values() if p.total_rows]
+    return sum(loaded) / len(loaded) / accounts if loaded else 0.0
+
+
+def plan_backfill(connector: DataSourceConnector, start_date: str, end_date: str, *,  # pylint: disable=too-many-arguments
+                  late_days: int = LATE_DATA_DAYS,
+                  partitions: dict[str, PartitionInfo] | None = None,
+                  checks: dict[str, datetime] | None = None) -> BackfillPlan:
+    """
+    Plan the loads needed to make a source's raw table complete over a range.
+
+    Args:
+        connector: Connector of the source (its raw table, windows and accounts)
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        late_days: Late-data window, in days
+        partitions: Partition metadata (default: read from BigQuery)
+        checks: Unchanged-partition checks (default: read from BigQuery along
+            with the partitions, none when partitions are given)
+
+    Returns:
+        Backfill plan (empty ranges when the table is up to date)
+    """
+    if partitions is None:
+        client = connector.get_bigquery_client()
+        partitions = fetch_partitions(client, connector.project_id, connector.dataset_id, connector.raw_table_name)
+        if checks is None:
+            checks = fetch_partition_checks(client, f"{connector.project_id}.{connector.dataset_id}",
+                                            connector.raw_table_name)
+
+    missing, stale = find_gaps(partitions, start_date, end_date, late_days, checks)
+    accounts = len(connector.resolve_accounts())
+    ranges = merge_ranges(missing + stale)
+    windows, calls = estimate_api_calls(ranges, connector.window_days, accounts,
+                                        _rows_per_account_day(partitions, accounts), connector.api_page_size)
+    plan = BackfillPlan(connector.source_name, connector.raw_table_id, start_date, end_date,
+                        missing, stale, ranges, accounts, windows, calls)
+    logger.info("Backfill plan for %s: %d missing and %d stale dates in %d ranges (~%d API calls)",
+                plan.source, len(missing), len(stale), len(ranges), calls)
+    return plan
+
+
+def run_backfill(connector: DataSourceConnector, plan: BackfillPlan,
+                 checkpoints: CheckpointStore | None = None, **run_kwargs: Any) -> list[dict[str, Any]]:
+    """
+    Load the ranges of a plan, one streaming run per range.
+
+    Args:
+        connector: Connector the plan was made for
+        plan: Backfill plan (see plan_backfill)
+        checkpoints: Checkpoint store, so an interrupted range resumes on the next run
+        **run_kwargs: Forwarded to run_streaming() (batch_size, max_workers...)
+
+    Returns:
+        Stats of each run, in range order
+    """
+    results = []
+    for start, end in plan.ranges:
+        logger.info("Backfilling %s from %s to %s", plan.source, start, end)
+        results.append(connector.run_streaming(start, end, checkpoints=checkpoints, **run_kwargs))
+    return results
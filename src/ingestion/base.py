@@ -5,40 +5,172 @@ Defines the common contract for all data sources (Google Ads, Meta Ads, etc.).
 Subclasses must implement extract() — all other steps (metadata enrichment,
 BigQuery write) are handled here and reused across every connector.
 Each run generates a unique extract_run_id for full traceability in the raw zone.
+
+The run modes (run(), run_streaming(), run_pipelined(), run_incremental() and
+run_replay()) drive these steps, see ingestion.run_modes.
+
+Run metadata is never copied into the rows: it travels next to each batch as an
+envelope and is only materialized at serialization time (a constant Parquet
+column, or merged into each JSON line as it is written).
+
+All modes split the date range into windows of `window_days` days, extracted
+concurrently on a pool of at most `max_workers` threads (see ingestion.windowing
+and ingestion.concurrency). Each window is staged in BigQuery as soon as its
+extraction finishes, and the run's staged rows replace the stored ones in one
+transaction when it completes (see write_to_bigquery()).
+
+A connector can cover several ad accounts: every (account, window) pair is a
+task on the same pool, largest accounts first, and a failing account is
+reported without stopping the others (see `account_report`).
+
+With API_CACHE_DIR set, extracted rows are kept in a local response cache and
+dates already cached are not requested again (see ingestion.response_cache).
+
+With RAW_ARCHIVE_URI set, every extracted range is also archived, and
+run_replay() rebuilds the raw table from the archive without calling the API
+(see ingestion.archive).
 """
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
+from typing import Any
+import io
 import uuid
 import logging
 import os
 from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion import bigquery_clients, staging
+from ingestion.archive import PayloadArchive
+from ingestion.checkpoints import RunCheckpoint
+from ingestion.columnar import PYARROW_AVAILABLE, to_parquet_bytes, to_record_batch
+from ingestion.concurrency import DEFAULT_API_MAX_CONCURRENCY, ConcurrencyController, run_concurrently
+from ingestion.fingerprints import (
+    FINGERPRINT_COLUMN,
+    fetch_partition_digests,
+    fingerprint_columns,
+    partition_digest,
+    record_partition_checks,
+    row_fingerprint,
+)
+from ingestion.records import EnrichedRows
+from ingestion.response_cache import ResponseCache
+from ingestion.run_modes import RunModesMixin
+from ingestion.schemas import METADATA_FIELDS, coerce_rows, get_raw_schema
+from ingestion.watermarks import DEFAULT_ACCOUNT
+from ingestion.windowing import LATE_DATA_DAYS, ExtractTask, iter_days, merge_ranges, split_date_range
 
 logger = logging.getLogger(__name__)
 
+# Default extraction sharding — overridden per connector and by <SOURCE>_WINDOW_DAYS
+# / <SOURCE>_MAX_WORKERS environment variables (ex: META_ADS_MAX_WORKERS=2)
+DEFAULT_WINDOW_DAYS = 31
+DEFAULT_MAX_WORKERS = 4
+
+# Number of partition load jobs submitted to BigQuery concurrently
+DEFAULT_LOAD_WORKERS = 8
+
+# Serialization of raw loads: "parquet" (columnar, needs pyarrow) or "json"
+DEFAULT_LOAD_FORMAT = "parquet" if PYARROW_AVAILABLE else "json"
+
+# GoogleSQL names of the legacy BigQuery types used by the raw schemas
+_SQL_TYPES = {"INTEGER": "INT64", "FLOAT": "FLOAT64", "BOOLEAN": "BOOL"}
+
 
-class DataSourceConnector(ABC):
+def accounts_from_env(name: str) -> list[str]:
+    """
+    Read a comma-separated list of account IDs from an environment variable.
+
+    Args:
+        name: Variable name (ex: "META_ADS_ACCOUNT_IDS")
+
+    Returns:
+        Account IDs, empty if the variable is unset
+    """
+    return [account.strip() for account in os.getenv(name, "").split(",") if account.strip()]
+
+
+class DataSourceConnector(RunModesMixin, ABC):  # pylint: disable=too-many-instance-attributes
     """
     Abstract base class defining the contract for all data source connectors.
 
     Each connector must implement:
     - `extract()`: raw data extraction
 
-    Methods `load_raw()`, `write_to_bigquery()` and `run()` are provided and reusable.
+    Connectors may also override `extract_pages()` to yield data page by page,
+    which lets `run_streaming()` keep memory bounded on long date ranges.
+
+    Methods `load_raw()`, `write_to_bigquery()` and the run modes (`run()`,
+    `run_streaming()`, `run_pipelined()`... see ingestion.run_modes) are
+    provided and reusable.
+
+    Connectors covering several accounts take an `accounts` list (or discover
+    them, see `discover_accounts()`) and extract each one with
+    `extract_pages(..., account=...)`; `estimate_account_size()` orders them
+    largest first.
+
+    Subclasses tune extraction sharding through the `window_days` and
+    `max_workers` class attributes (API limits differ per source), and API
+    call rates through `api_rate_per_second` / `api_max_concurrency`: every
+    call goes through the connector's shared `controller`.
+
+    Extraction goes through `extract_cached_pages()`, which only calls the
+    API for the dates missing from the `response_cache` and writes what it
+    extracts to the payload `archive` (each when enabled); `run_replay()`
+    loads the archive back.
     """
 
-    def __init__(self, source_name: str, project_id: str = None):
+    window_days = DEFAULT_WINDOW_DAYS
+    max_workers = DEFAULT_MAX_WORKERS
+    api_rate_per_second = None
+    api_max_concurrency = DEFAULT_API_MAX_CONCURRENCY
+    # Rows per API page, for call estimates (None: one call per window, ex: a stream)
+    api_page_size = None
+    load_workers = DEFAULT_LOAD_WORKERS
+    load_format = DEFAULT_LOAD_FORMAT
+    # Leave date partitions whose re-pulled rows match the stored fingerprints untouched
+    skip_unchanged = False
+
+    def __init__(self, source_name: str, project_id: str = None, accounts: list[str] | None = None):
         """
         Initialize the connector.
 
         Args:
             source_name: Unique source identifier (ex: "google_ads", "meta_ads")
             project_id: GCP project ID for BigQuery (optional, reads from env or uses default)
+            accounts: Accounts to extract (default: discovered, or the connector's single account)
         """
         self.source_name = source_name
+        self.accounts = list(accounts or [])
+        self.account_report = {}
         self.project_id = project_id or os.getenv("GCP_PROJECT_ID", "media-data-platform")
         self.dataset_id = "mdp_raw"
         self.bq_client = None
+        self._raw_table_exists = False
+        self._staging_tables = set()
+
+        # Sharding can be tuned per source without code change
+        env_prefix = source_name.upper()
+        self.window_days = int(os.getenv(f"{env_prefix}_WINDOW_DAYS", str(self.window_days)))
+        self.max_workers = int(os.getenv(f"{env_prefix}_MAX_WORKERS", str(self.max_workers)))
+        self.load_format = os.getenv(f"{env_prefix}_LOAD_FORMAT", self.load_format).lower()
+        self.skip_unchanged = os.getenv(f"{env_prefix}_SKIP_UNCHANGED", str(self.skip_unchanged)).lower() in (
+            "1", "true", "yes"
+        )
+        if self.load_format == "parquet" and not PYARROW_AVAILABLE:
+            logger.warning("Parquet loads require pyarrow, falling back to JSON for %s", source_name)
+            self.load_format = "json"
+
+        # Shared by all extraction threads, so API limits hold across windows
+        self.controller = ConcurrencyController(
+            rate_per_second=self.api_rate_per_second,
+            max_concurrency=self.api_max_concurrency,
+        )
+        # Local cache of extracted rows per date (None: disabled, see extract_cached_pages())
+        self.response_cache = ResponseCache.from_env(late_days=LATE_DATA_DAYS)
+        # Archive of every extracted range, replayed by run_replay() (None: disabled)
+        self.archive = PayloadArchive.from_env()
 
     @abstractmethod
     def extract(self, start_date: str, end_date: str) -> list[dict]:
@@ -55,7 +187,190 @@ class DataSourceConnector(ABC):
             List of dictionaries containing raw data filtered by date
         """
 
-    def load_raw(self, rows: list[dict]) -> list[dict]:
+    def extract_pages(self, start_date: str, end_date: str,
+                      account: str | None = None) -> Iterator[list[dict]]:  # pylint: disable=unused-argument
+        """
+        Extract raw data from the source, one page at a time.
+
+        Default implementation yields the result of `extract()` as a single page.
+        Connectors override it to yield API pages (or one page per day) so that
+        `run_streaming()` never holds the whole date range in memory, and to
+        extract the given account.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            account: Account to extract (None: the connector's default account)
+
+        Yields:
+            Lists of dictionaries containing raw data
+        """
+        yield self.extract(start_date, end_date)
+
+    def cache_fields(self) -> tuple[str, ...]:
+        """
+        What a cached response depends on besides (source, account, date).
+
+        Default implementation uses the raw table's source columns; connectors
+        override it with the fields they request, plus anything else that
+        changes the rows (ex: fake vs real API).
+
+        Returns:
+            Field names (part of the response cache key)
+        """
+        return fingerprint_columns(self.raw_schema)
+
+    def default_account(self) -> str | None:
+        """
+        Account extracted when none is given (ex: META_ADS_ACCOUNT_ID).
+
+        Default implementation has none; connectors override it, so that the
+        cached and archived rows of the default account are keyed on its ID.
+
+        Returns:
+            Account ID, or None when the default account has no ID
+        """
+        return None
+
+    def extract_cached_pages(self, start_date: str, end_date: str,
+                             account: str | None = None) -> Iterator[list[dict]]:
+        """
+        Extract raw data page by page, serving the dates held by the response cache.
+
+        Dates missing from the cache (or expired) are merged into contiguous
+        ranges extracted with `extract_pages()`. Once a range is complete, its
+        rows are stored per date — dates without rows included, so they are
+        not requested again — and written to the payload `archive` (when
+        enabled). Both are keyed on the account ID, the default one resolved
+        (see default_account()). Without cache nor archive, same as `extract_pages()`.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            account: Account to extract (None: the connector's default account)
+
+        Yields:
+            One page per cached date, then the pages of each extracted range
+        """
+        cache = self.response_cache
+        if cache is None and self.archive is None:
+            yield from self.extract_pages(start_date, end_date, account=account)
+            return
+
+        fields = self.cache_fields()
+        # The default account's rows are keyed on its ID, so changing it never serves another account's rows
+        key_account = account or self.default_account()
+        missing = []
+        for day in iter_days(start_date, end_date):
+            rows = cache.get(self.source_name, key_account, day, fields) if cache is not None else None
+            if rows is None:
+                missing.append(day)
+            elif rows:
+                yield rows
+
+        for start, end in merge_ranges(missing):
+            rows_by_day = {day: [] for day in iter_days(start, end)}
+            for page in self.extract_pages(start, end, account=account):
+                for row in page:
+                    rows_by_day.setdefault(str(row["date"]), []).append(row)
+                yield page
+            if cache is not None:
+                for day, rows in rows_by_day.items():
+                    cache.put(self.source_name, key_account, day, fields, rows)
+            if self.archive is not None:
+                self.archive.write(self.source_name, key_account, rows_by_day)
+
+    def discover_accounts(self) -> list[str]:
+        """
+        List the accounts reachable under the configured manager account.
+
+        Default implementation discovers nothing; connectors override it.
+
+        Returns:
+            Account IDs (empty when no manager account is configured)
+        """
+        return []
+
+    def estimate_account_size(self, account: str) -> int:  # pylint: disable=unused-argument
+        """
+        Estimate the size of an account, to schedule the largest ones first.
+
+        Default implementation considers every account equal; connectors
+        override it (ex: number of campaigns).
+
+        Args:
+            account: Account ID
+
+        Returns:
+            Relative size (rows per day)
+        """
+        return 1
+
+    def resolve_accounts(self) -> list[str | None]:
+        """
+        Accounts a run extracts: the configured list, else the discovered ones.
+
+        Returns:
+            Account IDs, or [None] for the connector's single default account
+        """
+        return self.accounts or self.discover_accounts() or [None]
+
+    def plan_tasks(self, start_date: str, end_date: str,
+                   window_days: int | None = None, max_workers: int | None = None) -> list[ExtractTask]:
+        """
+        Build the (account, window) extraction tasks of a run, largest first.
+
+        Starting the biggest accounts first keeps one large account from
+        running alone at the end of the run while the other workers are idle.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            window_days: Days per window (defaults to the connector setting)
+            max_workers: Concurrent size estimates (defaults to the connector setting)
+
+        Returns:
+            Tasks sorted by decreasing estimated rows (account size × window days)
+        """
+        windows = split_date_range(start_date, end_date, window_days or self.window_days)
+        accounts = self.resolve_accounts()
+        sizes = {account: 1 for account in accounts}
+
+        if len(accounts) > 1:
+            def estimate(account: str) -> int:
+                try:
+                    return self.estimate_account_size(account)
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # Size only orders the tasks — the extraction reports real failures
+                    logger.warning("Could not estimate the size of %s account %s: %s",
+                                   self.source_name, account, e)
+                    return 0
+
+            workers = max(1, min(max_workers or self.max_workers, len(accounts)))
+            sizes.update(run_concurrently(estimate, accounts, workers))
+
+        def estimated_rows(task: ExtractTask) -> int:
+            days = (datetime.strptime(task.end_date, "%Y-%m-%d")
+                    - datetime.strptime(task.start_date, "%Y-%m-%d")).days + 1
+            return sizes[task.account] * days
+
+        tasks = [ExtractTask(account, *window) for account in accounts for window in windows]
+        return sorted(tasks, key=estimated_rows, reverse=True)
+
+    def new_run_metadata(self) -> dict[str, Any]:
+        """
+        Build the ingestion metadata shared by every row of a run.
+
+        Returns:
+            Dictionary with ingested_at, extract_run_id and source
+        """
+        return {
+            "ingested_at": datetime.now(tz=timezone.utc).isoformat(),
+            "extract_run_id": str(uuid.uuid4()),
+            "source": self.source_name,
+        }
+
+    def load_raw(self, rows: Sequence[dict]) -> EnrichedRows:
         """
         Enrich raw data with ingestion metadata.
 
@@ -64,103 +379,419 @@ class DataSourceConnector(ABC):
         - extract_run_id: Unique UUID to trace extraction run
         - source: source identifier
 
-        This method is reusable across all sources.
+        This method is reusable across all sources. Metadata is attached once
+        to the batch rather than copied into every row.
 
         Args:
             rows: List of dictionaries containing raw data
 
         Returns:
-            List enriched with ingestion metadata
-        """
-        run_id = str(uuid.uuid4())
-        ingested_at = datetime.now(tz=timezone.utc).isoformat()
-
-        # Add metadata fields to every row — same logic for all sources
-        enriched = []
-        for row in rows:
-            enriched.append(
-                {
-                    **row,
-                    "ingested_at": ingested_at,
-                    "extract_run_id": run_id,
-                    "source": self.source_name,
-                }
-            )
-        return enriched
-
-    def run(self, start_date: str, end_date: str) -> list[dict]:
+            Sequence of rows enriched with ingestion metadata
         """
-        Execute the complete pipeline: extract → enrich → load to BigQuery.
-
-        This method orchestrates steps and is identical for all sources.
+        return EnrichedRows(rows, self.new_run_metadata())
+
+    def extract_windows(self, start_date: str, end_date: str, *,  # pylint: disable=too-many-arguments
+                        window_days: int | None = None,
+                        max_workers: int | None = None,
+                        report: dict[str, dict] | None = None,
+                        checkpoint: RunCheckpoint | None = None,
+                        unchanged: dict[str, int] | None = None) -> Iterator[tuple[ExtractTask, list[dict]]]:
+        """
+        Extract a date range as concurrent (account, window) tasks, yielding each one as it finishes.
 
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format (inclusive)
+            window_days: Days per window (defaults to the connector setting)
+            max_workers: Concurrent extractions (defaults to the connector setting)
+            report: Per-account report {account: {status, windows, failed_windows,
+                rows, errors}}, updated in place. When given, a failing task is
+                recorded there and skipped; otherwise its error is raised.
+            checkpoint: Run checkpoint — tasks it has committed are not extracted
+            unchanged: When given, date partitions whose extracted rows match the
+                fingerprints stored in BigQuery are dropped and counted there
+                (skipped_rows, skipped_partitions); tasks then run window by window
+
+        Yields:
+            (task, rows) tuples in completion order
+        """
+        tasks = self.plan_tasks(start_date, end_date, window_days, max_workers)
+        if checkpoint is not None:
+            tasks = checkpoint.pending(tasks)
+        workers = max(1, min(max_workers or self.max_workers, len(tasks)))
+        logger.info("Extracting %s from %s to %s in %d tasks (%d workers)",
+                    self.source_name, start_date, end_date, len(tasks), workers)
+
+        def extract_task(task: ExtractTask) -> list[dict] | Exception:
+            try:
+                return [
+                    row
+                    for page in self.extract_cached_pages(task.start_date, task.end_date, account=task.account)
+                    for row in page
+                ]
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # Returned to the consumer thread, which records or raises it
+                return e
+
+        if unchanged is not None:
+            # Window by window, so each window's partitions are complete as early as possible
+            tasks.sort(key=lambda task: task.start_date)
+
+        def settled() -> Iterator[tuple[ExtractTask, list[dict] | None]]:
+            """Every task once finished, with None as rows when it failed (report mode)."""
+            for task, rows in run_concurrently(extract_task, tasks, workers):
+                if report is None:
+                    if isinstance(rows, Exception):
+                        raise rows
+                    yield task, rows
+                    continue
+
+                account = task.account or DEFAULT_ACCOUNT
+                entry = report.setdefault(account, {"status": "success", "windows": 0, "failed_windows": 0,
+                                                    "rows": 0, "errors": []})
+                if isinstance(rows, Exception):
+                    logger.error("Extraction failed for %s account %s (%s to %s): %s",
+                                 self.source_name, account, task.start_date, task.end_date, rows)
+                    entry["status"] = "failed"
+                    entry["failed_windows"] += 1
+                    entry["errors"].append(f"{task.start_date} to {task.end_date}: {rows}")
+                    yield task, None
+                    continue
+                entry["windows"] += 1
+                entry["rows"] += len(rows)
+                yield task, rows
+
+        results = settled()
+        if unchanged is not None:
+            results = self._drop_unchanged(results, tasks, unchanged)
+        try:
+            for task, rows in results:
+                if rows is not None:
+                    yield task, rows
+        finally:
+            results.close()
+
+    def fingerprint_rows(self, rows: Sequence[dict]) -> list[int]:
+        """
+        Fingerprints of raw rows, as stored in the raw table (see ingestion.fingerprints).
+
+        Args:
+            rows: Raw rows (without ingestion metadata)
+
+        Returns:
+            One fingerprint per row, in order
+        """
+        columns = fingerprint_columns(self.raw_schema)
+        schema = [field for field in self.raw_schema if field.name in columns]
+        return [row_fingerprint(row, columns) for row in coerce_rows(rows, schema)]
+
+    def stored_partition_digests(self, dates: list[str]) -> dict[str, tuple[int, int]]:
+        """
+        Digests of the raw table's stored partitions (see ingestion.fingerprints).
+
+        Args:
+            dates: Dates (YYYY-MM-DD) of the partitions
 
         Returns:
-            List of enriched dictionaries ready for raw zone
+            {date: (row_count, digest)} for the fingerprinted partitions that exist
+        """
+        return fetch_partition_digests(self.get_bigquery_client(), self.raw_table_id, dates)
+
+    def record_unchanged_partitions(self, row_counts: dict[str, int]) -> None:
         """
-        # Step 1: extract raw data from the source (API or fake)
-        rows = self.extract(start_date, end_date)
-        logger.info("Extracted %d rows from %s", len(rows), self.source_name)
+        Record partitions found identical to the source, which keep their old load time.
+
+        Args:
+            row_counts: {date (YYYY-MM-DD): row count} of the unchanged partitions
+        """
+        record_partition_checks(self.get_bigquery_client(), f"{self.project_id}.{self.dataset_id}",
+                                self.raw_table_name, row_counts)
+
+    def _drop_unchanged(self, results: Iterator[tuple[ExtractTask, list[dict] | None]],
+                        tasks: list[ExtractTask],
+                        unchanged: dict[str, int]) -> Iterator[tuple[ExtractTask, list[dict] | None]]:
+        """
+        Drop the rows of date partitions identical to the stored ones.
+
+        A partition holds every account's rows of a date, so tasks are held
+        back until all the tasks of their window have finished; the digest of
+        each date is then compared with the stored one (one query per window).
+        Unchanged dates are recorded (see record_unchanged_partitions), so the
+        backfill planner does not see them as stale.
 
-        # Step 2: enrich with ingestion metadata
-        enriched_rows = self.load_raw(rows)
-        logger.info("Enriched %d rows with metadata", len(enriched_rows))
+        Args:
+            results: Finished tasks (see extract_windows), rows None when failed
+            tasks: Planned tasks, to know when a window is complete
+            unchanged: Counters updated in place: skipped_rows, skipped_partitions
 
-        # Step 3: write to BigQuery raw zone
-        if enriched_rows:
-            self.write_to_bigquery(enriched_rows)
-            logger.info("Successfully loaded %d rows to BigQuery", len(enriched_rows))
+        Yields:
+            The same tasks, without the rows of unchanged dates
+        """
+        expected = defaultdict(int)
+        for task in tasks:
+            expected[(task.start_date, task.end_date)] += 1
+        held = defaultdict(list)
+
+        for task, rows in results:
+            window = (task.start_date, task.end_date)
+            held[window].append((task, rows))
+            if len(held[window]) < expected[window]:
+                continue
+
+            finished = held.pop(window)
+            skipped = self._unchanged_dates(finished)
+            if skipped:
+                self.record_unchanged_partitions(skipped)
+                unchanged["skipped_partitions"] += len(skipped)
+                unchanged["skipped_rows"] += sum(skipped.values())
+                logger.info("%s: %d unchanged partitions (%d rows) skipped in %s to %s",
+                            self.source_name, len(skipped), sum(skipped.values()), *window)
+
+            for finished_task, window_rows in finished:
+                if window_rows is not None and skipped:
+                    window_rows = [row for row in window_rows if str(row["date"]) not in skipped]
+                yield finished_task, window_rows
+
+    def _unchanged_dates(self, finished: list[tuple[ExtractTask, list[dict] | None]]) -> dict[str, int]:
+        """
+        Dates of a finished window whose extracted rows match the stored partition.
+
+        Args:
+            finished: Every task of the window, rows None when failed
 
-        return enriched_rows
+        Returns:
+            {date (YYYY-MM-DD): row count} of the unchanged dates
+        """
+        fingerprints_by_date = defaultdict(list)
+        for _, rows in finished:
+            for row, fingerprint in zip(rows or [], self.fingerprint_rows(rows or [])):
+                fingerprints_by_date[str(row["date"])].append(fingerprint)
+        if not fingerprints_by_date:
+            return {}
+
+        stored = self.stored_partition_digests(list(fingerprints_by_date))
+        return {
+            day: len(fingerprints) for day, fingerprints in fingerprints_by_date.items()
+            if day in stored and stored[day] == partition_digest(fingerprints)
+        }
 
     def get_bigquery_client(self) -> bigquery.Client:
         """
-        Get or create BigQuery client (lazy initialization).
+        Get the BigQuery client (lazy initialization).
 
         Returns:
-            Initialized BigQuery client
+            Process-wide client of the project, shared with the other
+            connectors and the monitoring (see ingestion.bigquery_clients)
         """
-        # Create client only once and reuse for subsequent calls
         if self.bq_client is None:
-            self.bq_client = bigquery.Client(project=self.project_id)
+            self.bq_client = bigquery_clients.get_client(self.project_id)
         return self.bq_client
 
-    def write_to_bigquery(self, rows: list[dict]) -> None:
+    @property
+    def raw_table_name(self) -> str:
+        """Raw table name, also the key of its schema in the registry."""
+        return f"{self.source_name}_campaign_daily"
+
+    @property
+    def raw_table_id(self) -> str:
+        """Fully qualified raw table ID (ex: project.mdp_raw.meta_ads_campaign_daily)."""
+        return f"{self.project_id}.{self.dataset_id}.{self.raw_table_name}"
+
+    @property
+    def raw_schema(self) -> list[bigquery.SchemaField]:
+        """Declared BigQuery schema of the raw table (see ingestion.schemas)."""
+        return get_raw_schema(self.raw_table_name)
+
+    def write_to_bigquery(self, rows: Sequence[dict], staged_slices: set[tuple[str, str | None]] | None = None,
+                          run_metadata: dict[str, Any] | None = None) -> None:
         """
-        Write enriched data to BigQuery raw dataset, one partition per date.
+        Write enriched data to BigQuery raw dataset, replacing it by (date, account_id) slice.
 
-        Uses WRITE_TRUNCATE per date partition — idempotent: rerunning the same
-        date overwrites only that partition, preventing duplicates.
+        Rows are first loaded into the run's staging table, one load job per
+        date partition (`staging$YYYYMMDD`), submitted concurrently. The commit
+        then replaces the stored rows of every staged slice in one transaction
+        (see ingestion.staging) — readers see a date either before or after the
+        run, never with an account missing, and rerunning a date for an account
+        overwrites only that account's rows. The other accounts of the date
+        (ex: one whose extraction failed) keep theirs.
+
+        Rows are validated and cast against the registered raw schema in one
+        pass before upload; loads use that explicit schema (no autodetect).
+        Depending on `load_format`, each partition is sent as compressed Parquet
+        (Arrow columns, dictionary-encoded metadata) or as newline-delimited JSON.
+
+        Runs pass `staged_slices`: their batches are only staged (load jobs, no
+        DML) and the run commits them once, when it finishes (see
+        ingestion.run_modes). Without it, the rows are committed right away.
+
+        Run metadata is either carried by each row (enriched rows) or passed
+        once as `run_metadata`, in which case it is validated once and only
+        materialized when the payload is serialized.
 
         Args:
-            rows: List of enriched dictionaries (must contain a 'date' field)
+            rows: Dictionaries with a 'date' field — raw rows when `run_metadata`
+                is given, enriched rows otherwise
+            staged_slices: (date, account_id) slices staged by the current run,
+                updated in place. If None, the rows are committed right away.
+            run_metadata: Metadata shared by every row (see new_run_metadata())
 
         Raises:
+            ValueError: If rows do not match the raw schema
             Exception: If BigQuery write fails
         """
         if not rows:
             logger.warning("No rows to write to BigQuery")
             return
 
+        if isinstance(rows, EnrichedRows):
+            rows, run_metadata = rows.rows, rows.run_metadata
+
+        schema = self.raw_schema
+        metadata = None
+        if run_metadata is not None:
+            metadata_names = {field.name for field in METADATA_FIELDS}
+            schema = [field for field in schema if field.name not in metadata_names]
+            metadata = coerce_rows([run_metadata], METADATA_FIELDS)[0]
+
+        columns = fingerprint_columns(schema)
+        rows_by_date = defaultdict(list)
+        slices = set()
+        for row in coerce_rows(rows, schema):
+            row[FINGERPRINT_COLUMN] = row_fingerprint(row, columns)
+            rows_by_date[row["date"]].append(row)
+            slices.add((row["date"], row.get("account_id")))
+        extract_run_id = (metadata or next(iter(rows_by_date.values()))[0])["extract_run_id"]
+
+        self._ensure_raw_table()
+        partitions = [(self._ensure_staging_table(extract_run_id), date, date_rows, metadata)
+                      for date, date_rows in sorted(rows_by_date.items())]
+        workers = max(1, min(self.load_workers, len(partitions)))
+        total = sum(n for _, n in run_concurrently(self._load_partition, partitions, workers))
+        logger.info("Total: %d rows staged for %s across %d partitions",
+                    total, self.raw_table_id, len(rows_by_date))
+
+        if staged_slices is None:
+            self._commit_staged(extract_run_id)
+        else:
+            staged_slices |= slices
+
+    def _ensure_raw_table(self) -> None:
+        """
+        Create the date-partitioned raw table from its schema (once per connector).
+
+        An existing table is brought in line with the registered schema before
+        staged rows are inserted into it: columns stored as INTEGER but now
+        declared FLOAT (ex: Google Ads conversions) are widened, REQUIRED
+        columns now declared NULLABLE are relaxed, and registered columns it
+        lacks (ex: account_id) are added.
+        """
+        if self._raw_table_exists:
+            return
+
+        table = bigquery.Table(self.raw_table_id, schema=self.raw_schema)
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY, field="date"
+        )
         client = self.get_bigquery_client()
-        table_name = f"{self.source_name}_campaign_daily"
-        base_table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
+        # Returns the existing table, with its stored schema, when there is one
+        stored = {field.name: field for field in client.create_table(table, exists_ok=True).schema}
+        for field in self.raw_schema:
+            if field.name not in stored:
+                continue
+            if field.field_type == "FLOAT" and stored[field.name].field_type == "INTEGER":
+                client.query(
+                    f"ALTER TABLE `{self.raw_table_id}` ALTER COLUMN {field.name} SET DATA TYPE FLOAT64"
+                ).result()
+                logger.info("Widened %s.%s from INTEGER to FLOAT64", self.raw_table_id, field.name)
+            if stored[field.name].mode == "REQUIRED" and field.mode != "REQUIRED":
+                client.query(f"ALTER TABLE `{self.raw_table_id}` ALTER COLUMN {field.name} DROP NOT NULL").result()
+                logger.info("Relaxed %s.%s to NULLABLE", self.raw_table_id, field.name)
+        missing = [field for field in self.raw_schema if field.name not in stored]
+        if missing:
+            additions = ", ".join(
+                f"ADD COLUMN IF NOT EXISTS {field.name} {_SQL_TYPES.get(field.field_type, field.field_type)}"
+                for field in missing
+            )
+            client.query(f"ALTER TABLE `{self.raw_table_id}` {additions}").result()
+            logger.info("Added %s to %s", ", ".join(field.name for field in missing), self.raw_table_id)
+        self._raw_table_exists = True
+
+    def _staging_table_id(self, extract_run_id: str) -> str:
+        """Staging table of a run (see ingestion.staging)."""
+        return staging.staging_table_id(self.raw_table_id, extract_run_id)
+
+    def _ensure_staging_table(self, extract_run_id: str) -> str:
+        """Create the run's staging table, partitioned like the raw table, and return its ID."""
+        staging_id = self._staging_table_id(extract_run_id)
+        if staging_id not in self._staging_tables:
+            staging.create_staging_table(self.get_bigquery_client(), staging_id, self.raw_schema)
+            self._staging_tables.add(staging_id)
+        return staging_id
+
+    def _commit_staged(self, extract_run_id: str) -> None:
+        """Replace the stored slices with a run's staged rows in one transaction (see ingestion.staging)."""
+        staging_id = self._staging_table_id(extract_run_id)
+        staging.commit_staged(self.get_bigquery_client(), self.raw_table_id, staging_id,
+                              [field.name for field in self.raw_schema])
+        self._staging_tables.discard(staging_id)
+        logger.info("Committed the staged rows of run %s to %s", extract_run_id, self.raw_table_id)
+
+    def _discard_uncommitted(self, extract_run_id: str, committed: list[tuple[str | None, str, str]]) -> bool:
+        """
+        Keep only the committed tasks' rows in the staging table of a resumed run.
+
+        Args:
+            extract_run_id: Run being resumed
+            committed: (account, start_date, end_date) tasks of its checkpoint
+
+        Returns:
+            Whether the interrupted run left staged rows to commit
+        """
+        staging_id = self._staging_table_id(extract_run_id)
+        if not staging.discard_uncommitted(self.get_bigquery_client(), staging_id, committed):
+            return False
+        self._staging_tables.add(staging_id)
+        logger.info("Resuming the staged rows of %d committed tasks in %s", len(committed), staging_id)
+        return True
+
+    def _load_partition(self, partition: tuple[str, str, list[dict], dict | None]) -> int:
+        """
+        Append the rows of a single date to its partition and wait for completion.
+
+        Args:
+            partition: (table_id, date, rows, run_metadata) tuple — when
+                run_metadata is set, it is attached to the rows while serializing
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            Exception: If BigQuery write fails
+        """
+        table_id, date, rows, metadata = partition
+        client = self.get_bigquery_client()
+        partition_id = f"{table_id}${date.replace('-', '')}"
 
         job_config = bigquery.LoadJobConfig(
             write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-            autodetect=True,
+            create_disposition=bigquery.CreateDisposition.CREATE_NEVER,
+            schema=self.raw_schema,
         )
 
         try:
-            load_job = client.load_table_from_json(
-                rows, base_table_id, job_config=job_config
-            )
+            if self.load_format == "parquet":
+                job_config.source_format = bigquery.SourceFormat.PARQUET
+                payload = to_parquet_bytes(to_record_batch(rows, self.raw_schema, metadata))
+                load_job = client.load_table_from_file(
+                    io.BytesIO(payload), partition_id, job_config=job_config
+                )
+            else:
+                if metadata is not None:
+                    # Each merged dict only lives while its JSON line is written
+                    rows = (row | metadata for row in rows)
+                load_job = client.load_table_from_json(rows, partition_id, job_config=job_config)
             load_job.result()
-            logger.info("Total: %d rows written to %s", load_job.output_rows, base_table_id)
+            return load_job.output_rows
         except Exception as e:
-            logger.error("Failed to load data to BigQuery: %s", str(e))
+            logger.error("Failed to load partition %s to BigQuery: %s", partition_id, str(e))
             raise
@@ -0,0 +1,170 @@
+"""
+Process-wide registry of BigQuery clients, shared by ingestion and monitoring.
+
+Building a `bigquery.Client` resolves credentials and opens a new HTTP
+session, and each session keeps its own connections. Connectors, the run
+logger, the volume checks and the scripts used to build one client per call;
+they now ask `get_client()`, which returns the same client for a given
+(project, credentials file) for the life of the process:
+
+- one authorized HTTP session per client, with a connection pool sized for
+  the worker threads that share it (BIGQUERY_POOL_SIZE)
+- creation is serialized by a lock, so concurrent first calls from worker
+  threads get the same client; the client itself is safe to share between
+  threads
+- clients are keyed by process ID as well, so a forked worker never reuses
+  the sockets of its parent
+
+Clients and connections (sockets opened by the pooled sessions) are counted (see `stats()`).
+"""
+
+from typing import Any
+import logging
+import os
+import threading
+
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open per host and client — above the concurrent load jobs
+# and volume-check threads, so that no connection is discarded after use
+DEFAULT_POOL_SIZE = 32
+
+# Guards the registry and counters; client creation has its own lock, as
+# resolving credentials can block on the network
+_lock = threading.Lock()
+_create_lock = threading.Lock()
+# (process ID, project, credentials file) -> client
+_clients: dict[tuple[int, str, str | None], bigquery.Client] = {}
+_counters = {"clients_created": 0, "connections_created": 0}
+
+
+def _count(counter: str) -> None:
+    """Increment a registry counter."""
+    with _lock:
+        _counters[counter] += 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    """HTTP connection that counts the sockets it opens."""
+
+    def connect(self):
+        _count("connections_created")
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that counts the sockets it opens."""
+
+    def connect(self):
+        _count("connections_created")
+        # urllib3 rebinds HTTPSConnection to a DummyConnection (no connect) when ssl is
+        # missing; pylint infers both bindings, the real one is always used here
+        super().connect()  # pylint: disable=no-member
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool of counting connections."""
+
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool of counting connections."""
+
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """Transport adapter whose connection pools count their connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def _create_client(project_id: str, credentials_path: str | None) -> bigquery.Client:
+    """
+    Build a client with its own authorized, pooled HTTP session.
+
+    Args:
+        project_id: GCP project ID
+        credentials_path: Service account or authorized user file (None: application default credentials)
+
+    Returns:
+        BigQuery client
+    """
+    if credentials_path:
+        credentials, _ = google.auth.load_credentials_from_file(credentials_path, scopes=bigquery.Client.SCOPE)
+    else:
+        credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+
+    pool_size = int(os.getenv("BIGQUERY_POOL_SIZE", str(DEFAULT_POOL_SIZE)))
+    session = AuthorizedSession(credentials)
+    adapter = _PooledAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # google-cloud-bigquery has no public setting for the transport or its pool size:
+    # `_http` is the constructor hook google-cloud-core provides for it, documented as
+    # private and subject to change. test_bigquery_clients checks that the client sends
+    # its requests through this session, so an upgrade that drops the hook fails there.
+    return bigquery.Client(project=project_id, credentials=credentials, _http=session)
+
+
+def get_client(project_id: str, credentials_path: str | None = None) -> bigquery.Client:
+    """
+    Shared BigQuery client of a project, created on first use.
+
+    Args:
+        project_id: GCP project ID
+        credentials_path: Credentials file (default: GOOGLE_APPLICATION_CREDENTIALS, if set)
+
+    Returns:
+        BigQuery client, the same one for every caller of this process with
+        the same project and credentials
+    """
+    credentials_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    key = (os.getpid(), project_id, credentials_path)
+    with _lock:
+        client = _clients.get(key)
+    if client is None:
+        with _create_lock:
+            # Another thread may have created it while this one waited
+            with _lock:
+                client = _clients.get(key)
+            if client is None:
+                client = _create_client(project_id, credentials_path)
+                with _lock:
+                    _clients[key] = client
+                    _counters["clients_created"] += 1
+                logger.info("Created BigQuery client for project %s", project_id)
+    return client
+
+
+def stats() -> dict[str, Any]:
+    """
+    Counters of the registry since the process started.
+
+    Returns:
+        clients (currently registered), clients_created and connections_created
+    """
+    with _lock:
+        return {"clients": len(_clients), **_counters}
+
+
+def close_clients() -> None:
+    """Close and forget every registered client (their sessions and connections)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
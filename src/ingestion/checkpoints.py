@@ -0,0 +1,231 @@
+"""
+Checkpoints of ingestion runs, to resume a failed backfill where it stopped.
+
+A run is split into (account, window) extraction tasks. With a checkpoint,
+each task is committed once all of its rows are staged in BigQuery (the
+run's staging table outlives an interruption, see
+DataSourceConnector.write_to_bigquery()). When the
+same source and date range is run again, committed tasks are skipped — no API
+call — and only the remaining ones are extracted. The checkpoint of a run is
+cleared once every task has been committed.
+
+The state is a local JSON file, rewritten atomically (temporary file +
+os.replace) after each commit, so an interrupted run never leaves it
+half-written. One file can hold the unfinished runs of several sources.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# State file used when no path is given (overridden by INGESTION_CHECKPOINT_PATH)
+DEFAULT_CHECKPOINT_PATH = ".checkpoints/ingestion.json"
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Replace a JSON file atomically: readers see the old or the new content, never a partial one.
+
+    Args:
+        path: File to write (its directory is created if needed)
+        data: JSON-serializable content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def read_json(path: Path, default: Any) -> Any:
+    """
+    Load a JSON file written by write_json_atomic.
+
+    Args:
+        path: File to read
+        default: Value returned when the file does not exist
+
+    Returns:
+        The file content, or `default`
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+
+
+class CheckpointStore:
+    """JSON file holding the progress of unfinished ingestion runs."""
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: State file (default: INGESTION_CHECKPOINT_PATH or .checkpoints/ingestion.json)
+        """
+        self.path = Path(path or os.getenv("INGESTION_CHECKPOINT_PATH", DEFAULT_CHECKPOINT_PATH))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def run_key(source: str, start_date: str, end_date: str) -> str:
+        """Key of a run in the state file: one unfinished run per source and date range."""
+        return f"{source}/{start_date}/{end_date}"
+
+    def runs(self) -> dict[str, dict[str, Any]]:
+        """
+        Unfinished runs recorded in the state file.
+
+        Returns:
+            {run key: checkpoint entry} (empty if the file does not exist)
+        """
+        with self._lock:
+            return self._read()
+
+    def open_run(self, source: str, start_date: str, end_date: str,
+                 window_days: int, extract_run_id: str) -> "RunCheckpoint":
+        """
+        Resume the unfinished run of a source and date range, or start a new one.
+
+        A resumed run keeps the extract_run_id and window size of the run it
+        continues, so its tasks line up with the committed ones.
+
+        Args:
+            source: Source name (ex: "meta_ads")
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            window_days: Days per extraction window of a new run
+            extract_run_id: Run ID of a new run
+
+        Returns:
+            Checkpoint of the run
+        """
+        key = self.run_key(source, start_date, end_date)
+        with self._lock:
+            entry = self._read().get(key)
+
+        if entry is None:
+            now = datetime.now(tz=timezone.utc).isoformat()
+            entry = {"source": source, "start_date": start_date, "end_date": end_date,
+                     "window_days": window_days, "extract_run_id": extract_run_id,
+                     "created_at": now, "updated_at": now, "completed_tasks": []}
+            return RunCheckpoint(self, key, entry, resumed=False)
+
+        if entry["window_days"] != window_days:
+            logger.warning("Resuming %s with the %d-day windows of the interrupted run (requested %d)",
+                           key, entry["window_days"], window_days)
+        logger.info("Resuming %s (run %s): %d tasks already committed",
+                    key, entry["extract_run_id"], len(entry["completed_tasks"]))
+        return RunCheckpoint(self, key, entry, resumed=True)
+
+    def discard(self, source: str, start_date: str, end_date: str) -> bool:
+        """
+        Forget the unfinished run of a source and date range (next run starts over).
+
+        Returns:
+            True if a checkpoint was removed
+        """
+        return self._save(self.run_key(source, start_date, end_date), None)
+
+    def _save(self, key: str, entry: dict[str, Any] | None) -> bool:
+        """Write (or remove, when `entry` is None) a run entry; returns whether the key existed."""
+        with self._lock:
+            state = self._read()
+            existed = key in state
+            if entry is None:
+                state.pop(key, None)
+            else:
+                state[key] = entry
+            if existed or entry is not None:
+                self._write(state)
+            return existed
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Load the state file (caller holds the lock)."""
+        return read_json(self.path, {})
+
+    def _write(self, state: dict[str, dict[str, Any]]) -> None:
+        """Replace the state file atomically (caller holds the lock)."""
+        write_json_atomic(self.path, state)
+
+
+class RunCheckpoint:
+    """Progress of one run: the (account, window) tasks whose rows are loaded."""
+
+    def __init__(self, store: CheckpointStore, key: str, entry: dict[str, Any], resumed: bool):
+        self.store = store
+        self.key = key
+        self.entry = entry
+        self.resumed = resumed
+        self.skipped_tasks = 0
+        self._completed = {tuple(task) for task in entry["completed_tasks"]}
+        self._lock = threading.Lock()
+
+    @property
+    def extract_run_id(self) -> str:
+        """Run ID shared by every attempt of the run."""
+        return self.entry["extract_run_id"]
+
+    @property
+    def window_days(self) -> int:
+        """Window size of the run's tasks."""
+        return self.entry["window_days"]
+
+    @property
+    def completed_tasks(self) -> list[tuple[str | None, str, str]]:
+        """Committed (account, start_date, end_date) tasks, in date then account order."""
+        with self._lock:
+            return sorted(self._completed, key=lambda t: (t[1], t[0] or ""))
+
+    def is_done(self, task) -> bool:
+        """Whether an (account, start_date, end_date) task is committed."""
+        return (task.account, task.start_date, task.end_date) in self._completed
+
+    def pending(self, tasks: Iterable) -> list:
+        """
+        Drop the committed tasks from a plan.
+
+        Args:
+            tasks: Planned ExtractTask tuples
+
+        Returns:
+            Tasks still to extract, in the same order
+        """
+        tasks = list(tasks)
+        remaining = [task for task in tasks if not self.is_done(task)]
+        self.skipped_tasks = len(tasks) - len(remaining)
+        if self.skipped_tasks:
+            logger.info("%s: skipping %d committed tasks, %d left",
+                        self.key, self.skipped_tasks, len(remaining))
+        return remaining
+
+    def commit(self, task) -> None:
+        """
+        Record a task whose rows are loaded, and persist the checkpoint.
+
+        Args:
+            task: ExtractTask (account, start_date, end_date)
+        """
+        with self._lock:
+            self._completed.add((task.account, task.start_date, task.end_date))
+            self.entry["completed_tasks"] = sorted(self._completed, key=lambda t: (t[1], t[0] or ""))
+            self.entry["updated_at"] = datetime.now(tz=timezone.utc).isoformat()
+            self.store._save(self.key, self.entry)  # pylint: disable=protected-access
+
+    def finish(self) -> None:
+        """Clear the checkpoint once the run is complete (a later run starts over)."""
+        self.store._save(self.key, None)  # pylint: disable=protected-access
+        logger.info("%s: run complete, checkpoint cleared", self.key)
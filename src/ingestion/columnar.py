@@ -0,0 +1,107 @@
+"""
+Columnar (Arrow / Parquet) serialization for raw-zone loads.
+
+JSON loads serialize every row as text and repeat each key — and the run
+metadata (`ingested_at`, `extract_run_id`, `source`) — on every row. This module
+builds one Arrow record batch per load instead: metrics are typed columns and
+metadata columns are dictionary-encoded, so a constant value is stored once.
+The batch is written as compressed Parquet and loaded with `load_table_from_file`.
+
+pyarrow is optional: when it is not installed, connectors fall back to JSON loads.
+"""
+
+import io
+import logging
+from collections.abc import Sequence
+from typing import Any
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion.schemas import METADATA_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    logging.warning("pyarrow not available, raw loads will use JSON")
+
+logger = logging.getLogger(__name__)
+
+# Codec used for Parquet loads (supported by BigQuery)
+PARQUET_COMPRESSION = "zstd"
+
+_METADATA_NAMES = frozenset(field.name for field in METADATA_FIELDS)
+
+
+def _arrow_type(field_type: str):
+    """Map a BigQuery column type to its Arrow type."""
+    return {
+        "STRING": pa.string(),
+        "INTEGER": pa.int64(),
+        "FLOAT": pa.float64(),
+        "DATE": pa.date32(),
+        "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    }[field_type]
+
+
+def _to_array(values: list, field_type: str) -> "pa.Array":
+    """Build an Arrow array, parsing DATE and TIMESTAMP ISO strings column-wise."""
+    arrow_type = _arrow_type(field_type)
+    if field_type in ("DATE", "TIMESTAMP"):
+        return pa.array(values, type=pa.string()).cast(arrow_type)
+    return pa.array(values, type=arrow_type)
+
+
+def _constant_column(value: Any, field_type: str, length: int) -> "pa.DictionaryArray":
+    """Build a dictionary-encoded column repeating a single value."""
+    indices = pa.repeat(pa.scalar(0, type=pa.int8()), length)
+    return pa.DictionaryArray.from_arrays(indices, _to_array([value], field_type))
+
+
+def to_record_batch(rows: Sequence[dict], schema: list[bigquery.SchemaField],
+                    run_metadata: dict[str, Any] | None = None) -> "pa.RecordBatch":
+    """
+    Build an Arrow record batch from rows already coerced by `coerce_rows()`.
+
+    Metadata columns are dictionary-encoded. When `run_metadata` is given, they
+    are built from it as constant columns (one dictionary entry, zero indices)
+    without reading any row; otherwise their values are read from the rows.
+
+    Args:
+        rows: Coerced rows (missing keys are NULL)
+        schema: Schema of the target raw table
+        run_metadata: Coerced metadata shared by every row (optional)
+
+    Returns:
+        Arrow record batch with one column per schema field
+    """
+    arrays = []
+    fields = []
+    for field in schema:
+        if field.name in _METADATA_NAMES and run_metadata is not None:
+            array = _constant_column(run_metadata[field.name], field.field_type, len(rows))
+        else:
+            array = _to_array([row.get(field.name) for row in rows], field.field_type)
+            if field.name in _METADATA_NAMES:
+                array = array.dictionary_encode()
+
+        arrays.append(array)
+        fields.append(pa.field(field.name, array.type, nullable=field.mode != "REQUIRED"))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+
+def to_parquet_bytes(batch: "pa.RecordBatch", compression: str = PARQUET_COMPRESSION) -> bytes:
+    """
+    Serialize a record batch as a compressed Parquet file.
+
+    Args:
+        batch: Arrow record batch
+        compression: Parquet codec
+
+    Returns:
+        Parquet file content
+    """
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_batches([batch]), buffer, compression=compression)
+    return buffer.getvalue()
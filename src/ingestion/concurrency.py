@@ -0,0 +1,292 @@
+"""
+Concurrency of connector runs: bounded thread pool and API call control.
+
+`run_concurrently` runs extraction tasks and partition loads on a bounded
+pool, handing results back as they finish. `ConcurrencyController` paces the
+API calls of every extraction thread of a connector per account (token
+bucket, adaptive concurrency limit, pause after throttling), so API limits
+hold across windows.
+"""
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# API call control (see ConcurrencyController) — in-flight calls per account start
+# at DEFAULT_API_CONCURRENCY and adapt between 1 and DEFAULT_API_MAX_CONCURRENCY
+DEFAULT_API_CONCURRENCY = 4
+DEFAULT_API_MAX_CONCURRENCY = 16
+# Reported quota usage (percent) above which concurrency is cut
+API_USAGE_HIGH_PERCENT = 75.0
+# Pause applied after a throttling error that does not say when to retry
+API_THROTTLE_BACKOFF_SECONDS = 60.0
+# Retries of a throttled call before giving up
+API_THROTTLE_RETRIES = 5
+
+
+def run_concurrently(func: Callable, items: list, max_workers: int) -> Iterator[tuple[Any, Any]]:
+    """
+    Apply `func` to every item on a bounded thread pool, yielding results as they finish.
+
+    At most `max_workers` calls are in flight and no further call is submitted
+    until the caller has consumed a result, so memory stays bounded by the
+    number of workers even when the consumer is slower than the producers.
+
+    Args:
+        func: Function called with one item
+        items: Items to process
+        max_workers: Maximum number of concurrent calls
+
+    Yields:
+        (item, result) tuples in completion order
+
+    Raises:
+        Exception: The first exception raised by `func`; pending calls are cancelled
+    """
+    pending_items = iter(items)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        in_flight = {}
+        for item in pending_items:
+            in_flight[executor.submit(func, item)] = item
+            if len(in_flight) >= max_workers:
+                break
+
+        try:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    yield item, future.result()
+                    next_item = next(pending_items, None)
+                    if next_item is not None:
+                        in_flight[executor.submit(func, next_item)] = next_item
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+@dataclass(frozen=True)
+class _AIMDPolicy:
+    """Adaptive concurrency limit: start, ceiling, and the multiplicative decrease on throttling signals."""
+
+    initial: int
+    maximum: int
+    usage_high_percent: float
+    decrease_factor: float
+
+    def increase(self, limit: float) -> float:
+        """Additive increase: about +1 per round of `limit` successful calls."""
+        return min(self.maximum, limit + 1 / limit)
+
+    def decrease(self, limit: float) -> float:
+        """Multiplicative decrease, never below one call in flight."""
+        return max(1.0, limit * self.decrease_factor)
+
+
+class _AccountLimiter:  # pylint: disable=too-few-public-methods
+    """Token bucket, adaptive concurrency limit and metrics of one account."""
+
+    def __init__(self, limit: float, burst: float):
+        self.condition = threading.Condition()
+        self.limit = limit
+        self.in_flight = 0
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.paused_until = 0.0
+        self.metrics = {"calls": 0, "throttled_calls": 0, "retries": 0,
+                        "working_seconds": 0.0, "throttled_seconds": 0.0}
+
+
+class ConcurrencyController:
+    """
+    Rate-limit-aware control of API calls, shared by every window of a connector.
+
+    Each account (ad account, customer ID) gets:
+    - a token bucket: at most `rate_per_second` calls start per second
+    - an AIMD concurrency limit: each successful call under the usage threshold
+      adds 1/limit (about +1 per round of calls); a usage report above
+      `usage_high_percent` or a throttling error halves it
+    - a pause: after a throttling error, no call starts before the retry delay
+
+    Metrics separate the time spent waiting for a slot (throttled) from the
+    time spent inside API calls (working).
+    """
+
+    def __init__(self, rate_per_second: float | None = None, *,  # pylint: disable=too-many-arguments
+                 initial_concurrency: int = DEFAULT_API_CONCURRENCY,
+                 max_concurrency: int = DEFAULT_API_MAX_CONCURRENCY,
+                 usage_high_percent: float = API_USAGE_HIGH_PERCENT,
+                 decrease_factor: float = 0.5,
+                 throttle_backoff_seconds: float = API_THROTTLE_BACKOFF_SECONDS):
+        """
+        Args:
+            rate_per_second: Calls started per second and per account (None: no rate limit)
+            initial_concurrency: In-flight calls allowed per account at start
+            max_concurrency: Upper bound of the adaptive concurrency limit
+            usage_high_percent: Quota usage above which concurrency is decreased
+            decrease_factor: Multiplier applied to the limit on throttling signals
+            throttle_backoff_seconds: Pause after a throttling error without retry delay
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = max(1.0, rate_per_second or 1.0)
+        self.aimd = _AIMDPolicy(
+            initial=max(1, min(initial_concurrency, max_concurrency)),
+            maximum=max_concurrency,
+            usage_high_percent=usage_high_percent,
+            decrease_factor=decrease_factor,
+        )
+        self.throttle_backoff_seconds = throttle_backoff_seconds
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, account: str) -> _AccountLimiter:
+        with self._lock:
+            if account not in self._accounts:
+                self._accounts[account] = _AccountLimiter(self.aimd.initial, self.burst)
+            return self._accounts[account]
+
+    def acquire(self, account: str) -> None:
+        """Block until a call may start for this account (pause, slot and token)."""
+        limiter = self._limiter(account)
+        started = time.monotonic()
+        with limiter.condition:
+            while True:
+                now = time.monotonic()
+                if self.rate_per_second:
+                    elapsed = now - limiter.refilled_at
+                    limiter.tokens = min(self.burst, limiter.tokens + elapsed * self.rate_per_second)
+                    limiter.refilled_at = now
+
+                if now < limiter.paused_until:
+                    timeout = limiter.paused_until - now
+                elif limiter.in_flight >= int(limiter.limit):
+                    timeout = None  # woken up by release()
+                elif self.rate_per_second and limiter.tokens < 1:
+                    timeout = (1 - limiter.tokens) / self.rate_per_second
+                else:
+                    if self.rate_per_second:
+                        limiter.tokens -= 1
+                    limiter.in_flight += 1
+                    limiter.metrics["calls"] += 1
+                    limiter.metrics["throttled_seconds"] += now - started
+                    return
+                limiter.condition.wait(timeout)
+
+    def release(self, account: str, working_seconds: float = 0.0) -> None:
+        """Free the slot of a finished call."""
+        limiter = self._limiter(account)
+        with limiter.condition:
+            limiter.in_flight -= 1
+            limiter.metrics["working_seconds"] += working_seconds
+            limiter.condition.notify_all()
+
+    def record_usage(self, account: str, usage_percent: float | None = None,
+                     retry_after: float | None = None) -> None:
+        """
+        Feed the quota usage reported with a successful response.
+
+        Args:
+            account: Account the call was made for
+            usage_percent: Highest quota usage reported (0-100), if any
+            retry_after: Seconds before the quota frees up, when the API says so
+        """
+        limiter = self._limiter(account)
+        with limiter.condition:
+            if usage_percent is not None and usage_percent >= self.aimd.usage_high_percent:
+                limiter.limit = self.aimd.decrease(limiter.limit)
+                if retry_after:
+                    limiter.paused_until = max(limiter.paused_until, time.monotonic() + retry_after)
+                logger.info("API usage at %.0f%% for %s: concurrency limit %d",
+                            usage_percent, account, int(limiter.limit))
+            else:
+                limiter.limit = self.aimd.increase(limiter.limit)
+            limiter.condition.notify_all()
+
+    def record_throttle(self, account: str, retry_after: float | None = None) -> None:
+        """
+        Register a throttling error: cut concurrency and pause the account.
+
+        Args:
+            account: Account the call was made for
+            retry_after: Seconds to wait before the next call (default throttle_backoff_seconds)
+        """
+        limiter = self._limiter(account)
+        delay = retry_after if retry_after is not None else self.throttle_backoff_seconds
+        with limiter.condition:
+            limiter.limit = self.aimd.decrease(limiter.limit)
+            limiter.paused_until = max(limiter.paused_until, time.monotonic() + delay)
+            limiter.metrics["throttled_calls"] += 1
+            limiter.condition.notify_all()
+        logger.warning("API throttled for %s: pausing %.0fs, concurrency limit %d",
+                       account, delay, int(limiter.limit))
+
+    def call(self, account: str, func: Callable, *args,
+             throttle_delay: Callable[[Exception], float | None] | None = None,
+             usage: Callable[[Any], tuple[float | None, float | None]] | None = None,
+             max_retries: int = API_THROTTLE_RETRIES, **kwargs) -> Any:
+        """
+        Run one API call under the account's limits, retrying throttled calls.
+
+        Args:
+            account: Account the call is made for
+            func: Function issuing the request
+            *args, **kwargs: Arguments of `func`
+            throttle_delay: Classifies errors — returns the retry delay in seconds
+                (0 if unknown) for a throttling error, None for any other error
+            usage: Reads (usage percent, retry after) from the call result
+            max_retries: Throttled attempts retried before the error is raised
+
+        Returns:
+            Result of `func`
+
+        Raises:
+            Exception: Errors that are not throttling, or throttling after max_retries
+        """
+        attempt = 0
+        while True:
+            self.acquire(account)
+            started = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # SDK errors vary per source; throttle_delay decides, others are re-raised
+                delay = throttle_delay(e) if throttle_delay else None
+                if delay is None or attempt >= max_retries:
+                    raise
+                attempt += 1
+                self.record_throttle(account, delay or None)
+                limiter = self._limiter(account)
+                with limiter.condition:
+                    limiter.metrics["retries"] += 1
+                continue
+            finally:
+                self.release(account, time.monotonic() - started)
+
+            self.record_usage(account, *(usage(result) if usage else (None, None)))
+            return result
+
+    def metrics(self) -> dict[str, Any]:
+        """
+        Call metrics per account and in total.
+
+        Returns:
+            Dictionary with "accounts" ({account: calls, throttled_calls, retries,
+            working_seconds, throttled_seconds, concurrency_limit}) and the totals
+        """
+        with self._lock:
+            limiters = dict(self._accounts)
+        accounts = {
+            account: {**limiter.metrics, "concurrency_limit": int(limiter.limit)}
+            for account, limiter in limiters.items()
+        }
+        totals = {
+            key: sum(metrics[key] for metrics in accounts.values())
+            for key in ("calls", "throttled_calls", "retries", "working_seconds", "throttled_seconds")
+        }
+        return {"accounts": accounts, **totals}
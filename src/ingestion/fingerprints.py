@@ -0,0 +1,181 @@
+"""
+Row fingerprints, to skip re-pulled partitions whose content did not change.
+
+Late-data re-pulls extract the last days again although nearly every row
+comes back identical. Each raw row is stored with `row_fingerprint`, a stable
+64-bit hash of its source columns (everything but the ingestion metadata).
+A date partition is summarized by its row count and the XOR of its row
+fingerprints, which BigQuery computes with `BIT_XOR` on the partition alone:
+when the digest of the freshly extracted rows matches the stored one, the
+partition is left as is instead of being rewritten.
+
+A partition left as is keeps its old load time, so each match is recorded in
+the `partition_checks` control table: the backfill planner reads it to know
+the partition was verified against the source (see ingestion.backfill).
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from hashlib import blake2b
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion.schemas import FINGERPRINT_FIELD, METADATA_FIELDS
+
+FINGERPRINT_COLUMN = FINGERPRINT_FIELD.name
+
+_EXCLUDED = frozenset(field.name for field in METADATA_FIELDS) | {FINGERPRINT_COLUMN}
+
+DIGESTS_QUERY = """
+    SELECT
+        CAST(date AS STRING) AS date,
+        COUNT(*) AS row_count,
+        BIT_XOR(row_fingerprint) AS digest,
+        COUNTIF(row_fingerprint IS NULL) AS unfingerprinted
+    FROM `{table_id}`
+    WHERE date IN UNNEST(@dates)
+    GROUP BY date
+"""
+
+# Control table of the partitions verified unchanged, next to the raw tables
+CHECKS_TABLE = "partition_checks"
+
+CHECKS_SCHEMA = [
+    bigquery.SchemaField("table_name", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("row_count", "INTEGER"),
+    bigquery.SchemaField("checked_at", "TIMESTAMP", mode="REQUIRED"),
+]
+
+CHECKS_QUERY = """
+    SELECT CAST(date AS STRING) AS date, MAX(checked_at) AS checked_at
+    FROM `{table_id}`
+    WHERE table_name = @table_name
+    GROUP BY date
+"""
+
+
+def fingerprint_columns(schema: list[bigquery.SchemaField]) -> tuple[str, ...]:
+    """
+    Columns covered by the fingerprint: the source columns, in schema order.
+
+    Args:
+        schema: Raw table schema
+
+    Returns:
+        Column names, without the metadata and fingerprint columns
+    """
+    return tuple(field.name for field in schema if field.name not in _EXCLUDED)
+
+
+def row_fingerprint(row: dict, columns: tuple[str, ...]) -> int:
+    """
+    Stable 64-bit hash of a coerced row's source columns.
+
+    Rows must be coerced (see ingestion.schemas.coerce_rows) so that equal
+    values always have the same type and representation.
+
+    Args:
+        row: Coerced row (missing keys are NULL)
+        columns: Fingerprinted columns (see fingerprint_columns)
+
+    Returns:
+        Signed 64-bit integer (BigQuery INT64)
+    """
+    payload = "\x1f".join(repr(row.get(name)) for name in columns).encode()
+    return int.from_bytes(blake2b(payload, digest_size=8).digest(), "big", signed=True)
+
+
+def partition_digest(fingerprints: Iterable[int]) -> tuple[int, int]:
+    """
+    Order-independent digest of a partition: (row count, XOR of the fingerprints).
+
+    Args:
+        fingerprints: Row fingerprints of the partition
+
+    Returns:
+        (row_count, digest), comparable to the output of fetch_partition_digests
+    """
+    count = digest = 0
+    for fingerprint in fingerprints:
+        count += 1
+        digest ^= fingerprint
+    return count, digest
+
+
+def fetch_partition_digests(client: bigquery.Client, table_id: str,
+                            dates: list[str]) -> dict[str, tuple[int, int]]:
+    """
+    Read the digests of stored partitions, scanning only those partitions.
+
+    Partitions holding rows loaded before fingerprints existed are left out,
+    so they always count as changed.
+
+    Args:
+        client: BigQuery client
+        table_id: Fully qualified raw table ID
+        dates: Dates (YYYY-MM-DD) of the partitions
+
+    Returns:
+        {date: (row_count, digest)} for the fingerprinted partitions that exist
+    """
+    if not dates:
+        return {}
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ArrayQueryParameter("dates", "DATE", sorted(dates))]
+    )
+    rows = client.query(DIGESTS_QUERY.format(table_id=table_id), job_config=job_config).result()
+    return {
+        row["date"]: (row["row_count"], row["digest"])
+        for row in rows
+        if row["unfingerprinted"] == 0
+    }
+
+
+def record_partition_checks(client: bigquery.Client, dataset_ref: str, table_name: str,
+                            row_counts: dict[str, int]) -> None:
+    """
+    Record that partitions were found identical to a fresh extraction.
+
+    Args:
+        client: BigQuery client
+        dataset_ref: Dataset of the raw table (ex: "project.mdp_raw")
+        table_name: Raw table name (ex: "meta_ads_campaign_daily")
+        row_counts: {date (YYYY-MM-DD): row count} of the unchanged partitions
+    """
+    if not row_counts:
+        return
+    table_id = f"{dataset_ref}.{CHECKS_TABLE}"
+    client.create_table(bigquery.Table(table_id, schema=CHECKS_SCHEMA), exists_ok=True)
+    checked_at = datetime.now(tz=timezone.utc).isoformat()
+    rows = [
+        {"table_name": table_name, "date": day, "row_count": count, "checked_at": checked_at}
+        for day, count in sorted(row_counts.items())
+    ]
+    job_config = bigquery.LoadJobConfig(
+        schema=CHECKS_SCHEMA,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+    )
+    client.load_table_from_json(rows, table_id, job_config=job_config).result()
+
+
+def fetch_partition_checks(client: bigquery.Client, dataset_ref: str, table_name: str) -> dict[str, datetime]:
+    """
+    Read when each partition of a raw table was last verified unchanged.
+
+    Args:
+        client: BigQuery client
+        dataset_ref: Dataset of the raw table (ex: "project.mdp_raw")
+        table_name: Raw table name
+
+    Returns:
+        {date (YYYY-MM-DD): last check time}, empty when nothing was recorded yet
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter("table_name", "STRING", table_name)]
+    )
+    query = CHECKS_QUERY.format(table_id=f"{dataset_ref}.{CHECKS_TABLE}")
+    try:
+        rows = client.query(query, job_config=job_config).result()
+    except NotFound:
+        return {}
+    return {row["date"]: row["checked_at"] for row in rows}
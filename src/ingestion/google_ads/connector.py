@@ -4,15 +4,20 @@ Google Ads data source connector.
 Extracts daily campaign performance data from the Google Ads API and loads it
 into the BigQuery raw zone (mdp_raw). Falls back to a fake API when real
 credentials are not available, allowing development without a live account.
-Real API extraction via GAQL is not yet implemented (see _extract_real_api).
+
+Real API extraction runs a GAQL query through `GoogleAdsService.search_stream`:
+the response is streamed in batches and each batch is converted into raw-zone
+records as it arrives, so the full response is never buffered.
 """
 # pylint: disable=import-error
 
 import logging
 import os
-from typing import Optional
-from ingestion.base import DataSourceConnector
-from fake_apis.google_ads_api import get_campaign_daily
+from collections.abc import Iterator
+from ingestion.base import DataSourceConnector, accounts_from_env
+from ingestion.records import GoogleAdsCampaignDaily
+from fake_apis.google_ads_api import get_campaign_daily, iter_campaign_daily, list_accounts
+from fake_apis.google_ads_recorded import RestGoogleAdsClient
 
 # Real API imports — only available when google-ads is installed
 try:
@@ -24,28 +29,88 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Campaign × day metrics — one row per campaign per day with segments.date
+CAMPAIGN_DAILY_QUERY = """
+    SELECT
+        customer.id,
+        campaign.id,
+        campaign.name,
+        segments.date,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.conversions,
+        metrics.cost_micros
+    FROM campaign
+    WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'
+"""
+
+# Client accounts under a manager account (run against the manager customer ID)
+CUSTOMER_CLIENTS_QUERY = """
+    SELECT customer_client.id
+    FROM customer_client
+    WHERE customer_client.manager = FALSE AND customer_client.status = 'ENABLED'
+"""
+
+# Campaigns of an account, to estimate its size
+CAMPAIGN_COUNT_QUERY = """
+    SELECT campaign.id
+    FROM campaign
+    WHERE campaign.status != 'REMOVED'
+"""
+
+
+def _throttle_delay(error: Exception) -> float | None:
+    """Retry delay of a Google Ads quota error (0: default backoff), None for other errors."""
+    # GoogleAdsException wraps the gRPC call; api_core raises ResourceExhausted directly
+    call = getattr(error, "error", None)
+    status = call.code().name if call is not None and hasattr(call, "code") else type(error).__name__
+    return 0 if status in ("RESOURCE_EXHAUSTED", "ResourceExhausted") else None
+
 
 class GoogleAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-methods
     """Connector for extracting raw Google Ads data."""
 
-    def __init__(self, use_real_api: bool = False):
+    # GAQL queries handle long ranges well — fewer, larger windows
+    window_days = 92
+    max_workers = 8
+
+    def __init__(self, use_real_api: bool = False, client=None, accounts: list[str] | None = None):
         """
         Initialize the Google Ads connector.
 
         Args:
             use_real_api: If True, use real Google Ads API. If False, use fake API.
+            client: Ready-made Google Ads client (or a stand-in such as
+                RecordedGoogleAdsClient) — skips credential loading
+            accounts: Customer IDs to extract — defaults to GOOGLE_ADS_CUSTOMER_IDS, then
+                to the clients of GOOGLE_ADS_LOGIN_CUSTOMER_ID, then to GOOGLE_ADS_CUSTOMER_ID
+
+        With use_real_api, GOOGLE_ADS_API_BASE_URL sends the queries to a REST
+        searchStream endpoint (ex: fake_apis.http_server) instead of the SDK.
         """
-        super().__init__(source_name="google_ads")
-        self.use_real_api = use_real_api and GOOGLE_ADS_AVAILABLE
+        accounts = accounts or accounts_from_env("GOOGLE_ADS_CUSTOMER_IDS")
+        super().__init__(source_name="google_ads", accounts=[a.replace("-", "") for a in accounts])
+        base_url = os.getenv("GOOGLE_ADS_API_BASE_URL")
+        if client is None and use_real_api and base_url:
+            # The SDK only speaks gRPC: a REST endpoint is queried without it
+            logger.info("Routing Google Ads queries to %s", base_url)
+            client = RestGoogleAdsClient(base_url)
+        self.use_real_api = client is not None or (use_real_api and GOOGLE_ADS_AVAILABLE)
+        self.customer_id = os.getenv("GOOGLE_ADS_CUSTOMER_ID", "").replace("-", "")
+        self.login_customer_id = os.getenv("GOOGLE_ADS_LOGIN_CUSTOMER_ID", "").replace("-", "")
+        self._campaign_counts = {}
 
-        if self.use_real_api:
+        if client is not None:
+            logger.info("Using provided Google Ads client")
+            self._client = client
+        elif self.use_real_api:
             logger.info("Using real Google Ads API")
             self._client = self._init_real_client()
         else:
             logger.info("Using fake Google Ads API")
             self._client = None
 
-    def _init_real_client(self) -> Optional[GoogleAdsClient]:
+    def _init_real_client(self) -> "GoogleAdsClient | None":
         """Initialize the real Google Ads API client from environment variables."""
         try:
             credentials = {
@@ -59,6 +124,9 @@ class GoogleAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public
             if not all(credentials.values()):
                 logger.warning("Missing Google Ads credentials in environment variables")
                 return None
+            if self.login_customer_id:
+                # Required to query client accounts through a manager account
+                credentials["login_customer_id"] = self.login_customer_id
 
             return GoogleAdsClient.load_from_dict(credentials)
 
@@ -67,11 +135,18 @@ class GoogleAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public
             logger.error("Failed to initialize Google Ads client: %s", e)
             return None
 
+    @property
+    def _uses_ads_client(self) -> bool:
+        """Whether rows come from the Google Ads API (a client is configured)."""
+        return bool(self.use_real_api and self._client)
+
     def extract(self, start_date: str, end_date: str) -> list[dict]:
         """
         Extract Google Ads data.
 
         Uses real API if available and configured, otherwise falls back to fake API.
+        Dates held by the response cache are served from it, and extracted
+        ranges are archived (see extract_cached_pages()).
 
         Args:
             start_date: Start date in YYYY-MM-DD format
@@ -80,19 +155,157 @@ class GoogleAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public
         Returns:
             List of dictionaries containing campaign data
         """
-        if self.use_real_api and self._client:
+        if self.response_cache is not None or self.archive is not None:
+            return [row for page in self.extract_cached_pages(start_date, end_date) for row in page]
+        if self._uses_ads_client:
             return self._extract_real_api(start_date, end_date)
         return self._extract_fake_api(start_date, end_date)
 
-    def _extract_real_api(self, start_date: str, end_date: str) -> list[dict]:
+    def extract_pages(self, start_date: str, end_date: str,
+                      account: str | None = None) -> Iterator[list[dict]]:
+        """
+        Extract Google Ads data page by page (chunks of whole days in fake mode).
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            account: Customer ID (default: GOOGLE_ADS_CUSTOMER_ID, or every fake account)
+
+        Yields:
+            Lists of dictionaries containing campaign data
+        """
+        if self._uses_ads_client:
+            yield from self._iter_real_api_pages(start_date, end_date, account or self.customer_id)
+            return
+        yield from iter_campaign_daily(start_date, end_date, account_id=account)
+
+    def cache_fields(self) -> tuple[str, ...]:
+        """Campaign query and the API the rows come from (response cache key)."""
+        return (" ".join(CAMPAIGN_DAILY_QUERY.split()), "real_api" if self._uses_ads_client else "fake_api")
+
+    def default_account(self) -> str | None:
+        """Customer ID extracted when none is given (GOOGLE_ADS_CUSTOMER_ID; fake API: every account)."""
+        return (self.customer_id or None) if self._uses_ads_client else None
+
+    def discover_accounts(self) -> list[str]:
         """
-        Extract data from real Google Ads API.
+        List the enabled client accounts of the manager account (GOOGLE_ADS_LOGIN_CUSTOMER_ID).
+
+        With the fake API, the simulated accounts are returned when there are
+        several (FAKE_ADS_ACCOUNTS).
 
-        TODO: implement real API calls using GAQL (Google Ads Query Language)
+        Returns:
+            Customer IDs, empty when no manager account is configured
         """
-        logger.info("Extracting Google Ads data from real API (NOT IMPLEMENTED YET)")
-        logger.info("Would extract from %s to %s", start_date, end_date)
-        return []
+        if not self.use_real_api:
+            accounts = list_accounts()
+            return accounts if len(accounts) > 1 else []
+        if not (self._client and self.login_customer_id):
+            return []
+
+        rows = self._search(self.login_customer_id, CUSTOMER_CLIENTS_QUERY)
+        accounts = [str(row.customer_client.id) for row in rows]
+        logger.info("Discovered %d Google Ads accounts under manager %s", len(accounts), self.login_customer_id)
+        return accounts
+
+    def estimate_account_size(self, account: str) -> int:
+        """
+        Number of campaigns in a customer account (campaign-days per day).
+
+        Args:
+            account: Customer ID
+
+        Returns:
+            Campaign count, queried once per account
+        """
+        if not self._uses_ads_client:
+            return 1
+        if account not in self._campaign_counts:
+            self._campaign_counts[account] = sum(1 for _ in self._search(account, CAMPAIGN_COUNT_QUERY))
+        return self._campaign_counts[account]
+
+    def _search(self, customer_id: str, query: str) -> Iterator:
+        """Run a small GAQL query under the customer's rate limits and iterate over its rows."""
+        service = self._client.get_service("GoogleAdsService")
+        batches = self.controller.call(
+            customer_id,
+            lambda: list(service.search_stream(customer_id=customer_id, query=query)),
+            throttle_delay=_throttle_delay,
+        )
+        for batch in batches:
+            yield from batch.results
+
+    def _extract_real_api(self, start_date: str, end_date: str) -> list[GoogleAdsCampaignDaily]:
+        """
+        Extract daily campaign metrics from real Google Ads API.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+
+        Returns:
+            List of campaign daily performance records
+        """
+        records = [
+            record
+            for page in self._iter_real_api_pages(start_date, end_date, self.customer_id)
+            for record in page
+        ]
+        logger.info("Extracted %d records from real Google Ads API", len(records))
+        return records
+
+    def _iter_real_api_pages(self, start_date: str, end_date: str,
+                             customer_id: str) -> Iterator[list[GoogleAdsCampaignDaily]]:
+        """
+        Stream GAQL results from the real Google Ads API, one batch at a time.
+
+        `search_stream` returns the whole result set over a single call, in
+        batches of up to 10,000 rows; each batch is converted as soon as it is
+        received, so only one batch is held in memory at a time. Opening the
+        stream goes through the connector's controller: quota errors
+        (RESOURCE_EXHAUSTED) pause the customer and retry.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            customer_id: Customer ID of the account
+
+        Yields:
+            Lists of campaign daily performance records
+        """
+        logger.info("Extracting Google Ads data from real API (%s, %s to %s)", customer_id, start_date, end_date)
+
+        query = CAMPAIGN_DAILY_QUERY.format(start_date=start_date, end_date=end_date)
+
+        def open_stream():
+            # Quota errors surface on the first batch: the stream is retried until it starts
+            stream = iter(self._client.get_service("GoogleAdsService").search_stream(
+                customer_id=customer_id, query=query
+            ))
+            return next(stream, None), stream
+
+        first_batch, stream = self.controller.call(customer_id, open_stream, throttle_delay=_throttle_delay)
+        if first_batch is None:
+            return
+        yield [self._to_record(row) for row in first_batch.results]
+        for batch in stream:
+            yield [self._to_record(row) for row in batch.results]
+
+    @staticmethod
+    def _to_record(row) -> GoogleAdsCampaignDaily:
+        """Convert one GoogleAdsRow into a raw-zone record."""
+        metrics = row.metrics
+        return GoogleAdsCampaignDaily(
+            date=row.segments.date,
+            campaign_id=str(row.campaign.id),
+            campaign_name=row.campaign.name,
+            impressions=int(metrics.impressions),
+            clicks=int(metrics.clicks),
+            # Conversions are fractional with data-driven attribution
+            conversions=float(metrics.conversions),
+            cost_usd=int(metrics.cost_micros) / 1_000_000,
+            account_id=str(row.customer.id),
+        )
 
     def _extract_fake_api(self, start_date: str, end_date: str) -> list[dict]:
         """
@@ -115,7 +328,8 @@ class GoogleAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public
 connector = GoogleAdsConnector()
 
 
-def run(start_date: str, end_date: str) -> list[dict]:
+def run(start_date: str, end_date: str,
+        window_days: int | None = None, max_workers: int | None = None) -> list[dict]:
     """
     Execute the complete Google Ads ingestion pipeline.
 
@@ -126,8 +340,10 @@ def run(start_date: str, end_date: str) -> list[dict]:
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format (inclusive)
+        window_days: Days per extraction window (defaults to the connector setting)
+        max_workers: Concurrent extractions (defaults to the connector setting)
 
     Returns:
         List of enriched dictionaries loaded to BigQuery
     """
-    return connector.run(start_date, end_date)
+    return connector.run(start_date, end_date, window_days=window_days, max_workers=max_workers)
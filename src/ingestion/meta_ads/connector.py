@@ -4,15 +4,28 @@ Meta Ads (Facebook/Instagram) data source connector.
 Extracts daily campaign performance data from the Meta Marketing API and loads
 it into the BigQuery raw zone (mdp_raw). Falls back to a fake API when real
 credentials are not available, allowing development without a live account.
-Real API extraction via facebook-business SDK is not yet implemented (see _extract_real_api).
+
+Insights are fetched in one of two modes, picked per extraction from the
+estimated number of rows (days × campaigns):
+- sync: `get_insights()` paged with a cursor — fast on small ranges, but
+  times out when a range holds too many campaign-days
+- async: the extraction window is split into report windows of
+  `async_report_days` days, one report run (`AdReportRun`) each, submitted up
+  front and polled together; result pages are streamed as each report completes
 """
 # pylint: disable=import-error
 
+import json
 import logging
 import os
+import time
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from itertools import islice
 
-from ingestion.base import DataSourceConnector
-from fake_apis.meta_ads_api import get_campaign_daily
+from ingestion.base import DataSourceConnector, accounts_from_env, split_date_range
+from ingestion.records import MetaAdsCampaignDaily
+from fake_apis.meta_ads_api import get_campaign_daily, iter_campaign_daily, list_accounts
 
 # Check if facebook-business SDK is installed
 try:
@@ -24,21 +37,113 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Number of insights rows requested per API page
+PAGE_SIZE = 500
+
+# Estimated rows (days × campaigns) above which insights use async report runs
+ASYNC_ROW_THRESHOLD = 20_000
+
+# Async report runs: days per report, in flight per extraction, status polling interval and timeout
+ASYNC_REPORT_DAYS = 7
+MAX_ASYNC_REPORTS = 4
+ASYNC_POLL_SECONDS = 5.0
+ASYNC_TIMEOUT_SECONDS = 3600.0
+
+INSIGHTS_FIELDS = ["account_id", "campaign_id", "campaign_name", "impressions", "clicks", "spend", "actions"]
+
+# Graph API error codes meaning "too many calls" (app, user, ad account and business use case limits)
+THROTTLE_ERROR_CODES = frozenset({4, 17, 32, 613, *range(80000, 80015)})
+
+
+def parse_usage_headers(headers: Mapping[str, str] | None) -> tuple[float | None, float | None]:
+    """
+    Read quota usage from Meta response headers.
+
+    Reads `X-Business-Use-Case-Usage` ({business_id: [{call_count, total_cputime,
+    total_time, estimated_time_to_regain_access (minutes)}]}) and
+    `X-Ad-Account-Usage` ({acc_id_util_pct, reset_time_duration (seconds)}).
+
+    Args:
+        headers: Response headers (any case)
+
+    Returns:
+        (highest usage percent, seconds before access is regained) — None when not reported
+    """
+    headers = {name.lower(): value for name, value in (headers or {}).items()}
+    usages, waits = [], []
+
+    for entries in json.loads(headers.get("x-business-use-case-usage") or "{}").values():
+        for entry in entries:
+            usages += [entry.get(key, 0) for key in ("call_count", "total_cputime", "total_time")]
+            waits.append(entry.get("estimated_time_to_regain_access", 0) * 60)
+
+    account_usage = json.loads(headers.get("x-ad-account-usage") or "{}")
+    if "acc_id_util_pct" in account_usage:
+        usages.append(account_usage["acc_id_util_pct"])
+        waits.append(account_usage.get("reset_time_duration", 0))
+
+    return max(usages, default=None), max(waits, default=0) or None
+
+
+def _throttle_delay(error: Exception) -> float | None:
+    """Retry delay of a Meta throttling error (0 if unknown), None for other errors."""
+    code = getattr(error, "api_error_code", lambda: None)()
+    if code not in THROTTLE_ERROR_CODES:
+        return None
+    _, retry_after = parse_usage_headers(getattr(error, "http_headers", lambda: None)())
+    return retry_after or 0
 
-class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-methods
+
+class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """Connector for extracting raw Meta Ads data (Facebook/Instagram)."""
 
-    def __init__(self, use_real_api: bool = False):
+    # Synchronous insights calls with time_increment=1 time out on long ranges
+    window_days = 31
+    max_workers = 4
+
+    async_row_threshold = ASYNC_ROW_THRESHOLD
+    async_report_days = ASYNC_REPORT_DAYS
+    async_poll_seconds = ASYNC_POLL_SECONDS
+
+    # Calls started per second per ad account; concurrency then follows the usage headers
+    api_rate_per_second = 5.0
+    api_page_size = PAGE_SIZE
+
+    def __init__(self, use_real_api: bool = False, insights_mode: str | None = None,
+                 accounts: list[str] | None = None, ad_account=None):
         """
         Initialize the Meta Ads connector.
 
         Args:
             use_real_api: If True, use real Meta Ads API. If False, use fake API.
+            insights_mode: "auto" (default, picked from the estimated row count),
+                "sync" or "async" — also read from META_ADS_INSIGHTS_MODE
+            accounts: Ad account IDs (act_XXX) to extract — defaults to META_ADS_ACCOUNT_IDS,
+                then to the accounts of META_ADS_BUSINESS_ID, then to META_ADS_ACCOUNT_ID
+            ad_account: Ready-made AdAccount (or a stand-in) queried for every
+                account — skips SDK initialization
+
+        With use_real_api, META_ADS_API_BASE_URL replaces the Graph API URL
+        (ex: fake_apis.http_server).
         """
-        super().__init__(source_name="meta_ads")
-        self.use_real_api = use_real_api and META_ADS_AVAILABLE
-
-        if self.use_real_api:
+        super().__init__(source_name="meta_ads",
+                         accounts=accounts or accounts_from_env("META_ADS_ACCOUNT_IDS"))
+        self.use_real_api = ad_account is not None or (use_real_api and META_ADS_AVAILABLE)
+        self.insights_mode = (insights_mode or os.getenv("META_ADS_INSIGHTS_MODE", "auto")).lower()
+        if self.insights_mode not in ("auto", "sync", "async"):
+            raise ValueError(f"Unknown insights mode '{self.insights_mode}', expected auto, sync or async")
+        self.async_row_threshold = int(os.getenv("META_ADS_ASYNC_ROW_THRESHOLD", str(self.async_row_threshold)))
+        self.async_report_days = int(os.getenv("META_ADS_ASYNC_REPORT_DAYS", str(self.async_report_days)))
+        self.account_id = os.getenv("META_ADS_ACCOUNT_ID", "")
+        self.business_id = os.getenv("META_ADS_BUSINESS_ID", "")
+        self._ad_account_override = ad_account
+        self._ad_accounts = {}
+        self._campaign_counts = {}
+
+        if ad_account is not None:
+            logger.info("Using provided Meta Ads account")
+            self._api = None
+        elif self.use_real_api:
             logger.info("Using real Meta Ads API")
             self._api = self._init_real_api()
         else:
@@ -48,7 +153,9 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
     def _init_real_api(self):
         """Initialize the real Meta Ads API client from environment variables."""
         try:
-            from facebook_business.api import FacebookAdsApi  # pylint: disable=import-outside-toplevel,import-error
+            # pylint: disable=import-outside-toplevel,import-error
+            from facebook_business.api import FacebookAdsApi
+            from facebook_business.session import FacebookSession
 
             app_id = os.getenv("META_ADS_APP_ID")
             app_secret = os.getenv("META_ADS_APP_SECRET")
@@ -58,7 +165,16 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
                 logger.warning("Missing Meta Ads credentials in environment variables")
                 return None
 
-            api = FacebookAdsApi.init(app_id, app_secret, access_token)
+            base_url = os.getenv("META_ADS_API_BASE_URL")
+            if base_url:
+                # The Graph URL is an attribute of the session: every call of this API goes to base_url
+                session = FacebookSession(app_id, app_secret, access_token)
+                session.GRAPH = base_url.rstrip("/")
+                api = FacebookAdsApi(session)
+                FacebookAdsApi.set_default_api(api)
+                logger.info("Routing Meta Ads API calls to %s", session.GRAPH)
+            else:
+                api = FacebookAdsApi.init(app_id, app_secret, access_token)
             logger.info("Meta Ads API initialized successfully")
             return api
 
@@ -67,11 +183,18 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
             logger.error("Failed to initialize Meta Ads API: %s", e)
             return None
 
+    @property
+    def _uses_graph_api(self) -> bool:
+        """Whether rows come from the Graph API (an initialized API, or an injected ad account)."""
+        return bool(self.use_real_api and (self._api or self._ad_account_override))
+
     def extract(self, start_date: str, end_date: str) -> list[dict]:
         """
         Extract Meta Ads data.
 
         Uses real API if available and configured, otherwise falls back to fake API.
+        Dates held by the response cache are served from it, and extracted
+        ranges are archived (see extract_cached_pages()).
 
         Args:
             start_date: Start date in YYYY-MM-DD format
@@ -80,11 +203,90 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
         Returns:
             List of dictionaries containing campaign data
         """
-        if self.use_real_api and self._api:
+        if self.response_cache is not None or self.archive is not None:
+            return [row for page in self.extract_cached_pages(start_date, end_date) for row in page]
+        if self._uses_graph_api:
             return self._extract_real_api(start_date, end_date)
         return self._extract_fake_api(start_date, end_date)
 
-    def _extract_real_api(self, start_date: str, end_date: str) -> list[dict]:
+    def extract_pages(self, start_date: str, end_date: str,
+                      account: str | None = None) -> Iterator[list[dict]]:
+        """
+        Extract Meta Ads data page by page.
+
+        Real API: one page per insights cursor page (sync) or report result page
+        (async). Fake API: chunks of whole days.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            account: Ad account ID (default: META_ADS_ACCOUNT_ID, or every fake account)
+
+        Yields:
+            Lists of dictionaries containing campaign data
+        """
+        if self._uses_graph_api:
+            yield from self._iter_real_api_pages(start_date, end_date, account or self.account_id)
+            return
+        yield from iter_campaign_daily(start_date, end_date, account_id=account)
+
+    def cache_fields(self) -> tuple[str, ...]:
+        """Requested insights fields and the API the rows come from (response cache key)."""
+        return (*INSIGHTS_FIELDS, "real_api" if self._uses_graph_api else "fake_api")
+
+    def default_account(self) -> str | None:
+        """Ad account extracted when none is given (META_ADS_ACCOUNT_ID; fake API: every account)."""
+        return (self.account_id or None) if self._uses_graph_api else None
+
+    def discover_accounts(self) -> list[str]:
+        """
+        List the active ad accounts of the business manager (META_ADS_BUSINESS_ID).
+
+        Owned and client ad accounts are both returned. With the fake API, the
+        simulated accounts are returned when there are several (FAKE_ADS_ACCOUNTS).
+
+        Returns:
+            Ad account IDs (act_XXX), empty when no business is configured
+        """
+        if not self.use_real_api:
+            accounts = list_accounts()
+            return accounts if len(accounts) > 1 else []
+        if not (self._api and self.business_id):
+            return []
+
+        # pylint: disable=import-error
+        from facebook_business.adobjects.business import Business  # pylint: disable=import-outside-toplevel
+
+        business = Business(self.business_id)
+        accounts = []
+        for edge in (business.get_owned_ad_accounts, business.get_client_ad_accounts):
+            for ad_account in self._call(self.business_id, edge, fields=["account_id", "account_status"]):
+                if ad_account["account_status"] == 1:  # ACTIVE
+                    accounts.append(f"act_{ad_account['account_id']}")
+        accounts = list(dict.fromkeys(accounts))
+        logger.info("Discovered %d active Meta Ads accounts under business %s", len(accounts), self.business_id)
+        return accounts
+
+    def estimate_account_size(self, account: str) -> int:
+        """
+        Number of campaigns in an ad account (campaign-days per day).
+
+        Args:
+            account: Ad account ID
+
+        Returns:
+            Campaign count, read once per account from a summary call
+        """
+        if not self._uses_graph_api:
+            return 1
+        if account not in self._campaign_counts:
+            # Only the summary total is read — a single call whatever the account size
+            campaigns = self._call(account, self._ad_account(account).get_campaigns,
+                                   fields=["id"], params={"summary": True, "limit": 1})
+            self._campaign_counts[account] = campaigns.total()
+        return self._campaign_counts[account]
+
+    def _extract_real_api(self, start_date: str, end_date: str) -> list[MetaAdsCampaignDaily]:
         """
         Extract daily campaign insights from real Meta Ads API.
 
@@ -98,45 +300,194 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
         Returns:
             List of dictionaries containing campaign daily performance data
         """
-        # pylint: disable=import-error
-        from facebook_business.adobjects.adaccount import AdAccount  # pylint: disable=import-outside-toplevel
+        records = [
+            record
+            for page in self._iter_real_api_pages(start_date, end_date, self.account_id)
+            for record in page
+        ]
+        logger.info("Extracted %d records from real Meta Ads API", len(records))
+        return records
+
+    def _iter_real_api_pages(self, start_date: str, end_date: str, account_id: str) -> Iterator[list[dict]]:
+        """
+        Iterate over insights pages from the real Meta Ads API.
 
-        account_id = os.getenv("META_ADS_ACCOUNT_ID")
-        account = AdAccount(account_id)
+        Uses async report runs when the mode is "async", or when it is "auto"
+        and the estimated row count exceeds `async_row_threshold`.
 
-        logger.info("Extracting Meta Ads data from real API (%s to %s)", start_date, end_date)
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            account_id: Ad account ID
+
+        Yields:
+            Lists of dictionaries containing campaign daily performance data
+        """
+        use_async = self.insights_mode == "async"
+        if self.insights_mode == "auto":
+            estimated_rows = self._estimate_rows(start_date, end_date, account_id)
+            use_async = estimated_rows > self.async_row_threshold
+            logger.info("Estimated %d insights rows (%s, %s to %s): using %s insights",
+                        estimated_rows, account_id, start_date, end_date, "async" if use_async else "sync")
+
+        if use_async:
+            yield from self._iter_async_report_pages(start_date, end_date, account_id)
+        else:
+            yield from self._iter_sync_pages(start_date, end_date, account_id)
+
+    def _ad_account(self, account_id: str):
+        """AdAccount object of an account ID (or the stand-in given at init)."""
+        if self._ad_account_override is not None:
+            return self._ad_account_override
+        if account_id not in self._ad_accounts:
+            # pylint: disable=import-error
+            from facebook_business.adobjects.adaccount import AdAccount  # pylint: disable=import-outside-toplevel
+            self._ad_accounts[account_id] = AdAccount(account_id)
+        return self._ad_accounts[account_id]
+
+    def _call(self, account_id: str, func, *args, usage=None, **kwargs):
+        """Run one Graph API request under the account's rate limits (see ConcurrencyController)."""
+        return self.controller.call(account_id, func, *args, throttle_delay=_throttle_delay,
+                                    usage=usage, **kwargs)
+
+    def _iter_cursor_pages(self, cursor, account_id: str) -> Iterator[list[MetaAdsCampaignDaily]]:
+        """
+        Convert an insights cursor page by page, one controlled request per page.
+
+        The cursor is requested with `limit=PAGE_SIZE`, so reading PAGE_SIZE rows
+        triggers at most one page load; its usage headers feed the controller.
+        Rows read before a throttled page load are kept: the retry resumes
+        reading the cursor after them.
+        """
+        rows = iter(cursor)
+        page = []
+
+        def read_page() -> None:
+            for row in islice(rows, PAGE_SIZE - len(page)):
+                page.append(row)
+
+        def cursor_usage(_):
+            headers = cursor.headers() if hasattr(cursor, "headers") else None
+            return parse_usage_headers(headers)
+
+        while True:
+            self._call(account_id, read_page, usage=cursor_usage)
+            if not page:
+                return
+            yield [self._to_record(row) for row in page]
+            page.clear()
+
+    @staticmethod
+    def _insights_params(start_date: str, end_date: str) -> dict:
+        """Insights parameters for one row per campaign per day."""
+        return {
+            "time_range": {"since": start_date, "until": end_date},
+            "time_increment": 1,   # one row per day
+            "level": "campaign",
+            "limit": PAGE_SIZE,
+        }
+
+    def _estimate_rows(self, start_date: str, end_date: str, account_id: str) -> int:
+        """Estimate the insights rows of a range: days × campaigns in the account."""
+        days = (datetime.strptime(end_date, "%Y-%m-%d") - datetime.strptime(start_date, "%Y-%m-%d")).days + 1
+        return days * self.estimate_account_size(account_id)
+
+    def _iter_sync_pages(self, start_date: str, end_date: str, account_id: str) -> Iterator[list[dict]]:
+        """
+        Iterate over insights pages of a synchronous insights call.
+
+        The SDK cursor fetches the next page lazily, so only one page of
+        insights is held in memory at a time.
+        """
+        logger.info("Extracting Meta Ads data from real API (%s, %s to %s)", account_id, start_date, end_date)
 
-        insights = account.get_insights(
-            fields=["campaign_id", "campaign_name", "impressions", "clicks", "spend", "actions"],
-            params={
-                "time_range": {"since": start_date, "until": end_date},
-                "time_increment": 1,   # one row per day
-                "level": "campaign",
-            }
+        insights = self._call(
+            account_id,
+            self._ad_account(account_id).get_insights,
+            fields=INSIGHTS_FIELDS,
+            params=self._insights_params(start_date, end_date),
         )
+        yield from self._iter_cursor_pages(insights, account_id)
 
-        records = []
-        for row in insights:
-            # Flatten actions list into a dict keyed by action_type
-            actions = {a["action_type"]: int(a["value"]) for a in row.get("actions", [])}
-
-            records.append({
-                "date": row["date_start"],
-                "campaign_id": row["campaign_id"],
-                "campaign_name": row["campaign_name"],
-                "impressions": int(row.get("impressions", 0)),
-                "clicks": int(row.get("clicks", 0)),
-                "spend_usd": float(row.get("spend", 0.0)),
-                # Engagement metrics extracted from actions
-                "likes": actions.get("post_reaction", 0),
-                "comments": actions.get("comment", 0),
-                "shares": actions.get("post", 0),
-                "video_views": actions.get("video_view", 0),
-                "page_engagement": actions.get("page_engagement", 0),
-            })
+    def _iter_async_report_pages(self, start_date: str, end_date: str, account_id: str) -> Iterator[list[dict]]:
+        """
+        Iterate over insights pages of async report runs, one per report window.
 
-        logger.info("Extracted %d records from real Meta Ads API", len(records))
-        return records
+        The range (usually one extraction window) is split into report windows
+        of `async_report_days` days. Up to MAX_ASYNC_REPORTS report runs are in
+        flight; all of them are polled on each round, and the result pages of a
+        report are streamed as soon as it completes, while the others keep
+        running on Meta's side.
+
+        Raises:
+            RuntimeError: If a report run fails or is skipped
+            TimeoutError: If reports are still running after ASYNC_TIMEOUT_SECONDS
+        """
+        account = self._ad_account(account_id)
+        windows = split_date_range(start_date, end_date, self.async_report_days)
+        pending_windows = iter(windows)
+        running = {}
+        deadline = time.monotonic() + ASYNC_TIMEOUT_SECONDS
+        logger.info("Extracting Meta Ads data with %d async reports (%s, %s to %s)",
+                    len(windows), account_id, start_date, end_date)
+
+        def submit(window: tuple[str, str]) -> None:
+            running[window] = self._call(
+                account_id,
+                account.get_insights,
+                fields=INSIGHTS_FIELDS,
+                params=self._insights_params(*window),
+                is_async=True,
+            )
+
+        for window in pending_windows:
+            submit(window)
+            if len(running) >= MAX_ASYNC_REPORTS:
+                break
+
+        while running:
+            for window, report in list(running.items()):
+                self._call(account_id, report.api_get)
+                status = report["async_status"]
+                if status in ("Job Failed", "Job Skipped"):
+                    raise RuntimeError(f"Meta Ads async report {window[0]} to {window[1]}: {status}")
+                if status != "Job Completed" or report["async_percent_completion"] < 100:
+                    continue
+
+                del running[window]
+                next_window = next(pending_windows, None)
+                if next_window is not None:
+                    submit(next_window)
+                logger.info("Async report %s to %s completed", *window)
+                result = self._call(account_id, report.get_result, params={"limit": PAGE_SIZE})
+                yield from self._iter_cursor_pages(result, account_id)
+
+            if running:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Meta Ads async reports still running after {ASYNC_TIMEOUT_SECONDS}s")
+                time.sleep(self.async_poll_seconds)
+
+    @staticmethod
+    def _to_record(row) -> MetaAdsCampaignDaily:
+        """Convert one insights row into a raw-zone record."""
+        # Flatten actions list into a dict keyed by action_type
+        actions = {a["action_type"]: int(a["value"]) for a in row.get("actions", [])}
+
+        return MetaAdsCampaignDaily(
+            date=row["date_start"],
+            campaign_id=row["campaign_id"],
+            campaign_name=row["campaign_name"],
+            impressions=int(row.get("impressions", 0)),
+            clicks=int(row.get("clicks", 0)),
+            spend_usd=float(row.get("spend", 0.0)),
+            # Engagement metrics extracted from actions
+            likes=actions.get("post_reaction", 0),
+            comments=actions.get("comment", 0),
+            shares=actions.get("post", 0),
+            video_views=actions.get("video_view", 0),
+            page_engagement=actions.get("page_engagement", 0),
+            account_id=row.get("account_id"),
+        )
 
     def _extract_fake_api(self, start_date: str, end_date: str) -> list[dict]:
         """
@@ -159,7 +510,8 @@ class MetaAdsConnector(DataSourceConnector):  # pylint: disable=too-few-public-m
 connector = MetaAdsConnector()
 
 
-def run(start_date: str, end_date: str) -> list[dict]:
+def run(start_date: str, end_date: str,
+        window_days: int | None = None, max_workers: int | None = None) -> list[dict]:
     """
     Execute the complete Meta Ads ingestion pipeline.
 
@@ -170,8 +522,10 @@ def run(start_date: str, end_date: str) -> list[dict]:
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format (inclusive)
+        window_days: Days per extraction window (defaults to the connector setting)
+        max_workers: Concurrent extractions (defaults to the connector setting)
 
     Returns:
         List of enriched dictionaries loaded to BigQuery
     """
-    return connector.run(start_date, end_date)
+    return connector.run(start_date, end_date, window_days=window_days, max_workers=max_workers)
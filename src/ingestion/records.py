@@ -0,0 +1,128 @@
+"""
+Typed record classes for raw campaign-daily rows.
+
+One Python dict per campaign-day carries a hash table and up to 11 string keys
+per row. These slotted dataclasses store the same values as fixed attributes:
+no per-row dict, no key hashing on access. They are produced by the APIs (fake
+and real), flow unchanged through extraction and enrichment, and are only
+turned into plain values at serialization time.
+
+Records also implement the read-only mapping protocol (`row["date"]`,
+`"date" in row`, `row.get()`, `{**row}`), so code written against dict rows
+keeps working.
+
+`EnrichedRows` attaches the run metadata to a batch of rows without copying
+it into each of them.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+class _MappingRecord:
+    """Read-only mapping protocol on top of slotted dataclass attributes."""
+
+    __slots__ = ()
+    _keys = {}.keys()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Also run for the slotted class rebuilt by @dataclass, which keeps the annotations
+        cls._keys = dict.fromkeys(cls.__annotations__).keys()
+
+    def keys(self):
+        """Field names, in declaration order (supports set operations)."""
+        return self._keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of a field, or `default` for unknown fields."""
+        return getattr(self, key) if key in self._keys else default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict copy of the record."""
+        return {name: getattr(self, name) for name in self._keys}
+
+
+@dataclass(slots=True)
+class GoogleAdsCampaignDaily(_MappingRecord):  # pylint: disable=too-many-instance-attributes
+    """One Google Ads campaign-day (raw table google_ads_campaign_daily)."""
+
+    date: str
+    campaign_id: str
+    campaign_name: str
+    impressions: int
+    clicks: int
+    conversions: float
+    cost_usd: float
+    # Customer ID the campaign belongs to (NULL in rows loaded before multi-account runs)
+    account_id: str | None = None
+
+
+@dataclass(slots=True)
+class MetaAdsCampaignDaily(_MappingRecord):  # pylint: disable=too-many-instance-attributes
+    """One Meta Ads campaign-day (raw table meta_ads_campaign_daily)."""
+
+    date: str
+    campaign_id: str
+    campaign_name: str
+    impressions: int
+    clicks: int
+    spend_usd: float
+    # Only reported by some sources (fake API vs insights actions) — NULL otherwise
+    conversions: int | None = None
+    likes: int | None = None
+    comments: int | None = None
+    shares: int | None = None
+    video_views: int | None = None
+    page_engagement: int | None = None
+    # Ad account the campaign belongs to (NULL in rows loaded before multi-account runs)
+    account_id: str | None = None
+
+
+class EnrichedRows(Sequence):
+    """
+    Read-only view of raw rows enriched with run metadata.
+
+    Rows are kept as extracted and the metadata dict is stored once; an
+    enriched dict is only built when a row is accessed. Behaves like the list
+    of enriched dicts returned before (len, indexing, slicing, iteration).
+    """
+
+    def __init__(self, rows: Sequence[dict], run_metadata: dict[str, Any]):
+        """
+        Args:
+            rows: Raw rows, without metadata
+            run_metadata: Metadata shared by every row (see new_run_metadata())
+        """
+        self.rows = rows
+        self.run_metadata = run_metadata
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [{**row, **self.run_metadata} for row in self.rows[index]]
+        return {**self.rows[index], **self.run_metadata}
+
+    def __iter__(self) -> Iterator[dict]:
+        for row in self.rows:
+            yield {**row, **self.run_metadata}
+
+    def __repr__(self) -> str:
+        return f"EnrichedRows({len(self.rows)} rows, run {self.run_metadata.get('extract_run_id')})"
@@ -0,0 +1,212 @@
+"""
+On-disk cache of extracted API responses, with late-data-aware expiry.
+
+Reruns and dbt development extract the same dates again and again, although
+the data of old dates no longer changes at the source. Connectors keep the
+rows they extract in a local cache, one entry per (source, account, date,
+fields), and only call the API for the dates that are not cached:
+
+- entries for dates older than the late-data window when they were fetched
+  are final and never expire
+- more recent entries expire after `ttl_seconds`, so late corrections are
+  picked up once the TTL is over
+
+Entries are gzip-compressed JSON files named after the hash of their key
+(content-addressed), written atomically. The cache is capped at `max_bytes`:
+the least recently used entries are evicted first. Hits, misses, expired
+entries and evictions are counted (see `stats()`).
+
+Enabled by API_CACHE_DIR (see `ResponseCache.from_env()`).
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Lifetime of entries whose date is still within the late-data window
+DEFAULT_CACHE_TTL_SECONDS = 6 * 3600
+
+# Size cap of the cache directory
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Days after which a date's data no longer changes (see ingestion.base.LATE_DATA_DAYS)
+DEFAULT_CACHE_LATE_DAYS = 7
+
+
+class ResponseCache:  # pylint: disable=too-many-instance-attributes
+    """Content-addressed, size-capped cache of extracted rows per (source, account, date, fields)."""
+
+    def __init__(self, directory: str | Path, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES, late_days: int = DEFAULT_CACHE_LATE_DAYS):
+        """
+        Args:
+            directory: Cache directory (created if needed)
+            ttl_seconds: Lifetime of entries for dates within the late-data window
+            max_bytes: Maximum total size of the entries
+            late_days: Late-data window, in days
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.late_days = late_days
+        self.counters = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "puts": 0}
+        self._lock = threading.Lock()
+        # Entry path -> size, least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        self._load_index()
+
+    @classmethod
+    def from_env(cls, late_days: int = DEFAULT_CACHE_LATE_DAYS) -> "ResponseCache | None":
+        """
+        Build the cache configured by environment variables.
+
+        API_CACHE_DIR enables it; API_CACHE_TTL_SECONDS and API_CACHE_MAX_MB tune it.
+
+        Args:
+            late_days: Late-data window, in days
+
+        Returns:
+            Cache, or None when API_CACHE_DIR is not set
+        """
+        directory = os.getenv("API_CACHE_DIR")
+        if not directory:
+            return None
+        return cls(
+            directory,
+            ttl_seconds=float(os.getenv("API_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS))),
+            max_bytes=int(float(os.getenv("API_CACHE_MAX_MB", str(DEFAULT_CACHE_MAX_BYTES / 2**20))) * 2**20),
+            late_days=late_days,
+        )
+
+    @staticmethod
+    def key(source: str, account: str | None, day: str, fields: tuple[str, ...]) -> str:
+        """
+        Address of an entry: hash of what identifies the response.
+
+        Args:
+            source: Source name
+            account: Account ID (None: the connector's default account)
+            day: Date in YYYY-MM-DD format
+            fields: Requested fields (and anything else that changes the rows)
+
+        Returns:
+            Hex digest
+        """
+        identity = json.dumps([source, account, day, list(fields)], separators=(",", ":"))
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def get(self, source: str, account: str | None, day: str, fields: tuple[str, ...]) -> list[dict] | None:
+        """
+        Cached rows of a date, if present and not expired.
+
+        Args:
+            source: Source name
+            account: Account ID
+            day: Date in YYYY-MM-DD format
+            fields: Requested fields
+
+        Returns:
+            Rows (possibly empty), or None on a miss
+        """
+        path = self._path(self.key(source, account, day, fields))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, OSError, ValueError):
+            with self._lock:
+                self.counters["misses"] += 1
+            return None
+
+        if entry["expires_at"] is not None and entry["expires_at"] < time.time():
+            with self._lock:
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                self._remove(path)
+            return None
+
+        with self._lock:
+            self.counters["hits"] += 1
+            if path in self._entries:
+                self._entries.move_to_end(path)
+        os.utime(path)
+        return entry["rows"]
+
+    def put(self, source: str, account: str | None, day: str, fields: tuple[str, ...],
+            rows: list[dict]) -> None:
+        """
+        Store the rows of a date, evicting least recently used entries above the size cap.
+
+        Args:
+            source: Source name
+            account: Account ID
+            day: Date in YYYY-MM-DD format
+            fields: Requested fields
+            rows: Extracted rows of that date (records or dicts)
+        """
+        settled = date.fromisoformat(day) <= datetime.now(tz=timezone.utc).date() - timedelta(days=self.late_days)
+        entry = {
+            "key": {"source": source, "account": account, "date": day, "fields": list(fields)},
+            "stored_at": time.time(),
+            "expires_at": None if settled else time.time() + self.ttl_seconds,
+            "rows": [dict(row) for row in rows],
+        }
+        path = self._path(self.key(source, account, day, fields))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(json.dumps(entry, separators=(",", ":")).encode()))
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.counters["puts"] += 1
+            self._size -= self._entries.pop(path, 0)
+            self._entries[path] = path.stat().st_size
+            self._size += self._entries[path]
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.counters["evictions"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Counters of the cache since it was opened.
+
+        Returns:
+            hits, misses, expired, evictions, puts, plus entries and bytes on disk
+        """
+        with self._lock:
+            return {**self.counters, "entries": len(self._entries), "bytes": self._size}
+
+    def _path(self, key: str) -> Path:
+        """File of an entry (fanned out in 256 subdirectories)."""
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def _remove(self, path: Path) -> None:
+        """Delete an entry (caller holds the lock)."""
+        self._size -= self._entries.pop(path, 0)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> None:
+        """Index the entries already on disk, least recently used first."""
+        if not self.directory.exists():
+            return
+        files = [(path.stat().st_mtime, path) for path in self.directory.glob("*/*.json.gz")]
+        for _, path in sorted(files):
+            self._entries[path] = path.stat().st_size
+            self._size += self._entries[path]
+        logger.info("Response cache %s: %d entries (%.1f MB)", self.directory, len(self._entries), self._size / 1e6)
@@ -0,0 +1,580 @@
+"""
+Run modes of the connectors, built on extract_windows() and write_to_bigquery().
+
+- run(): extracts the whole range and returns the enriched rows
+- run_streaming(): flushes bounded batches as windows are extracted,
+  so peak memory does not grow with the length of the date range
+- run_pipelined(): run_streaming() with the extract and load stages decoupled:
+  batches are extracted on a background thread into a bounded queue while the
+  previous ones are uploaded, and per-stage timings report how much they overlapped
+- run_incremental(): picks the range itself, from the per-account watermark
+  minus a late-data lookback, up to yesterday (see ingestion.watermarks)
+- run_replay(): rebuilds the raw table from the payload archive without
+  calling the API (see ingestion.archive)
+
+Every mode keeps the same bookkeeping: one run metadata shared by all the
+batches, the (date, account) slices staged, a per-account report and the run
+checkpoint — given a CheckpointStore, each task is committed once its rows are
+staged, and running the same range again resumes the interrupted run (see
+ingestion.checkpoints). Batches are only staged; the run replaces the stored
+slices with them in one transaction when it finishes (see
+ingestion.staging), even when some accounts failed.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+import logging
+import os
+import queue
+import threading
+import time
+from ingestion import bigquery_clients
+from ingestion.checkpoints import CheckpointStore, RunCheckpoint
+from ingestion.records import EnrichedRows
+from ingestion.watermarks import DEFAULT_ACCOUNT, WatermarkStore
+from ingestion.windowing import LATE_DATA_DAYS, ExtractTask, batched, iter_days
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of enriched rows held in memory before a BigQuery load is flushed
+DEFAULT_BATCH_SIZE = 10_000
+
+# Batches extracted ahead of the load stage in run_pipelined() — the extract
+# stage blocks once this many batches are waiting to be uploaded
+DEFAULT_PIPELINE_DEPTH = 2
+
+# Marks the end of the extract stage in the run_pipelined() queue
+_END_OF_STREAM = object()
+
+
+@dataclass
+class _Run:
+    """State of one run, shared by its extract and load steps."""
+
+    run_metadata: dict[str, Any]
+    checkpoint: RunCheckpoint | None = None
+    # Days per window — the checkpoint's when a run is resumed
+    window_days: int | None = None
+    # (date, account_id) slices staged by the run (see write_to_bigquery)
+    staged_slices: set[tuple[str, str | None]] = field(default_factory=set)
+    # Whether the interrupted attempt a resumed run takes over left staged rows
+    staging_resumed: bool = False
+    # Per-account report, filled by extract_windows()
+    report: dict[str, dict] = field(default_factory=dict)
+    # Counters of the partitions left as is (None: skip_unchanged disabled)
+    unchanged: dict[str, int] | None = None
+
+
+class _LoadedTasks:
+    """
+    Commits streamed tasks to a checkpoint once all of their rows are loaded.
+
+    Batches mix the rows of several tasks: a task is committed when the number
+    of rows loaded reaches the offset of its last row in the stream.
+    """
+
+    def __init__(self, checkpoint: RunCheckpoint | None, stats: dict[str, Any]):
+        self.checkpoint = checkpoint
+        self.stats = stats
+        self.emitted = 0
+        # (task, offset of its last row) — appended by the extract side, popped by the load side
+        self.ends = deque()
+
+    def iter_rows(self, windows: Iterable[tuple[ExtractTask, list[dict]]]) -> Iterator[dict]:
+        """Flatten extracted tasks into a row stream, recording where each task ends."""
+        for task, rows in windows:
+            self.stats["windows"] += 1
+            # Recorded before the rows are handed over, so a batch ending on the
+            # task's last row commits it
+            self.emitted += len(rows)
+            self.ends.append((task, self.emitted))
+            yield from rows
+
+    def loaded(self, rows_loaded: int) -> None:
+        """Commit every task whose rows are all within the first `rows_loaded` rows."""
+        while self.ends and self.ends[0][1] <= rows_loaded:
+            task, _ = self.ends.popleft()
+            if self.checkpoint is not None:
+                self.checkpoint.commit(task)
+
+
+class _Pipeline:
+    """
+    Bounded queue between the extract and load stages of run_pipelined().
+
+    The extract stage runs `extract()` on its own thread (see start()); the
+    load stage iterates over the pipeline. Time spent blocked on either side
+    is added to the run stats.
+    """
+
+    def __init__(self, depth: int, stats: dict[str, Any]):
+        self.batches = queue.Queue(maxsize=max(1, depth))
+        self.stop = threading.Event()
+        self.stats = stats
+        self.extractor = None
+
+    def start(self, windows: Iterator[tuple[ExtractTask, list[dict]]], tasks: _LoadedTasks,
+              batch_size: int, name: str) -> None:
+        """Start the extract stage on its own thread."""
+        self.extractor = threading.Thread(target=self.extract, args=(windows, tasks, batch_size),
+                                          name=name, daemon=True)
+        self.extractor.start()
+
+    def close(self) -> None:
+        """Stop the extract stage and wait for its thread."""
+        self.stop.set()
+        if self.extractor is not None:
+            self.extractor.join()
+
+    def hand_over(self, item: Any) -> None:
+        """Put an item in the queue, waiting while it is full unless the pipeline is stopped."""
+        started = time.perf_counter()
+        while not self.stop.is_set():
+            try:
+                self.batches.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self.stats["extract_blocked_seconds"] += time.perf_counter() - started
+
+    def extract(self, windows: Iterator[tuple[ExtractTask, list[dict]]], tasks: _LoadedTasks,
+                batch_size: int) -> None:
+        """Extract stage: hand over the batches of `windows`, then the end of the stream or the error raised."""
+        try:
+            row_batches = batched(tasks.iter_rows(windows), batch_size)
+            while not self.stop.is_set():
+                started = time.perf_counter()
+                batch = next(row_batches, None)
+                self.stats["extract_seconds"] += time.perf_counter() - started
+                if batch is None:
+                    break
+                self.hand_over(batch)
+            self.hand_over(_END_OF_STREAM)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # Re-raised by the load stage, in the caller's thread
+            self.hand_over(e)
+        finally:
+            windows.close()
+
+    def __iter__(self) -> Iterator[list[dict]]:
+        """Load stage: the extracted batches in order, raising the extract stage's error."""
+        while True:
+            started = time.perf_counter()
+            batch = self.batches.get()
+            self.stats["load_idle_seconds"] += time.perf_counter() - started
+            if batch is _END_OF_STREAM:
+                return
+            if isinstance(batch, Exception):
+                raise batch
+            yield batch
+
+
+class RunModesMixin:
+    """
+    Run modes of DataSourceConnector (see the module docstring).
+
+    Built on the connector's new_run_metadata(), resolve_accounts(),
+    extract_windows() and write_to_bigquery().
+    """
+
+    def run(self, start_date: str, end_date: str,
+            window_days: int | None = None, max_workers: int | None = None,
+            checkpoints: CheckpointStore | None = None) -> list[dict]:
+        """
+        Execute the complete pipeline: extract → enrich → load to BigQuery.
+
+        This method orchestrates steps and is identical for all sources.
+        The range is extracted as concurrent (account, window) tasks; each one
+        is enriched and staged as soon as its extraction finishes, and the
+        staged rows are committed in one transaction at the end. Accounts
+        that fail are skipped and listed in `account_report`.
+
+        Each account's rows of a date replace that account's stored rows only
+        (see write_to_bigquery): an account whose extraction fails keeps its
+        previously loaded rows, and can be rerun alone — or run with
+        `checkpoints`, which reruns only the failed accounts.
+
+        With `checkpoints`, each task is committed once staged and an
+        interrupted run of the same range is resumed: committed tasks are not
+        extracted again (nor returned), and the rows they staged are committed
+        with the resumed run's.
+
+        With `skip_unchanged`, date partitions whose extracted rows are
+        identical to the stored ones are neither written nor returned.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            window_days: Days per extraction window (defaults to the connector setting)
+            max_workers: Concurrent extractions (defaults to the connector setting)
+            checkpoints: Checkpoint store to record progress in and resume from
+
+        Returns:
+            List of enriched dictionaries loaded to BigQuery, in date then account order
+        """
+        run = self._start_run(start_date, end_date, window_days, checkpoints)
+        rows_by_task = {}
+
+        for task, rows in self._extract_run(run, start_date, end_date, max_workers):
+            # Step 1: extract raw data from the source (API or fake)
+            logger.info("Extracted %d rows from %s (%s, %s to %s)",
+                        len(rows), self.source_name, task.account or "default", task.start_date, task.end_date)
+
+            # Steps 2 & 3: attach run metadata and write to BigQuery raw zone
+            if rows:
+                self.write_to_bigquery(rows, run.staged_slices, run.run_metadata)
+                logger.info("Successfully loaded %d rows to BigQuery", len(rows))
+            if run.checkpoint is not None:
+                run.checkpoint.commit(task)
+            rows_by_task[task] = rows
+
+        self._finish_run(run)
+        order = sorted(rows_by_task, key=lambda task: (task.start_date, task.account or ""))
+        # The metadata envelope stays on the write path: callers get plain enriched dicts
+        return list(EnrichedRows([row for task in order for row in rows_by_task[task]], run.run_metadata))
+
+    def run_streaming(self, start_date: str, end_date: str, *,  # pylint: disable=too-many-arguments
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      window_days: int | None = None,
+                      max_workers: int | None = None,
+                      checkpoints: CheckpointStore | None = None) -> dict[str, Any]:
+        """
+        Execute the pipeline in streaming mode: windows → enrich → bounded loads.
+
+        Windows are extracted concurrently and their rows are flushed to
+        BigQuery every `batch_size` rows, with the run metadata attached to
+        each batch. Memory is
+        bounded by `max_workers` windows plus one batch, whatever the length
+        of the date range. All batches share the same extract_run_id.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            batch_size: Maximum number of rows per BigQuery load
+            window_days: Days per extraction window (defaults to the connector setting)
+            max_workers: Concurrent extractions (defaults to the connector setting)
+            checkpoints: Checkpoint store to record progress in and resume from (see run())
+
+        Returns:
+            Dictionary with extract_run_id, rows, batches and windows counts, the
+            per-account report (`accounts`, `failed_accounts`, see extract_windows)
+            and the API call metrics of the connector (`api`, see ConcurrencyController.metrics),
+            plus the response cache counters (`cache`) when the cache is enabled.
+            With `checkpoints`, also `resumed` and `skipped_windows` (tasks committed
+            by the interrupted run); with `skip_unchanged`, also `skipped_rows` and
+            `skipped_partitions` (unchanged date partitions left as is)
+        """
+        run = self._start_run(start_date, end_date, window_days, checkpoints)
+        stats = {"extract_run_id": run.run_metadata["extract_run_id"],
+                 "rows": 0, "batches": 0, "windows": 0}
+        tasks = _LoadedTasks(run.checkpoint, stats)
+        windows = self._extract_run(run, start_date, end_date, max_workers)
+
+        for batch in batched(tasks.iter_rows(windows), batch_size):
+            self._load_batch(run, batch, tasks)
+        tasks.loaded(stats["rows"])
+
+        self._finish_run(run, stats)
+        logger.info("Streamed %d rows from %s in %d batches (%d windows)",
+                    stats["rows"], self.source_name, stats["batches"], stats["windows"])
+        return stats
+
+    def run_pipelined(self, start_date: str, end_date: str, *,  # pylint: disable=too-many-arguments
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      window_days: int | None = None,
+                      max_workers: int | None = None,
+                      queue_size: int = DEFAULT_PIPELINE_DEPTH,
+                      checkpoints: CheckpointStore | None = None) -> dict[str, Any]:
+        """
+        Execute the streaming pipeline with extraction and loading overlapped.
+
+        In `run_streaming()`, extraction waits while a batch is uploaded and
+        BigQuery waits while the next batch is extracted. Here the extract stage
+        runs on its own thread and hands batches to the load stage through a
+        queue of at most `queue_size` batches: batch N+1 is extracted while
+        batch N is loaded. When the loader falls behind, the queue fills up and
+        extraction blocks (backpressure), so memory stays bounded.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            batch_size: Maximum number of rows per BigQuery load
+            window_days: Days per extraction window (defaults to the connector setting)
+            max_workers: Concurrent extractions (defaults to the connector setting)
+            queue_size: Maximum number of extracted batches waiting to be loaded
+            checkpoints: Checkpoint store to record progress in and resume from (see run())
+
+        Returns:
+            Dictionary with the `run_streaming()` counts plus stage timings in seconds:
+            extract_seconds and load_seconds (time each stage spent working),
+            extract_blocked_seconds (extraction waiting on a full queue),
+            load_idle_seconds (loader waiting on an empty queue), wall_seconds
+            and overlap_seconds (time both stages were working at once)
+
+        Raises:
+            Exception: The first error raised by either stage; the other stage is stopped
+        """
+        run = self._start_run(start_date, end_date, window_days, checkpoints)
+        stats = {"extract_run_id": run.run_metadata["extract_run_id"],
+                 "rows": 0, "batches": 0, "windows": 0,
+                 "extract_seconds": 0.0, "extract_blocked_seconds": 0.0,
+                 "load_seconds": 0.0, "load_idle_seconds": 0.0}
+        tasks = _LoadedTasks(run.checkpoint, stats)
+        pipeline = _Pipeline(queue_size, stats)
+
+        wall_started = time.perf_counter()
+        pipeline.start(self._extract_run(run, start_date, end_date, max_workers), tasks, batch_size,
+                       name=f"{self.source_name}-extract")
+        try:
+            for batch in pipeline:
+                started = time.perf_counter()
+                self._load_batch(run, batch, tasks)
+                stats["load_seconds"] += time.perf_counter() - started
+        finally:
+            pipeline.close()
+        tasks.loaded(stats["rows"])
+
+        stats["wall_seconds"] = time.perf_counter() - wall_started
+        stats["overlap_seconds"] = max(
+            0.0, stats["extract_seconds"] + stats["load_seconds"] - stats["wall_seconds"]
+        )
+        self._finish_run(run, stats)
+        logger.info("Pipelined %d rows from %s in %d batches (%d windows): extract %.1fs, "
+                    "load %.1fs, wall %.1fs, overlap %.1fs",
+                    stats["rows"], self.source_name, stats["batches"], stats["windows"],
+                    stats["extract_seconds"], stats["load_seconds"],
+                    stats["wall_seconds"], stats["overlap_seconds"])
+        return stats
+
+    def run_incremental(self, end_date: str | None = None, *,  # pylint: disable=too-many-arguments
+                        lookback_days: int = LATE_DATA_DAYS,
+                        initial_start_date: str | None = None,
+                        watermarks: WatermarkStore | None = None,
+                        batch_size: int = DEFAULT_BATCH_SIZE,
+                        window_days: int | None = None,
+                        max_workers: int | None = None,
+                        checkpoints: CheckpointStore | None = None) -> dict[str, Any]:
+        """
+        Extract only what changed since the last run: from the watermark minus a lookback.
+
+        Each account's watermark is the last date loaded for it. The last
+        `lookback_days` days up to the watermark are extracted again, to pick
+        up late data. The run covers one range for every account, from the
+        earliest start among them (an account never loaded starts at
+        `initial_start_date`).
+
+        Once the run has completed, the watermarks of the accounts that
+        succeeded move to `end_date` in one atomic write; failed accounts keep
+        theirs, so the next run extracts their dates again.
+
+        Args:
+            end_date: Last date to extract (default: yesterday, UTC)
+            lookback_days: Days up to the watermark extracted again for late data
+            initial_start_date: First date of accounts without a watermark
+                (default: <SOURCE>_INITIAL_START_DATE)
+            watermarks: Watermark store (default: WatermarkStore())
+            batch_size: Maximum number of rows per BigQuery load
+            window_days: Days per extraction window (defaults to the connector setting)
+            max_workers: Concurrent extractions (defaults to the connector setting)
+            checkpoints: Checkpoint store, to resume an interrupted run of the same range
+
+        Returns:
+            `run_streaming()` stats plus start_date, end_date and the new `watermarks`
+            ({account: date}); counts are 0 when there is nothing to extract
+
+        Raises:
+            ValueError: If an account has no watermark and no initial start date is set
+        """
+        watermarks = watermarks or WatermarkStore()
+        end_date = end_date or (datetime.now(tz=timezone.utc).date() - timedelta(days=1)).isoformat()
+        accounts = self.resolve_accounts()
+        start_date = self._incremental_start_date(
+            accounts, watermarks, lookback_days,
+            initial_start_date or os.getenv(f"{self.source_name.upper()}_INITIAL_START_DATE"),
+        )
+
+        if start_date > end_date:
+            logger.info("%s is up to date (watermark after %s)", self.source_name, end_date)
+            return {"extract_run_id": None, "rows": 0, "batches": 0, "windows": 0,
+                    "failed_accounts": [], "accounts": {}, **self._service_stats(),
+                    "start_date": start_date, "end_date": end_date, "watermarks": {}}
+
+        logger.info("Incremental %s run from %s to %s (lookback %d days)",
+                    self.source_name, start_date, end_date, lookback_days)
+        stats = self.run_streaming(start_date, end_date, batch_size=batch_size, window_days=window_days,
+                                   max_workers=max_workers, checkpoints=checkpoints)
+
+        stats.update(start_date=start_date, end_date=end_date,
+                     watermarks=self._advance_watermarks(watermarks, accounts, end_date, stats))
+        return stats
+
+    def run_replay(self, start_date: str, end_date: str, *, batch_size: int = DEFAULT_BATCH_SIZE,
+                   accounts: list[str] | None = None) -> dict[str, Any]:
+        """
+        Rebuild the raw table over a range from the payload archive, without calling the API.
+
+        The newest archived extraction of each (date, account) is read back and
+        loaded in bounded batches, as in `run_streaming()`: the rows of each
+        replayed (date, account) are replaced once, under a new extract_run_id.
+        Dates and accounts absent from the archive are left untouched.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format (inclusive)
+            batch_size: Maximum number of rows per BigQuery load
+            accounts: Accounts to replay (default: the configured ones, else every archived account)
+
+        Returns:
+            Dictionary with extract_run_id, rows, batches, files and dates counts,
+            missing_dates (dates with nothing archived) and wall_seconds
+
+        Raises:
+            ValueError: If no archive is configured (RAW_ARCHIVE_URI)
+        """
+        if self.archive is None:
+            raise ValueError(f"No payload archive configured for {self.source_name} (set RAW_ARCHIVE_URI)")
+
+        started = time.perf_counter()
+        run = _Run(self.new_run_metadata())
+        days = list(iter_days(start_date, end_date))
+        files = self.archive.latest_files(self.source_name, days, accounts or self.accounts or None)
+        stats = {"extract_run_id": run.run_metadata["extract_run_id"], "rows": 0, "batches": 0,
+                 "files": sum(len(names) for names in files.values()), "dates": len(files),
+                 "missing_dates": [day for day in days if day not in files]}
+        if stats["missing_dates"]:
+            logger.warning("%d dates of %s are not archived and are left as is (first: %s)",
+                           len(stats["missing_dates"]), self.source_name, stats["missing_dates"][0])
+
+        rows = (row for names in files.values() for name in names for row in self.archive.read(name))
+        tasks = _LoadedTasks(None, stats)
+        for batch in batched(rows, batch_size):
+            self._load_batch(run, batch, tasks)
+        self._commit_run(run)
+
+        stats["wall_seconds"] = time.perf_counter() - started
+        logger.info("Replayed %d rows of %s from %d archived files (%d dates) in %.1fs",
+                    stats["rows"], self.source_name, stats["files"], stats["dates"], stats["wall_seconds"])
+        return stats
+
+    def _start_run(self, start_date: str, end_date: str, window_days: int | None,
+                   checkpoints: CheckpointStore | None) -> _Run:
+        """
+        Start a run, resuming the interrupted run of the same range if any.
+
+        A resumed run takes over the extract_run_id and the window size of the
+        interrupted one, and the rows it staged for the tasks it committed.
+        """
+        run = _Run(self.new_run_metadata(), window_days=window_days,
+                   unchanged={"skipped_rows": 0, "skipped_partitions": 0} if self.skip_unchanged else None)
+        if checkpoints is not None:
+            run.checkpoint = checkpoints.open_run(self.source_name, start_date, end_date,
+                                                  window_days or self.window_days,
+                                                  run.run_metadata["extract_run_id"])
+            run.run_metadata["extract_run_id"] = run.checkpoint.extract_run_id
+            run.window_days = run.checkpoint.window_days
+            if run.checkpoint.resumed:
+                run.staging_resumed = self._discard_uncommitted(run.checkpoint.extract_run_id,
+                                                                run.checkpoint.completed_tasks)
+        return run
+
+    def _extract_run(self, run: _Run, start_date: str, end_date: str,
+                     max_workers: int | None) -> Iterator[tuple[ExtractTask, list[dict]]]:
+        """Extract the tasks of a run not committed yet (see extract_windows)."""
+        return self.extract_windows(start_date, end_date, window_days=run.window_days, max_workers=max_workers,
+                                    report=run.report, checkpoint=run.checkpoint, unchanged=run.unchanged)
+
+    def _load_batch(self, run: _Run, batch: list[dict], tasks: _LoadedTasks) -> None:
+        """Write a batch of the run and commit the tasks it completes."""
+        self.write_to_bigquery(batch, run.staged_slices, run.run_metadata)
+        tasks.stats["rows"] += len(batch)
+        tasks.stats["batches"] += 1
+        tasks.loaded(tasks.stats["rows"])
+        logger.info("Flushed batch %d (%d rows) from %s",
+                    tasks.stats["batches"], len(batch), self.source_name)
+
+    def _commit_run(self, run: _Run) -> None:
+        """Replace the stored slices with the rows staged by the run (and the attempt it resumed)."""
+        if run.staged_slices or run.staging_resumed:
+            self._commit_staged(run.run_metadata["extract_run_id"])
+
+    def _finish_run(self, run: _Run, stats: dict[str, Any] | None = None) -> list[str]:
+        """
+        Commit the rows of a finished run, report its accounts and clear its checkpoint.
+
+        The report is kept on the connector (`account_report`). The checkpoint
+        is kept when accounts failed, so rerunning the same range retries them.
+
+        Args:
+            run: Finished run
+            stats: Run statistics, completed in place (see run_streaming()) when given
+
+        Returns:
+            Failed accounts
+        """
+        self._commit_run(run)
+        self.account_report = run.report
+        failed = [account for account, entry in run.report.items() if entry["status"] == "failed"]
+        logger.info("%s: %d accounts extracted, %d failed",
+                    self.source_name, len(run.report) - len(failed), len(failed))
+        for account in failed:
+            logger.error("  %s: %s", account, "; ".join(run.report[account]["errors"]))
+        if run.unchanged is not None:
+            logger.info("Skipped %d unchanged partitions (%d rows) of %s",
+                        run.unchanged["skipped_partitions"], run.unchanged["skipped_rows"], self.source_name)
+
+        if stats is not None:
+            stats.update(run.unchanged or {})
+            stats["failed_accounts"] = failed
+            if run.checkpoint is not None:
+                stats["resumed"] = run.checkpoint.resumed
+                stats["skipped_windows"] = run.checkpoint.skipped_tasks
+            stats["accounts"] = run.report
+            stats.update(self._service_stats())
+
+        if run.checkpoint is not None and failed:
+            logger.warning("%s: checkpoint kept for %d failed accounts — rerun the same range to retry them",
+                           self.source_name, len(failed))
+        elif run.checkpoint is not None:
+            run.checkpoint.finish()
+        return failed
+
+    def _service_stats(self) -> dict[str, Any]:
+        """API call metrics, response cache counters (when enabled) and BigQuery client counters."""
+        stats = {"api": self.controller.metrics()}
+        if self.response_cache is not None:
+            stats["cache"] = self.response_cache.stats()
+        stats["bigquery"] = bigquery_clients.stats()
+        return stats
+
+    def _advance_watermarks(self, watermarks: WatermarkStore, accounts: list[str | None], end_date: str,
+                            stats: dict[str, Any]) -> dict[str, str]:
+        """Move the watermarks of the accounts that did not fail to `end_date`; return them per account."""
+        # Accounts absent from the report had every task committed by a resumed run
+        failed = set(stats["failed_accounts"])
+        advanced = {account: end_date for account in accounts if (account or DEFAULT_ACCOUNT) not in failed}
+        watermarks.advance(self.source_name, advanced, stats["extract_run_id"])
+        return {account or DEFAULT_ACCOUNT: date for account, date in advanced.items()}
+
+    def _incremental_start_date(self, accounts: list[str | None], watermarks: WatermarkStore,
+                                lookback_days: int, initial_start_date: str | None) -> str:
+        """
+        First date of an incremental run: the earliest start among the accounts.
+
+        Raises:
+            ValueError: If an account has no watermark and no initial start date is set
+        """
+        starts = []
+        for account in accounts:
+            watermark = watermarks.get(self.source_name, account)
+            if watermark is None:
+                if not initial_start_date:
+                    raise ValueError(f"No watermark for {self.source_name} account {account or 'default'} "
+                                     f"and no initial start date")
+                starts.append(initial_start_date)
+                continue
+            start = datetime.strptime(watermark, "%Y-%m-%d").date() + timedelta(days=1 - lookback_days)
+            starts.append(start.isoformat())
+        return min(starts)
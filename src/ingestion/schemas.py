@@ -0,0 +1,184 @@
+"""
+Raw-zone schema registry.
+
+Declares the BigQuery schema of every raw table (mdp_raw) so that loads are
+typed explicitly instead of relying on schema autodetection. Autodetect infers
+types from each load's data, so a column such as `cost_usd` could come in as
+INTEGER on a day with round numbers and as FLOAT the next day.
+
+`coerce_rows()` validates and converts a whole batch against a schema in a
+single pass before upload: values are cast to the declared type, unknown
+columns and missing required fields are rejected, and NULL values are omitted
+from the payload.
+
+Raw columns are all declared NULLABLE: tables created before the registry
+(autodetect) or rebuilt by scripts/deduplicate_raw.py (CREATE TABLE AS SELECT)
+have NULLABLE columns, and a load with a REQUIRED column fails on them with a
+mode mismatch. Fields every row must have (`NOT_NULL_FIELDS`) are enforced by
+`coerce_rows()` instead.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+
+# Ingestion metadata columns shared by every raw table (see DataSourceConnector.load_raw)
+METADATA_FIELDS = [
+    bigquery.SchemaField("ingested_at", "TIMESTAMP", description="Timestamp of ingestion"),
+    bigquery.SchemaField("extract_run_id", "STRING", description="Unique run identifier"),
+    bigquery.SchemaField("source", "STRING", description="Source identifier"),
+]
+
+# Raw columns rejected when missing by coerce_rows(), although declared NULLABLE
+NOT_NULL_FIELDS = frozenset({"date", "campaign_id", "ingested_at", "extract_run_id", "source"})
+
+# Content hash of the source columns of a row (see ingestion.fingerprints)
+FINGERPRINT_FIELD = bigquery.SchemaField("row_fingerprint", "INTEGER",
+                                         description="Hash of the row's source columns")
+
+RAW_SCHEMAS = {
+    "google_ads_campaign_daily": [
+        bigquery.SchemaField("date", "DATE"),
+        bigquery.SchemaField("account_id", "STRING"),
+        bigquery.SchemaField("campaign_id", "STRING"),
+        bigquery.SchemaField("campaign_name", "STRING"),
+        bigquery.SchemaField("impressions", "INTEGER"),
+        bigquery.SchemaField("clicks", "INTEGER"),
+        # Fractional with data-driven attribution (INTEGER in tables created before, widened on load)
+        bigquery.SchemaField("conversions", "FLOAT"),
+        bigquery.SchemaField("cost_usd", "FLOAT"),
+        FINGERPRINT_FIELD,
+        *METADATA_FIELDS,
+    ],
+    "meta_ads_campaign_daily": [
+        bigquery.SchemaField("date", "DATE"),
+        bigquery.SchemaField("account_id", "STRING"),
+        bigquery.SchemaField("campaign_id", "STRING"),
+        bigquery.SchemaField("campaign_name", "STRING"),
+        bigquery.SchemaField("impressions", "INTEGER"),
+        bigquery.SchemaField("clicks", "INTEGER"),
+        bigquery.SchemaField("conversions", "INTEGER"),
+        bigquery.SchemaField("spend_usd", "FLOAT"),
+        bigquery.SchemaField("likes", "INTEGER"),
+        bigquery.SchemaField("comments", "INTEGER"),
+        bigquery.SchemaField("shares", "INTEGER"),
+        bigquery.SchemaField("video_views", "INTEGER"),
+        bigquery.SchemaField("page_engagement", "INTEGER"),
+        FINGERPRINT_FIELD,
+        *METADATA_FIELDS,
+    ],
+}
+
+
+def get_raw_schema(table_name: str) -> list[bigquery.SchemaField]:
+    """
+    Get the declared schema of a raw table.
+
+    Args:
+        table_name: Raw table name (ex: "meta_ads_campaign_daily")
+
+    Returns:
+        List of BigQuery schema fields
+
+    Raises:
+        ValueError: If no schema is registered for this table
+    """
+    if table_name not in RAW_SCHEMAS:
+        raise ValueError(f"No raw schema registered for table '{table_name}'")
+    return RAW_SCHEMAS[table_name]
+
+
+def _to_integer(value: Any) -> int:
+    """Cast to int, refusing booleans and floats with a fractional part."""
+    if isinstance(value, bool):
+        raise TypeError("boolean is not an integer")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError("fractional value")
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    """Cast to float, so round amounts are never sent as integers."""
+    if isinstance(value, bool):
+        raise TypeError("boolean is not a float")
+    return float(value)
+
+
+def _to_date(value: Any) -> str:
+    """Normalize a date (or YYYY-MM-DD string) to its ISO format."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return date.fromisoformat(value).isoformat()
+
+
+def _to_timestamp(value: Any) -> str:
+    """Normalize a datetime (or ISO string) to its ISO format."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return datetime.fromisoformat(value).isoformat()
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "STRING": str,
+    "INTEGER": _to_integer,
+    "FLOAT": _to_float,
+    "DATE": _to_date,
+    "TIMESTAMP": _to_timestamp,
+}
+
+
+@lru_cache(maxsize=None)
+def _compile(schema: tuple[bigquery.SchemaField, ...]) -> tuple[tuple[str, str, Callable, bool], ...]:
+    """Resolve the converter of each field, and whether it may be missing, once per schema."""
+    return tuple(
+        (field.name, field.field_type, _CONVERTERS[field.field_type],
+         field.mode == "REQUIRED" or field.name in NOT_NULL_FIELDS)
+        for field in schema
+    )
+
+
+def coerce_rows(rows: Iterable[dict], schema: list[bigquery.SchemaField]) -> list[dict]:
+    """
+    Validate and cast a batch of rows against a raw-table schema.
+
+    Args:
+        rows: Rows to validate (dicts keyed by column name)
+        schema: Schema of the target raw table
+
+    Returns:
+        New list of rows with values cast to the declared types; NULL values
+        are omitted so they don't weigh on the load payload
+
+    Raises:
+        ValueError: On unknown columns, missing required fields (REQUIRED
+            mode or NOT_NULL_FIELDS) or values that cannot be cast to the declared type
+    """
+    columns = _compile(tuple(schema))
+    known_names = frozenset(name for name, *_ in columns)
+
+    coerced = []
+    for index, row in enumerate(rows):
+        unknown = row.keys() - known_names
+        if unknown:
+            raise ValueError(f"Row {index}: unknown columns {sorted(unknown)}")
+
+        record = {}
+        for name, field_type, convert, required in columns:
+            value = row.get(name)
+            if value is None:
+                if required:
+                    raise ValueError(f"Row {index}: missing required field '{name}'")
+                continue
+            try:
+                record[name] = convert(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Row {index}: invalid {field_type} value {value!r} for '{name}' ({e})"
+                ) from e
+        coerced.append(record)
+
+    return coerced
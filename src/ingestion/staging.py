@@ -0,0 +1,132 @@
+"""
+Staging tables, to replace raw slices atomically at the end of a run.
+
+A run loads its batches into its own staging table with load jobs only (no
+DML per batch). When the run finishes, one multi-statement transaction
+deletes the stored rows of every (date, account_id) slice present in the
+staging table and inserts the staged rows: readers see a date either before
+or after the run, never with an account missing, and a failure rolls both
+statements back. The staging table is then dropped.
+
+The staging table is named after the extract_run_id, which a resumed run
+takes over (see ingestion.checkpoints): the rows staged for the tasks the
+interrupted run committed are kept, the rest is discarded before the
+resumed run extracts those tasks again.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+
+# Days the staging table of an interrupted run is kept, for the resumed run to commit it
+STAGING_EXPIRATION_DAYS = 7
+
+# Stored rows of the staged slices are replaced in one transaction. Accounts are
+# compared as is (NULL and '' are different slices); stored rows without
+# account_id, loaded before the column existed, go with every staged date. The
+# dates are read into a variable first, so the DELETE only scans their partitions.
+COMMIT_SCRIPT = """
+    DECLARE staged_dates ARRAY<DATE> DEFAULT (SELECT ARRAY_AGG(DISTINCT date) FROM `{staging_id}`);
+    BEGIN TRANSACTION;
+    DELETE FROM `{table_id}` AS stored
+    WHERE stored.date IN UNNEST(staged_dates)
+      AND (stored.account_id IS NULL
+           OR EXISTS (SELECT 1 FROM `{staging_id}` AS staged
+                      WHERE staged.date = stored.date AND staged.account_id = stored.account_id));
+    INSERT INTO `{table_id}` ({columns})
+    SELECT {columns} FROM `{staging_id}`;
+    COMMIT TRANSACTION;
+"""
+
+# Staged rows outside the committed tasks; a task of the default account (NULL) covers every account
+DISCARD_QUERY = """
+    DELETE FROM `{staging_id}` AS staged
+    WHERE NOT EXISTS (
+        SELECT 1 FROM UNNEST(@committed) AS task
+        WHERE staged.date BETWEEN task.start_date AND task.end_date
+          AND (task.account IS NULL OR staged.account_id = task.account))
+"""
+
+
+def staging_table_id(table_id: str, extract_run_id: str) -> str:
+    """
+    Staging table of a run, next to its raw table.
+
+    Args:
+        table_id: Fully qualified raw table ID (project.dataset.table)
+        extract_run_id: Run ID
+
+    Returns:
+        Fully qualified staging table ID (project.dataset._staging_<table>_<run id>)
+    """
+    project_dataset, table = table_id.rsplit(".", 1)
+    return f"{project_dataset}._staging_{table}_{extract_run_id.replace('-', '')}"
+
+
+def create_staging_table(client: bigquery.Client, staging_id: str, schema: list[bigquery.SchemaField]) -> None:
+    """
+    Create a date-partitioned staging table, expiring after STAGING_EXPIRATION_DAYS.
+
+    Args:
+        client: BigQuery client
+        staging_id: Fully qualified staging table ID
+        schema: Raw table schema
+    """
+    table = bigquery.Table(staging_id, schema=schema)
+    table.time_partitioning = bigquery.TimePartitioning(type_=bigquery.TimePartitioningType.DAY, field="date")
+    # Dropped once committed; the expiration only cleans up runs that are never resumed
+    table.expires = datetime.now(tz=timezone.utc) + timedelta(days=STAGING_EXPIRATION_DAYS)
+    client.create_table(table, exists_ok=True)
+
+
+def commit_staged(client: bigquery.Client, table_id: str, staging_id: str, columns: Sequence[str]) -> None:
+    """
+    Replace the stored slices of the staged rows in one transaction, then drop the staging table.
+
+    Args:
+        client: BigQuery client
+        table_id: Fully qualified raw table ID
+        staging_id: Fully qualified staging table ID
+        columns: Columns inserted (the registered raw schema)
+
+    Raises:
+        Exception: If the transaction fails — it is rolled back and the staging table kept
+    """
+    script = COMMIT_SCRIPT.format(table_id=table_id, staging_id=staging_id, columns=", ".join(columns))
+    client.query(script).result()
+    client.delete_table(staging_id, not_found_ok=True)
+
+
+def discard_uncommitted(client: bigquery.Client, staging_id: str,
+                        committed: Sequence[tuple[str | None, str, str]]) -> bool:
+    """
+    Keep only the rows of committed tasks in the staging table left by an interrupted run.
+
+    Args:
+        client: BigQuery client
+        staging_id: Fully qualified staging table ID
+        committed: (account, start_date, end_date) tasks committed by the interrupted run
+
+    Returns:
+        Whether staged rows are left to commit
+    """
+    try:
+        client.get_table(staging_id)
+    except NotFound:
+        return False
+    if not committed:
+        client.delete_table(staging_id, not_found_ok=True)
+        return False
+
+    job_config = bigquery.QueryJobConfig(query_parameters=[bigquery.ArrayQueryParameter("committed", "STRUCT", [
+        bigquery.StructQueryParameter(
+            None,
+            bigquery.ScalarQueryParameter("account", "STRING", account),
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        )
+        for account, start_date, end_date in committed
+    ])])
+    client.query(DISCARD_QUERY.format(staging_id=staging_id), job_config=job_config).result()
+    return True
@@ -0,0 +1,93 @@
+"""
+Ingestion watermarks: the last date loaded per source and account.
+
+`DataSourceConnector.run_incremental()` starts from the watermark minus a
+late-data lookback instead of a caller-given range, and advances the
+watermarks of the accounts it loaded once the run has completed. All the
+accounts of a run are advanced in a single atomic write of the state file, so
+a crash leaves either the previous watermarks or the new ones.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+import logging
+import os
+import threading
+
+from ingestion.checkpoints import read_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# State file used when no path is given (overridden by INGESTION_WATERMARK_PATH)
+DEFAULT_WATERMARK_PATH = ".checkpoints/watermarks.json"
+
+# Key of a connector's single default account
+DEFAULT_ACCOUNT = "default"
+
+
+class WatermarkStore:
+    """JSON file holding the watermark of each (source, account)."""
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: State file (default: INGESTION_WATERMARK_PATH or .checkpoints/watermarks.json)
+        """
+        self.path = Path(path or os.getenv("INGESTION_WATERMARK_PATH", DEFAULT_WATERMARK_PATH))
+        self._lock = threading.Lock()
+
+    def get(self, source: str, account: str | None = None) -> str | None:
+        """
+        Last date loaded for an account.
+
+        Args:
+            source: Source name (ex: "meta_ads")
+            account: Account ID (None: the connector's default account)
+
+        Returns:
+            Date in YYYY-MM-DD format, or None if the account was never loaded
+        """
+        with self._lock:
+            entry = self._read().get(source, {}).get(account or DEFAULT_ACCOUNT)
+        return entry["watermark"] if entry else None
+
+    def all(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Every watermark of the state file.
+
+        Returns:
+            {source: {account: {watermark, updated_at, extract_run_id}}}
+        """
+        with self._lock:
+            return self._read()
+
+    def advance(self, source: str, watermarks: dict[str | None, str], extract_run_id: str | None = None) -> None:
+        """
+        Move the watermarks of several accounts forward, in one atomic write.
+
+        A watermark never moves back: an older date than the stored one is ignored.
+
+        Args:
+            source: Source name
+            watermarks: {account (None: default account): last date loaded}
+            extract_run_id: Run that loaded the dates (kept for traceability)
+        """
+        if not watermarks:
+            return
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._lock:
+            state = self._read()
+            accounts = state.setdefault(source, {})
+            for account, watermark in watermarks.items():
+                key = account or DEFAULT_ACCOUNT
+                current = accounts.get(key, {}).get("watermark")
+                if current is not None and current >= watermark:
+                    continue
+                accounts[key] = {"watermark": watermark, "updated_at": now, "extract_run_id": extract_run_id}
+            write_json_atomic(self.path, state)
+        logger.info("Advanced %s watermarks of %d accounts", source, len(watermarks))
+
+    def _read(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Load the state file (caller holds the lock)."""
+        return read_json(self.path, {})
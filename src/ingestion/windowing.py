@@ -0,0 +1,111 @@
+"""
+Date windows and row batches, the units connector runs are split into.
+
+A run covers a date range: it is split into windows of a few days
+(`split_date_range`), each extracted for one account as an `ExtractTask`.
+Extracted rows are then grouped into bounded batches (`batched`) before
+being loaded, so memory does not grow with the length of the range.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+# Days after which a date's data is final at the source — more recent dates
+# can still receive late conversions and corrections
+LATE_DATA_DAYS = 7
+
+
+def batched(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """
+    Group an iterable of rows into lists of at most `size` rows.
+
+    Args:
+        rows: Any iterable of rows (list, generator...)
+        size: Maximum number of rows per batch
+
+    Yields:
+        Lists of rows, the last one possibly shorter
+    """
+    if size < 1:
+        raise ValueError(f"Batch size must be >= 1, got {size}")
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_days(start_date: str, end_date: str) -> Iterator[str]:
+    """
+    Iterate over every day between two dates.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+
+    Yields:
+        Dates in YYYY-MM-DD format
+    """
+    current = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    while current <= end:
+        yield current.isoformat()
+        current += timedelta(days=1)
+
+
+def split_date_range(start_date: str, end_date: str, window_days: int) -> list[tuple[str, str]]:
+    """
+    Split a date range into consecutive windows of at most `window_days` days.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+        window_days: Maximum number of days per window
+
+    Returns:
+        List of (start_date, end_date) tuples, inclusive, in chronological order
+    """
+    if window_days < 1:
+        raise ValueError(f"Window size must be >= 1 day, got {window_days}")
+
+    current = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    windows = []
+    while current <= end:
+        window_end = min(current + timedelta(days=window_days - 1), end)
+        windows.append((current.isoformat(), window_end.isoformat()))
+        current = window_end + timedelta(days=1)
+    return windows
+
+
+def merge_ranges(dates: Iterable[str]) -> list[tuple[str, str]]:
+    """
+    Merge dates into contiguous (start_date, end_date) ranges.
+
+    Args:
+        dates: Dates in YYYY-MM-DD format, in any order
+
+    Returns:
+        Inclusive ranges, in chronological order
+    """
+    ranges = []
+    for day in sorted(set(dates)):
+        current = datetime.strptime(day, "%Y-%m-%d").date()
+        if ranges and datetime.strptime(ranges[-1][1], "%Y-%m-%d").date() + timedelta(days=1) == current:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+class ExtractTask(NamedTuple):
+    """One unit of extraction: an account over a date window."""
+
+    account: str | None
+    start_date: str
+    end_date: str
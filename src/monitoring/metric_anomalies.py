@@ -0,0 +1,323 @@
+"""
+Per-campaign metric anomaly detection.
+
+Volume checks count rows per table; they cannot see a single campaign whose
+spend or impressions suddenly jump, or drop to zero. This module pulls a
+compact campaign × day matrix of the core metrics (spend, impressions,
+clicks, conversions) from mart_campaign_daily in one query, and scores every
+campaign at once with NumPy: for each day, the robust z-score of each metric
+against the median and MAD of the campaign's previous `baseline_days` days.
+
+Only campaigns with an established baseline are judged (enough active days
+and a median above a per-metric minimum), so new, tiny or paused campaigns do
+not flood the report. Outliers are returned in the structure rendered by
+`format_volume_report()`, one entry per flagged campaign.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+
+from ingestion.bigquery_clients import get_client
+from monitoring.volume_checks import MAD_TO_SIGMA, MIN_SPREAD_FRACTION
+
+try:
+    import pyarrow  # noqa: F401  # pylint: disable=unused-import
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MART_TABLE = "mdp_marts.mart_campaign_daily"
+
+METRICS = ("spend", "impressions", "clicks", "conversions")
+
+# Days of history each day is compared with
+DEFAULT_BASELINE_DAYS = 28
+
+# Robust z-score above which a metric is flagged (campaigns are noisier than tables)
+DEFAULT_MAX_ROBUST_Z = 5.0
+
+# Days with activity needed in the baseline before a campaign is judged
+MIN_ACTIVE_DAYS = 7
+
+# Baseline median below which a metric is too small to judge
+MIN_BASELINE_MEDIAN = {"spend": 10.0, "impressions": 1000.0, "clicks": 10.0, "conversions": 5.0}
+
+# Metrics whose drop to zero is reported as such
+ZERO_DROP_METRICS = ("spend", "impressions")
+
+CAMPAIGN_MATRIX_QUERY = """
+    SELECT
+        CONCAT(platform, ':', campaign_id) AS campaign_key,
+        ANY_VALUE(campaign_name) AS campaign_name,
+        DATE_DIFF(report_date, @start_date, DAY) AS day_index,
+        SUM(COALESCE(spend, 0)) AS spend,
+        SUM(COALESCE(impressions, 0)) AS impressions,
+        SUM(COALESCE(clicks, 0)) AS clicks,
+        SUM(COALESCE(conversions, 0)) AS conversions
+    FROM `{table_id}`
+    WHERE report_date BETWEEN @start_date AND @end_date
+    GROUP BY campaign_key, day_index
+"""
+
+
+@dataclass
+class CampaignMatrix:
+    """Daily metrics of every campaign over a date range."""
+
+    start_date: date
+    campaign_keys: np.ndarray
+    campaign_names: np.ndarray
+    # Shape (metrics, campaigns, days), in METRICS order; days without a row are 0
+    values: np.ndarray
+
+    @property
+    def days(self) -> int:
+        """Number of days of the matrix."""
+        return self.values.shape[2]
+
+
+def build_campaign_matrix(start_date: date, days: int, *,  # pylint: disable=too-many-arguments
+                          keys: np.ndarray, names: np.ndarray, day_index: np.ndarray,
+                          metrics: dict[str, np.ndarray]) -> CampaignMatrix:
+    """
+    Pivot long-format (campaign, day) rows into a dense campaign × day matrix.
+
+    Args:
+        start_date: Date of day index 0
+        days: Number of days of the range
+        keys: Campaign key of each row
+        names: Campaign name of each row
+        day_index: Day offset of each row from start_date
+        metrics: Values of each row, per metric of METRICS
+
+    Returns:
+        Campaign matrix, campaigns in key order
+    """
+    campaign_keys, first_row, campaign_index = np.unique(keys, return_index=True, return_inverse=True)
+    values = np.zeros((len(METRICS), len(campaign_keys), days))
+    for position, metric in enumerate(METRICS):
+        values[position, campaign_index, day_index] = metrics[metric]
+    return CampaignMatrix(start_date, campaign_keys, np.asarray(names)[first_row], values)
+
+
+def fetch_campaign_matrix(client: bigquery.Client, start_date: date, end_date: date,
+                          table_id: str = MART_TABLE) -> tuple[CampaignMatrix, int]:
+    """
+    Read the campaign × day matrix of a date range in one query.
+
+    Args:
+        client: BigQuery client
+        start_date: First date
+        end_date: Last date (inclusive)
+        table_id: Mart table
+
+    Returns:
+        (matrix, bytes processed by the query)
+    """
+    job = client.query(
+        CAMPAIGN_MATRIX_QUERY.format(table_id=table_id),
+        job_config=bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+        ]),
+    )
+    result = job.result()
+    columns = ("campaign_key", "campaign_name", "day_index", *METRICS)
+    if PYARROW_AVAILABLE:
+        # Columnar download: no Python object per row
+        table = result.to_arrow()
+        data = {name: table.column(name).to_numpy(zero_copy_only=False) for name in columns}
+    else:
+        rows = list(result)
+        data = {name: np.array([row[name] for row in rows]) for name in columns}
+
+    days = (end_date - start_date).days + 1
+    matrix = build_campaign_matrix(
+        start_date, days,
+        keys=data["campaign_key"].astype(str),
+        names=data["campaign_name"].astype(str),
+        day_index=data["day_index"].astype(np.int64),
+        metrics={metric: data[metric].astype(float) for metric in METRICS},
+    )
+    return matrix, job.total_bytes_processed or 0
+
+
+def rolling_robust_z(values: np.ndarray, baseline_days: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Robust z-score of each day against the previous `baseline_days` days, for every series at once.
+
+    Args:
+        values: Array of shape (..., days)
+        baseline_days: Days in each baseline window
+
+    Returns:
+        (z-scores, baseline medians, active baseline days), each of shape
+        (..., days - baseline_days): one column per day that has a full baseline
+    """
+    # windows[..., d, :] holds days d .. d + baseline_days - 1, the baseline of day d + baseline_days
+    windows = sliding_window_view(values[..., :-1], baseline_days, axis=-1)
+    scored = values[..., baseline_days:]
+    medians = np.median(windows, axis=-1)
+    mads = np.median(np.abs(windows - medians[..., None]), axis=-1)
+    spread = np.maximum(np.maximum(MAD_TO_SIGMA * mads, MIN_SPREAD_FRACTION * medians), 1.0)
+    active_days = np.count_nonzero(windows, axis=-1)
+    return (scored - medians) / spread, medians, active_days
+
+
+@dataclass
+class _LastDayScores:
+    """Scores of the last day of a matrix, each of shape (metrics, campaigns)."""
+
+    latest: np.ndarray
+    medians: np.ndarray
+    z_scores: np.ndarray
+    # Metrics with an established baseline, and those flagged among them
+    judged: np.ndarray
+    zero_drop: np.ndarray
+    flagged: np.ndarray
+
+
+def _score_last_day(matrix: CampaignMatrix, baseline_days: int, max_robust_z: float) -> _LastDayScores:
+    """
+    Score the last day of a matrix against the baseline_days before it.
+
+    Args:
+        matrix: Campaign matrix covering at least baseline_days + 1 days
+        baseline_days: Days of history the last day is compared with
+        max_robust_z: Robust z-score above which a metric is flagged
+
+    Returns:
+        Last-day values, baselines and flags of every (metric, campaign)
+    """
+    z_scores, medians, active_days = rolling_robust_z(matrix.values[..., -(baseline_days + 1):], baseline_days)
+    z_scores, medians, active_days = z_scores[..., -1], medians[..., -1], active_days[..., -1]
+    latest = matrix.values[..., -1]
+
+    minimums = np.array([MIN_BASELINE_MEDIAN[metric] for metric in METRICS])[:, None]
+    judged = (active_days >= MIN_ACTIVE_DAYS) & (medians >= minimums)
+    zero_drop = judged & (latest == 0) & np.isin(METRICS, ZERO_DROP_METRICS)[:, None]
+    outlier = judged & (np.abs(z_scores) > max_robust_z)
+    return _LastDayScores(latest, medians, z_scores, judged, zero_drop, zero_drop | outlier)
+
+
+def _campaign_entry(scores: _LastDayScores, campaign: int, label: str, check_date: date) -> dict[str, Any]:
+    """
+    Report entry of a flagged campaign.
+
+    Args:
+        scores: Result of _score_last_day
+        campaign: Campaign index in the matrix
+        label: Campaign key and name
+        check_date: Date scored
+
+    Returns:
+        WARN entry with one issue and the value, baseline median and robust z-score per flagged metric
+    """
+    entry = {"table": label, "status": "WARN", "issues": [], "metrics": {}}
+    for position in np.flatnonzero(scores.flagged[:, campaign]):
+        metric = METRICS[position]
+        value, median = scores.latest[position, campaign], scores.medians[position, campaign]
+        z_score = scores.z_scores[position, campaign]
+        entry["metrics"][metric] = {"value": float(value), "median": float(median),
+                                    "robust_z": round(float(z_score), 2)}
+        if scores.zero_drop[position, campaign]:
+            entry["issues"].append(f"{metric} dropped to zero (median {median:.0f}) on {check_date}")
+        else:
+            entry["issues"].append(
+                f"{metric} {value:.0f} vs median {median:.0f} (robust z {z_score:.1f}) on {check_date}"
+            )
+    return entry
+
+
+def detect_anomalies(matrix: CampaignMatrix, baseline_days: int = DEFAULT_BASELINE_DAYS,
+                     max_robust_z: float = DEFAULT_MAX_ROBUST_Z) -> dict[str, Any]:
+    """
+    Flag the campaigns whose last-day metrics deviate from their own baseline.
+
+    Args:
+        matrix: Campaign matrix covering baseline_days + 1 days
+        baseline_days: Days of history each day is compared with
+        max_robust_z: Robust z-score above which a metric is flagged
+
+    Returns:
+        Results in the format_volume_report() structure: tables_checked holds
+        one WARN entry per flagged campaign, with its issues and per-metric
+        value, baseline median and robust z-score
+
+    Raises:
+        ValueError: If the matrix does not cover baseline_days + 1 days
+    """
+    if matrix.days <= baseline_days:
+        raise ValueError(f"Matrix covers {matrix.days} days, {baseline_days + 1} are needed")
+
+    scores = _score_last_day(matrix, baseline_days, max_robust_z)
+    check_date = matrix.start_date + timedelta(days=matrix.days - 1)
+    results = {"tables_checked": [], "warnings": [], "errors": [], "summary": {}}
+    for campaign in np.flatnonzero(scores.flagged.any(axis=0)):
+        label = f"{matrix.campaign_keys[campaign]} ({matrix.campaign_names[campaign]})"
+        entry = _campaign_entry(scores, campaign, label, check_date)
+        results["tables_checked"].append(entry)
+        results["warnings"].append(f"{label}: {'; '.join(entry['issues'])}")
+
+    scored = int(scores.judged.any(axis=0).sum())
+    warned = len(results["tables_checked"])
+    results["summary"] = {
+        "total_tables": scored,
+        "passed": scored - warned,
+        "warned": warned,
+        "failed": 0,
+        "errored": 0,
+        "overall_status": "PASS",
+        "check_date": check_date.isoformat(),
+    }
+    return results
+
+
+def get_metric_anomalies(project_id: str, check_date: str | None = None,
+                         baseline_days: int = DEFAULT_BASELINE_DAYS,
+                         max_robust_z: float = DEFAULT_MAX_ROBUST_Z) -> dict[str, Any]:
+    """
+    Detect per-campaign metric anomalies on a date, from mart_campaign_daily.
+
+    Args:
+        project_id: GCP project ID for BigQuery
+        check_date: Date checked, YYYY-MM-DD (default: yesterday, UTC)
+        baseline_days: Days of history each campaign is compared with
+        max_robust_z: Robust z-score above which a metric is flagged
+
+    Returns:
+        Results in the format_volume_report() structure (see detect_anomalies);
+        the summary includes wall_seconds and bytes_processed
+    """
+    started = time.perf_counter()
+    day = date.fromisoformat(check_date) if check_date else datetime.now(tz=timezone.utc).date() - timedelta(days=1)
+    client = get_client(project_id)
+
+    try:
+        matrix, bytes_processed = fetch_campaign_matrix(client, day - timedelta(days=baseline_days), day)
+        results = detect_anomalies(matrix, baseline_days, max_robust_z)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Any BigQuery error (table not found, permission denied, etc.) is reported, not raised
+        logger.error("Error detecting metric anomalies in %s: %s", MART_TABLE, e)
+        results = {
+            "tables_checked": [{"table": MART_TABLE, "status": "ERROR", "error": str(e)}],
+            "warnings": [],
+            "errors": [f"{MART_TABLE}: {e}"],
+            "summary": {"total_tables": 1, "passed": 0, "warned": 0, "failed": 0, "errored": 1,
+                        "overall_status": "FAIL", "check_date": day.isoformat()},
+        }
+        bytes_processed = 0
+
+    results["summary"].update(wall_seconds=round(time.perf_counter() - started, 3), bytes_processed=bytes_processed)
+    logger.info("Metric anomalies on %s: %d of %d campaigns flagged (%.2fs)", results["summary"]["check_date"],
+                results["summary"]["warned"], results["summary"]["total_tables"], results["summary"]["wall_seconds"])
+    return results
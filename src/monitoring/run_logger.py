@@ -10,7 +10,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
-from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion.bigquery_clients import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -89,7 +89,7 @@ def log_run_summary(project_id: str, summary: RunSummary) -> dict[str, Any]:
     Raises:
         Exception: If BigQuery insert fails
     """
-    client = bigquery.Client(project=project_id)
+    client = get_client(project_id)
     table_id = f"{project_id}.mdp_marts.run_summary"
 
     end_time = datetime.utcnow()
@@ -148,7 +148,7 @@ def get_recent_runs(project_id: str, limit: int = 10) -> list[dict[str, Any]]:
     Returns:
         List of run summary dictionaries
     """
-    client = bigquery.Client(project=project_id)
+    client = get_client(project_id)
 
     query = f"""
     SELECT
@@ -4,60 +4,93 @@ Volume control checks for data quality monitoring.
 Validates data volumes across all layers of the pipeline (raw, staging, marts)
 and detects anomalies: tables below minimum thresholds, above maximum thresholds,
 or with abnormal day-over-day variance. Called by the main Airflow DAG after dbt runs.
+
+Counts are read per date partition (the table's date column), for the check
+date and the day before, without scanning table history:
+
+- tables partitioned by day on their date column: row counts from the
+  partition metadata (INFORMATION_SCHEMA.PARTITIONS), one query per dataset
+- other tables and views: one generated scan filtered on the date column,
+  pruned to the two partitions (views over partitioned tables included)
+
+All jobs are submitted before any is awaited, and each check records the
+bytes it processed.
+
+Each run also upserts the check date's counts into a small history table
+(VOLUME_HISTORY_TABLE), so the day-over-day comparison is replaced by a
+rolling baseline without re-reading the checked tables: a single query over
+the history returns the median and median absolute deviation (MAD) of the
+same weekday over the last `baseline_weeks` weeks, and the check date's
+count is scored as a robust z-score, (count - median) / (1.4826 × MAD).
+Tables with too short a history keep the day-over-day variance check.
 """
 
 import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 from google.cloud import bigquery  # pylint: disable=no-name-in-module
+from ingestion.bigquery_clients import get_client
 
 logger = logging.getLogger(__name__)
 
-
+# Thresholds apply to the rows of one data date (the check date's partition),
+# not to the rows ingested on a given day: an extraction reloading the late-data
+# window does not raise the count. The staging views hold the raw rows of their
+# source, so raw and staging tables of a source share their thresholds; the mart
+# unions both sources.
 VOLUME_THRESHOLDS = {
     "mdp_marts.mart_campaign_daily": {
         "min_daily_records": 10,
         "max_daily_records": 100000,
         "max_variance_percent": 50,
+        "date_column": "report_date",
         "description": "Daily campaign performance metrics",
     },
     "mdp_staging.stg_google_ads__campaign_daily": {
         "min_daily_records": 5,
         "max_daily_records": 50000,
         "max_variance_percent": 50,
+        "date_column": "report_date",
         "description": "Google Ads staging layer",
     },
     "mdp_staging.stg_meta_ads__campaign_daily": {
         "min_daily_records": 5,
         "max_daily_records": 50000,
         "max_variance_percent": 50,
+        "date_column": "report_date",
         "description": "Meta Ads staging layer",
     },
     "mdp_raw.google_ads_campaign_daily": {
-        "min_daily_records": 1,
+        "min_daily_records": 5,
         "max_daily_records": 50000,
-        "max_variance_percent": 70,
+        "max_variance_percent": 50,
         "description": "Google Ads raw extraction",
     },
     "mdp_raw.meta_ads_campaign_daily": {
-        "min_daily_records": 1,
+        "min_daily_records": 5,
         "max_daily_records": 50000,
-        "max_variance_percent": 70,
+        "max_variance_percent": 50,
         "description": "Meta Ads raw extraction",
     },
 }
 
 
-def _check_thresholds(table_id: str, today_count: int, yesterday_count: int,
-                      thresholds: dict, results: dict) -> dict:
+def _check_thresholds(table_id: str, today_count: int, yesterday_count: int,  # pylint: disable=too-many-arguments
+                      thresholds: dict, results: dict, *, check_variance: bool = True) -> dict:
     """
     Evaluate a single table against its volume thresholds.
 
     Args:
         table_id: Fully qualified table name
-        today_count: Number of records ingested today
-        yesterday_count: Number of records ingested yesterday
+        today_count: Number of records of the check date
+        yesterday_count: Number of records of the day before
         thresholds: Threshold configuration for this table
         results: Shared results dict to append warnings/errors to
+        check_variance: Whether to flag the day-over-day variance (off when a
+            rolling baseline is available, see _check_baseline)
 
     Returns:
         Table result dict with status and issues
@@ -97,91 +130,480 @@ def _check_thresholds(table_id: str, today_count: int, yesterday_count: int,
             f"{table_id}: Exceeds maximum threshold ({today_count}/{max_rec})"
         )
 
-    if variance_percent > max_var:
+    if check_variance and variance_percent > max_var:
         table_result["status"] = "WARN"
         table_result["issues"].append(
             f"Day-over-day variance ({variance_percent:.1f}%) exceeds threshold ({max_var}%)"
         )
         results["warnings"].append(
-            f"{table_id}: High variance ({variance_percent:.1f}%, yesterday: {yesterday_count})"
+            f"{table_id}: High variance ({variance_percent:.1f}%, day before: {yesterday_count})"
         )
 
     return table_result
 
 
-def _query_count(client: bigquery.Client, table_id: str, date_filter: str) -> int:
+# Date column of a checked table, unless its thresholds set "date_column"
+DEFAULT_DATE_COLUMN = "date"
+
+PARTITION_COUNTS_QUERY = """
+    SELECT table_name, partition_id, total_rows
+    FROM `{dataset}.INFORMATION_SCHEMA.PARTITIONS`
+    WHERE table_name IN UNNEST(@table_names)
+      AND partition_id IN UNNEST(@partition_ids)
+"""
+
+SCAN_COUNTS_QUERY = """
+    SELECT
+        '{table_id}' AS table_id,
+        COUNTIF({column} = @check_date) AS today_count,
+        COUNTIF({column} = DATE_SUB(@check_date, INTERVAL 1 DAY)) AS yesterday_count
+    FROM `{table_id}`
+    WHERE {column} BETWEEN DATE_SUB(@check_date, INTERVAL 1 DAY) AND @check_date
+"""
+
+PARTITION_METADATA = "partition_metadata"
+PRUNED_SCAN = "pruned_scan"
+
+
+def _date_column(table_id: str) -> str:
+    """Date column of a checked table."""
+    return VOLUME_THRESHOLDS.get(table_id, {}).get("date_column", DEFAULT_DATE_COLUMN)
+
+
+def _count_method(client: bigquery.Client, table_id: str) -> str:
     """
-    Query record count for a table filtered by ingested_at date.
+    How a table's daily counts are read, from its metadata (no query).
 
     Args:
         client: BigQuery client
         table_id: Fully qualified table name
-        date_filter: SQL date expression (e.g. 'CURRENT_DATE()')
 
     Returns:
-        Record count as integer
+        PARTITION_METADATA for tables partitioned by day on their date column, else PRUNED_SCAN
     """
-    query = (
-        f"SELECT COUNT(*) as record_count FROM `{table_id}` "
-        f"WHERE DATE(ingested_at) = {date_filter}"
-    )
-    rows = list(client.query(query).result())
-    return rows[0]["record_count"] if rows else 0
+    table = client.get_table(table_id)
+    partitioning = table.time_partitioning
+    if table.table_type == "TABLE" and partitioning is not None and partitioning.type_ == "DAY" \
+            and partitioning.field == _date_column(table_id):
+        return PARTITION_METADATA
+    return PRUNED_SCAN
 
 
-def get_volume_checks(project_id: str) -> dict[str, Any]:
+def _submit_counts_query(client: bigquery.Client, method: str, table_ids: list[str],
+                         check_date: date) -> bigquery.QueryJob:
     """
-    Execute volume checks for all tables in VOLUME_THRESHOLDS.
+    Submit the query counting the check date and the day before of several tables.
 
     Args:
-        project_id: GCP project ID for BigQuery
+        client: BigQuery client
+        method: PARTITION_METADATA (tables of a single dataset) or PRUNED_SCAN
+        table_ids: Fully qualified table names
+        check_date: Date checked (compared with the day before)
 
     Returns:
-        Dictionary with check results for each table
+        Running query job
     """
-    client = bigquery.Client(project=project_id)
-    results = {"tables_checked": [], "warnings": [], "errors": [], "summary": {}}
+    if method == PARTITION_METADATA:
+        days = (check_date - timedelta(days=1), check_date)
+        query = PARTITION_COUNTS_QUERY.format(dataset=table_ids[0].rsplit(".", 1)[0])
+        parameters = [
+            bigquery.ArrayQueryParameter("table_names", "STRING", [t.rsplit(".", 1)[1] for t in table_ids]),
+            bigquery.ArrayQueryParameter("partition_ids", "STRING", [d.strftime("%Y%m%d") for d in days]),
+        ]
+    else:
+        query = "    UNION ALL".join(
+            SCAN_COUNTS_QUERY.format(table_id=table_id, column=_date_column(table_id)) for table_id in table_ids
+        )
+        parameters = [bigquery.ScalarQueryParameter("check_date", "DATE", check_date)]
+    return client.query(query, job_config=bigquery.QueryJobConfig(query_parameters=parameters))
 
-    for table_id, thresholds in VOLUME_THRESHOLDS.items():
-        logger.info("Checking volume for %s...", table_id)
 
-        try:
-            today_count = _query_count(client, table_id, "CURRENT_DATE()")
-            yesterday_count = _query_count(
-                client, table_id, "DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)"
-            )
+def _read_counts(job: bigquery.QueryJob, method: str, table_ids: list[str],
+                 check_date: date) -> dict[str, tuple[int, int]]:
+    """
+    Wait for a counts query and read (check date, day before) counts per table.
 
-            table_result = _check_thresholds(
-                table_id, today_count, yesterday_count, thresholds, results
-            )
-            results["tables_checked"].append(table_result)
-            logger.info("  %s: %d records (variance: %.1f%%)",
-                        table_id, today_count, table_result["variance_percent"])
+    Args:
+        job: Job returned by _submit_counts_query
+        method: Method of the job
+        table_ids: Tables of the job
+        check_date: Date checked
 
+    Returns:
+        {table_id: (today_count, yesterday_count)}, 0 for dates without rows
+    """
+    rows = job.result()
+    if method == PARTITION_METADATA:
+        dataset = table_ids[0].rsplit(".", 1)[0]
+        check_id = check_date.strftime("%Y%m%d")
+        counts = {table_id: [0, 0] for table_id in table_ids}
+        for row in rows:
+            counts[f"{dataset}.{row['table_name']}"][0 if row["partition_id"] == check_id else 1] = \
+                int(row["total_rows"] or 0)
+        return {table_id: tuple(count) for table_id, count in counts.items()}
+
+    counts = {row["table_id"]: (row["today_count"], row["yesterday_count"]) for row in rows}
+    return {table_id: counts.get(table_id, (0, 0)) for table_id in table_ids}
+
+
+def _group_by_count_method(client: bigquery.Client, table_ids: list[str]) \
+        -> tuple[dict[str, Exception], list[tuple[str, list[str]]]]:
+    """
+    Group tables by the query that counts them: one per dataset of partitioned tables, one for the others.
+
+    Args:
+        client: BigQuery client
+        table_ids: Fully qualified table names
+
+    Returns:
+        ({table_id: error} for the tables whose metadata could not be read, [(method, table_ids)])
+    """
+    def count_method(table_id: str) -> str | Exception:
+        try:
+            return _count_method(client, table_id)
         except Exception as e:  # pylint: disable=broad-exception-caught
-            # Any BigQuery error (table not found, permission denied, etc.) is caught here
-            logger.error("  Error checking %s: %s", table_id, str(e))
-            results["errors"].append(f"{table_id}: {str(e)}")
-            results["tables_checked"].append(
-                {"table": table_id, "status": "ERROR", "error": str(e)}
-            )
+            return e
+
+    # Table metadata calls are free but sequential round trips: run them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, len(table_ids))) as pool:
+        methods = dict(zip(table_ids, pool.map(count_method, table_ids)))
+
+    errors = {table_id: method for table_id, method in methods.items() if isinstance(method, Exception)}
+    groups = defaultdict(list)
+    for table_id, method in methods.items():
+        if not isinstance(method, Exception):
+            dataset = table_id.rsplit(".", 1)[0] if method == PARTITION_METADATA else None
+            groups[(method, dataset)].append(table_id)
+    return errors, [(method, tables) for (method, _), tables in groups.items()]
+
+
+def _query_counts(client: bigquery.Client, table_ids: list[str],
+                  check_date: date) -> dict[str, dict[str, Any] | Exception]:
+    """
+    Read the check date's and the previous day's record counts of every table in one pass.
+
+    Partitioned tables are counted from partition metadata (one query per
+    dataset), the others by a single partition-pruned scan; all queries run
+    concurrently. If a query covering several tables fails (ex: a missing
+    column), its tables are queried one by one so that each error is
+    reported against its own table.
+
+    Args:
+        client: BigQuery client
+        table_ids: Fully qualified table names
+        check_date: Date checked
+
+    Returns:
+        {table_id: {today_count, yesterday_count, method, bytes_processed}, or the
+        error raised for that table}; bytes_processed is the table's share of its job
+    """
+    results, pending = _group_by_count_method(client, table_ids)
+    while pending:
+        # Jobs run concurrently on BigQuery's side: submit them all before waiting on any
+        jobs = []
+        for method, tables in pending:
+            try:
+                jobs.append((method, tables, _submit_counts_query(client, method, tables, check_date)))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                jobs.append((method, tables, e))
+
+        pending = []
+        for method, tables, job in jobs:
+            try:
+                if isinstance(job, Exception):
+                    raise job
+                counts = _read_counts(job, method, tables, check_date)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                if len(tables) > 1:
+                    logger.warning("Batched volume query (%s) failed, checking its tables one by one: %s",
+                                   method, e)
+                    pending += [(method, [table_id]) for table_id in tables]
+                else:
+                    results[tables[0]] = e
+                continue
+
+            bytes_share = (job.total_bytes_processed or 0) // len(tables)
+            for table_id, (today_count, yesterday_count) in counts.items():
+                results[table_id] = {"today_count": today_count, "yesterday_count": yesterday_count,
+                                     "method": method, "bytes_processed": bytes_share}
+    return results
+
+
+# Daily counts of the checked tables, one row per (table, date)
+VOLUME_HISTORY_TABLE = "mdp_marts.volume_history"
+
+VOLUME_HISTORY_SCHEMA = [
+    bigquery.SchemaField("table_id", "STRING", mode="REQUIRED"),
+    bigquery.SchemaField("check_date", "DATE", mode="REQUIRED"),
+    bigquery.SchemaField("row_count", "INTEGER", mode="REQUIRED"),
+    bigquery.SchemaField("recorded_at", "TIMESTAMP", mode="REQUIRED"),
+]
+
+# Weeks of history the baseline of a weekday is computed over
+BASELINE_WEEKS = 8
+
+# Same-weekday history points needed before the baseline replaces the day-over-day check
+MIN_BASELINE_DAYS = 3
+
+# Robust z-score above which a count is flagged, unless a table sets "max_robust_z"
+DEFAULT_MAX_ROBUST_Z = 3.5
+
+# Floor of the baseline spread, as a fraction of the median: a perfectly flat
+# history (MAD = 0) would otherwise flag a one-row difference
+MIN_SPREAD_FRACTION = 0.05
+
+# Scales the MAD to a standard deviation for normally distributed counts
+MAD_TO_SIGMA = 1.4826
+
+HISTORY_MERGE_QUERY = """
+    MERGE `{history_table}` history
+    USING (SELECT * FROM UNNEST(@counts)) counts
+    ON history.table_id = counts.table_id AND history.check_date = @check_date
+    WHEN MATCHED THEN
+        UPDATE SET row_count = counts.row_count, recorded_at = CURRENT_TIMESTAMP()
+    WHEN NOT MATCHED THEN
+        INSERT (table_id, check_date, row_count, recorded_at)
+        VALUES (counts.table_id, @check_date, counts.row_count, CURRENT_TIMESTAMP())
+"""
+
+BASELINE_QUERY = """
+    WITH same_weekday AS (
+        SELECT table_id, row_count
+        FROM `{history_table}`
+        WHERE check_date >= DATE_SUB(@check_date, INTERVAL @baseline_days DAY)
+          AND check_date < @check_date
+          AND EXTRACT(DAYOFWEEK FROM check_date) = EXTRACT(DAYOFWEEK FROM @check_date)
+          AND table_id IN UNNEST(@table_ids)
+    ),
+    medians AS (
+        SELECT DISTINCT
+            table_id,
+            PERCENTILE_CONT(row_count, 0.5) OVER (PARTITION BY table_id) AS median,
+            COUNT(*) OVER (PARTITION BY table_id) AS baseline_days
+        FROM same_weekday
+    )
+    SELECT DISTINCT
+        table_id,
+        median,
+        baseline_days,
+        PERCENTILE_CONT(ABS(row_count - median), 0.5) OVER (PARTITION BY table_id) AS mad
+    FROM same_weekday
+    JOIN medians USING (table_id)
+"""
+
+
+def _robust_z(count: int, median: float, mad: float) -> float:
+    """
+    Robust z-score of a count against a baseline median and MAD.
+
+    Args:
+        count: Count to score
+        median: Baseline median
+        mad: Baseline median absolute deviation
+
+    Returns:
+        (count - median) / spread, the spread being 1.4826 × MAD floored at
+        MIN_SPREAD_FRACTION of the median (and at 1 row)
+    """
+    spread = max(MAD_TO_SIGMA * mad, MIN_SPREAD_FRACTION * median, 1.0)
+    return (count - median) / spread
+
+
+def _check_baseline(table_result: dict, baseline: dict, thresholds: dict, results: dict) -> None:
+    """
+    Flag a count that deviates from the table's same-weekday baseline.
+
+    Args:
+        table_result: Result of _check_thresholds (table and check date count), updated in place
+        baseline: Row of BASELINE_QUERY (median, mad, baseline_days)
+        thresholds: Threshold configuration for this table
+        results: Shared results dict to append warnings to
+    """
+    table_id = table_result["table"]
+    z_score = _robust_z(table_result["today_count"], baseline["median"], baseline["mad"])
+    max_z = thresholds.get("max_robust_z", DEFAULT_MAX_ROBUST_Z)
+    table_result.update(
+        baseline_median=round(baseline["median"], 1),
+        baseline_days=baseline["baseline_days"],
+        robust_z=round(z_score, 2),
+    )
+    if abs(z_score) > max_z:
+        if table_result["status"] == "PASS":
+            table_result["status"] = "WARN"
+        table_result["issues"].append(
+            f"Robust z-score ({z_score:.1f}) vs same-weekday median ({baseline['median']:.0f}) "
+            f"exceeds threshold ({max_z})"
+        )
+        results["warnings"].append(
+            f"{table_id}: Unusual volume (z={z_score:.1f}, median: {baseline['median']:.0f})"
+        )
+
+
+def _update_history(client: bigquery.Client, counts: dict[str, dict[str, Any] | Exception],
+                    check_date: date, baseline_weeks: int) -> tuple[dict[str, dict], int]:
+    """
+    Upsert the check date's counts into the history table and read the baselines.
+
+    Both statements only touch the history table and run concurrently: the
+    baselines exclude the check date itself.
+
+    Args:
+        client: BigQuery client
+        counts: Result of _query_counts
+        check_date: Date checked
+        baseline_weeks: Weeks of history per baseline
+
+    Returns:
+        ({table_id: {median, mad, baseline_days}}, bytes processed by both statements)
+    """
+    counted = {table_id: count for table_id, count in counts.items() if not isinstance(count, Exception)}
+    if not counted:
+        return {}, 0
+
+    table = bigquery.Table(f"{client.project}.{VOLUME_HISTORY_TABLE}", schema=VOLUME_HISTORY_SCHEMA)
+    table.time_partitioning = bigquery.TimePartitioning(
+        type_=bigquery.TimePartitioningType.DAY, field="check_date"
+    )
+    table.clustering_fields = ["table_id"]
+    client.create_table(table, exists_ok=True)
+
+    merge = client.query(
+        HISTORY_MERGE_QUERY.format(history_table=VOLUME_HISTORY_TABLE),
+        job_config=bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("check_date", "DATE", check_date),
+            bigquery.ArrayQueryParameter("counts", "STRUCT", [
+                bigquery.StructQueryParameter(
+                    None,
+                    bigquery.ScalarQueryParameter("table_id", "STRING", table_id),
+                    bigquery.ScalarQueryParameter("row_count", "INT64", count["today_count"]),
+                )
+                for table_id, count in counted.items()
+            ]),
+        ]),
+    )
+    baseline = client.query(
+        BASELINE_QUERY.format(history_table=VOLUME_HISTORY_TABLE),
+        job_config=bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("check_date", "DATE", check_date),
+            bigquery.ScalarQueryParameter("baseline_days", "INT64", 7 * baseline_weeks),
+            bigquery.ArrayQueryParameter("table_ids", "STRING", list(counted)),
+        ]),
+    )
+    baselines = {
+        row["table_id"]: {"median": row["median"], "mad": row["mad"], "baseline_days": row["baseline_days"]}
+        for row in baseline.result()
+    }
+    merge.result()
+    return baselines, (merge.total_bytes_processed or 0) + (baseline.total_bytes_processed or 0)
 
-    passed = sum(1 for t in results["tables_checked"] if t["status"] == "PASS")
-    warned = sum(1 for t in results["tables_checked"] if t["status"] == "WARN")
-    failed = sum(1 for t in results["tables_checked"] if t["status"] == "FAIL")
-    errored = sum(1 for t in results["tables_checked"] if t["status"] == "ERROR")
 
-    results["summary"] = {
-        "total_tables": len(results["tables_checked"]),
-        "passed": passed,
-        "warned": warned,
+def _check_table(table_id: str, count: dict[str, Any] | Exception, baseline: dict | None,
+                 thresholds: dict, results: dict) -> dict:
+    """
+    Check one table's counts against its thresholds and, with enough history, its baseline.
+
+    Args:
+        table_id: Fully qualified table name
+        count: Entry of _query_counts for the table
+        baseline: Entry of _update_history for the table, if any
+        thresholds: Threshold configuration for this table
+        results: Shared results dict to append warnings/errors to
+
+    Returns:
+        Table result dict with status and issues
+    """
+    if isinstance(count, Exception):
+        # Any BigQuery error (table not found, permission denied, etc.) ends up here
+        logger.error("  Error checking %s: %s", table_id, str(count))
+        results["errors"].append(f"{table_id}: {str(count)}")
+        return {"table": table_id, "status": "ERROR", "error": str(count)}
+
+    if baseline is not None and baseline["baseline_days"] < MIN_BASELINE_DAYS:
+        baseline = None
+    table_result = _check_thresholds(
+        table_id, count["today_count"], count["yesterday_count"], thresholds, results,
+        check_variance=baseline is None,
+    )
+    if baseline is not None:
+        _check_baseline(table_result, baseline, thresholds, results)
+    table_result.update(method=count["method"], bytes_processed=count["bytes_processed"])
+    logger.info("  %s: %d records (variance: %.1f%%, %s, %d bytes)",
+                table_id, count["today_count"], table_result["variance_percent"],
+                count["method"], count["bytes_processed"])
+    return table_result
+
+
+def _summarize(tables_checked: list[dict]) -> dict[str, Any]:
+    """
+    Count the table results per status.
+
+    Args:
+        tables_checked: Table result dicts
+
+    Returns:
+        Summary dict (total_tables, passed, warned, failed, errored, overall_status)
+    """
+    statuses = [t["status"] for t in tables_checked]
+    failed, errored = statuses.count("FAIL"), statuses.count("ERROR")
+    return {
+        "total_tables": len(statuses),
+        "passed": statuses.count("PASS"),
+        "warned": statuses.count("WARN"),
         "failed": failed,
         "errored": errored,
         "overall_status": "PASS" if failed == 0 and errored == 0 else "FAIL",
     }
 
-    logger.info("Volume check summary: %d passed, %d warned, %d failed, %d errored",
-                passed, warned, failed, errored)
+
+def get_volume_checks(project_id: str, check_date: str | None = None,
+                      baseline_weeks: int = BASELINE_WEEKS) -> dict[str, Any]:
+    """
+    Execute volume checks for all tables in VOLUME_THRESHOLDS.
+
+    Each table's rows for the check date are compared with the day before
+    (reported as today_count and yesterday_count) and, once the history
+    table holds enough of them, with the same weekday of the previous
+    `baseline_weeks` weeks (robust z-score).
+
+    Args:
+        project_id: GCP project ID for BigQuery
+        check_date: Date checked, YYYY-MM-DD (default: yesterday, UTC — the last complete day)
+        baseline_weeks: Weeks of history per baseline
+
+    Returns:
+        Dictionary with check results for each table (including the count
+        method, bytes_processed and, with a baseline, baseline_median,
+        baseline_days and robust_z); the summary includes the check_date, the
+        wall-clock time of the checks (wall_seconds) and the total bytes_processed
+    """
+    started = time.perf_counter()
+    day = date.fromisoformat(check_date) if check_date else datetime.now(tz=timezone.utc).date() - timedelta(days=1)
+    client = get_client(project_id)
+    results = {"tables_checked": [], "warnings": [], "errors": [], "summary": {}}
+
+    logger.info("Checking volume for %d tables on %s...", len(VOLUME_THRESHOLDS), day)
+    counts = _query_counts(client, list(VOLUME_THRESHOLDS), day)
+    try:
+        baselines, history_bytes = _update_history(client, counts, day, baseline_weeks)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # The checks still run, with the day-over-day comparison only
+        logger.warning("Could not update the volume history (%s): %s", VOLUME_HISTORY_TABLE, e)
+        baselines, history_bytes = {}, 0
+
+    for table_id, thresholds in VOLUME_THRESHOLDS.items():
+        results["tables_checked"].append(
+            _check_table(table_id, counts[table_id], baselines.get(table_id), thresholds, results)
+        )
+
+    results["summary"] = _summarize(results["tables_checked"])
+    results["summary"].update(
+        check_date=day.isoformat(),
+        wall_seconds=round(time.perf_counter() - started, 3),
+        bytes_processed=history_bytes + sum(t.get("bytes_processed", 0) for t in results["tables_checked"]),
+    )
+
+    logger.info("Volume check summary: %(passed)d passed, %(warned)d warned, %(failed)d failed, "
+                "%(errored)d errored (%(wall_seconds).2fs)", results["summary"])
 
     return results
 
@@ -203,8 +625,11 @@ def format_volume_report(results: dict[str, Any]) -> str:
         "=" * 80,
         "",
         f"Overall Status: {summary['overall_status']}",
+        f"Check date: {summary.get('check_date', 'n/a')}",
         f"Results: {summary['passed']} PASS, {summary['warned']} WARN, "
         f"{summary['failed']} FAIL, {summary['errored']} ERROR",
+        f"Checked in: {summary.get('wall_seconds', 0.0):.2f}s "
+        f"({summary.get('bytes_processed', 0)} bytes processed)",
         "",
         "Table Details:",
         "-" * 80,
@@ -218,10 +643,17 @@ def format_volume_report(results: dict[str, Any]) -> str:
 
         if "today_count" in table:
             report.append(
-                f"  Today: {table['today_count']} | "
-                f"Yesterday: {table['yesterday_count']} | "
+                f"  Check date: {table['today_count']} | "
+                f"Day before: {table['yesterday_count']} | "
                 f"Variance: {table['variance_percent']}%"
             )
+        if "robust_z" in table:
+            report.append(
+                f"  Weekday median: {table['baseline_median']} ({table['baseline_days']} days) | "
+                f"Robust z: {table['robust_z']}"
+            )
+        if "method" in table:
+            report.append(f"  Method: {table['method']} | Bytes processed: {table['bytes_processed']}")
 
         for issue in table.get("issues", []):
             report.append(f"  ! {issue}")
@@ -0,0 +1,34 @@
+"""Unit tests for the payload archive (local directory)."""
+
+from ingestion.archive import PayloadArchive
+
+
+def test_archive_is_partitioned_by_source_date_and_account(tmp_path):
+    """Test that each (date, account) of an extracted range gets its own compressed file."""
+    archive = PayloadArchive(tmp_path)
+    archive.write("meta_ads", "act_1", {"2024-01-01": [{"date": "2024-01-01", "clicks": 1}], "2024-01-02": []})
+    archive.write("meta_ads", None, {"2024-01-01": [{"date": "2024-01-01", "clicks": 2}]})
+
+    names = sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.jsonl.gz"))
+    assert [name.rsplit("/", 1)[0] for name in names] == [
+        "meta_ads/date=2024-01-01/account=act_1",
+        "meta_ads/date=2024-01-01/account=default",
+        "meta_ads/date=2024-01-02/account=act_1",
+    ]
+
+
+def test_latest_extraction_of_each_date_wins(tmp_path):
+    """Test that a date extracted again is read from its newest file only."""
+    archive = PayloadArchive(tmp_path)
+    archive.write("google_ads", "1", {"2024-01-01": [{"date": "2024-01-01", "clicks": 1}]})
+    archive.write("google_ads", "1", {"2024-01-01": [{"date": "2024-01-01", "clicks": 5}]})
+    archive.write("google_ads", "2", {"2024-01-01": [{"date": "2024-01-01", "clicks": 7}]})
+
+    files = archive.latest_files("google_ads", ["2024-01-01", "2024-01-02"])
+    assert list(files) == ["2024-01-01"]
+    assert [archive.read(name) for name in files["2024-01-01"]] == [
+        [{"date": "2024-01-01", "clicks": 5}],
+        [{"date": "2024-01-01", "clicks": 7}],
+    ]
+    only_second = archive.latest_files("google_ads", ["2024-01-01"], accounts=["2"])
+    assert [archive.read(name) for name in only_second["2024-01-01"]] == [[{"date": "2024-01-01", "clicks": 7}]]
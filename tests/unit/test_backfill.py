@@ -0,0 +1,77 @@
+"""Unit tests for the gap-aware backfill planner (no BigQuery access)."""
+
+from datetime import datetime, timezone
+
+from ingestion.backfill import (
+    PartitionInfo,
+    estimate_api_calls,
+    find_gaps,
+    merge_ranges,
+    plan_backfill,
+)
+from ingestion.meta_ads.connector import MetaAdsConnector
+
+
+def settled(rows=10):
+    """Partition loaded long after its late-data window."""
+    return PartitionInfo(rows, datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+
+def test_find_gaps_reports_missing_empty_and_unsettled_dates():
+    """Test that absent or empty partitions are missing and early loads are stale."""
+    partitions = {
+        "2024-01-01": settled(),
+        "2024-01-02": settled(rows=0),
+        "2024-01-04": PartitionInfo(10, datetime(2024, 1, 6, 12)),
+        "2024-01-05": PartitionInfo(10, datetime(2024, 1, 12, tzinfo=timezone.utc)),
+    }
+
+    missing, stale = find_gaps(partitions, "2024-01-01", "2024-01-05", late_days=7)
+
+    assert missing == ["2024-01-02", "2024-01-03"]
+    assert stale == ["2024-01-04"]
+
+
+def test_partitions_verified_unchanged_after_their_window_are_not_stale():
+    """Test that a partition left as is by a re-pull after its late-data window is consolidated."""
+    early = datetime(2024, 1, 3, tzinfo=timezone.utc)
+    partitions = {"2024-01-01": PartitionInfo(10, early), "2024-01-02": PartitionInfo(10, early)}
+    checks = {"2024-01-01": datetime(2024, 1, 20), "2024-01-02": datetime(2024, 1, 4, tzinfo=timezone.utc)}
+
+    missing, stale = find_gaps(partitions, "2024-01-01", "2024-01-02", late_days=7, checks=checks)
+
+    assert missing == []
+    assert stale == ["2024-01-02"]
+
+
+def test_merge_ranges_builds_contiguous_windows():
+    """Test that dates are merged into minimal contiguous ranges, whatever their order."""
+    dates = ["2024-01-05", "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-31", "2024-02-01"]
+
+    assert merge_ranges(dates) == [("2024-01-01", "2024-01-03"), ("2024-01-05", "2024-01-05"),
+                                   ("2024-01-31", "2024-02-01")]
+    assert merge_ranges([]) == []
+
+
+def test_estimate_api_calls_counts_windows_accounts_and_pages():
+    """Test one call per (account, window), plus extra pages for paged APIs."""
+    ranges = [("2024-01-01", "2024-01-10"), ("2024-02-01", "2024-02-01")]
+
+    assert estimate_api_calls(ranges, window_days=5, accounts=3) == (3, 9)
+    # 100 rows/day over 5 days with 200-row pages: 3 pages per window
+    assert estimate_api_calls(ranges, window_days=5, rows_per_account_day=100, page_size=200) == (3, 7)
+
+
+def test_plan_backfill_only_schedules_gaps():
+    """Test that a plan covers the missing and stale dates of the connector's raw table."""
+    partitions = {f"2024-03-{d:02d}": settled(rows=1000) for d in range(1, 32) if d not in (10, 11, 20)}
+    connector = MetaAdsConnector()
+
+    plan = plan_backfill(connector, "2024-03-01", "2024-03-31", partitions=partitions)
+
+    assert plan.ranges == [("2024-03-10", "2024-03-11"), ("2024-03-20", "2024-03-20")]
+    assert plan.dates == 3
+    assert plan.windows == 2
+    # 1000 rows/day in 500-row pages: 4 pages for the 2-day window, 2 for the single day
+    assert plan.estimated_api_calls == 6
+    assert "Estimated API calls  : 6" in plan.describe()
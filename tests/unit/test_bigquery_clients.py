@@ -0,0 +1,94 @@
+"""Unit tests for the shared BigQuery client registry."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import google.auth
+import pytest
+import requests
+from google.auth.credentials import AnonymousCredentials
+
+from fake_apis.http_server import serve_in_background
+from ingestion import bigquery_clients
+
+
+@pytest.fixture(name="created")
+def fixture_created(monkeypatch):
+    """Replace client creation with a slow stand-in and record each creation."""
+    created = []
+    lock = threading.Lock()
+
+    class FakeClient:  # pylint: disable=too-few-public-methods
+        def __init__(self, project_id, credentials_path):
+            self.project_id, self.credentials_path, self.closed = project_id, credentials_path, False
+
+        def close(self):
+            self.closed = True
+
+    def create(project_id, credentials_path):
+        time.sleep(0.05)  # Resolving credentials takes a while: concurrent callers overlap
+        client = FakeClient(project_id, credentials_path)
+        with lock:
+            created.append(client)
+        return client
+
+    monkeypatch.setattr(bigquery_clients, "_create_client", create)
+    monkeypatch.delenv("GOOGLE_APPLICATION_CREDENTIALS", raising=False)
+    bigquery_clients.close_clients()
+    yield created
+    bigquery_clients.close_clients()
+
+
+def test_concurrent_callers_share_one_client_per_project_and_credentials(created):
+    """Test that worker threads get the same client, created once per (project, credentials)."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: bigquery_clients.get_client("proj-a"), range(16)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+
+    assert bigquery_clients.get_client("proj-b") is not created[0]
+    assert bigquery_clients.get_client("proj-a", "/keys/other.json").credentials_path == "/keys/other.json"
+    assert len(created) == 3
+    assert bigquery_clients.stats()["clients"] == 3
+
+
+def test_close_clients_closes_and_forgets_every_client(created):
+    """Test that closing the registry closes the clients and the next call builds a new one."""
+    first = bigquery_clients.get_client("proj-a")
+    before = bigquery_clients.stats()["clients_created"]
+    bigquery_clients.close_clients()
+
+    assert first.closed
+    assert bigquery_clients.get_client("proj-a") is not first
+    assert bigquery_clients.stats()["clients_created"] == before + 1
+    assert len(created) == 2
+
+
+def test_pooled_adapter_counts_the_connections_it_opens():
+    """Test that each connection opened by a registry session is counted."""
+    session = requests.Session()
+    session.mount("http://", bigquery_clients._PooledAdapter())  # pylint: disable=protected-access
+    before = bigquery_clients.stats()["connections_created"]
+
+    with serve_in_background() as server:
+        for _ in range(3):
+            # The stand-in server speaks HTTP/1.0: one connection per request
+            params = {"time_range": '{"since": "2024-01-01", "until": "2024-01-01"}'}
+            session.get(f"{server.base_url}/v19.0/act_1/insights", params=params, timeout=5).close()
+
+    assert bigquery_clients.stats()["connections_created"] == before + 3
+
+
+def test_created_client_sends_its_requests_through_the_pooled_session(monkeypatch):
+    """Test that the client uses the registry session, passed through the private `_http` hook."""
+    monkeypatch.setattr(google.auth, "default", lambda scopes=None: (AnonymousCredentials(), None))
+    monkeypatch.setenv("BIGQUERY_POOL_SIZE", "4")
+
+    client = bigquery_clients._create_client("proj-a", None)  # pylint: disable=protected-access
+
+    adapter = client._http.get_adapter("https://bigquery.googleapis.com")  # pylint: disable=protected-access
+    assert isinstance(adapter, bigquery_clients._PooledAdapter)  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+    client.close()
@@ -0,0 +1,35 @@
+"""Unit tests for the ingestion run checkpoint store."""
+
+from ingestion.checkpoints import CheckpointStore
+from ingestion.windowing import ExtractTask
+
+
+def test_committed_tasks_survive_a_new_store(tmp_path):
+    """Test that commits are persisted and reloaded with the interrupted run's settings."""
+    path = tmp_path / "state" / "ingestion.json"
+    checkpoint = CheckpointStore(path).open_run("meta_ads", "2024-01-01", "2024-01-31", 7, "run-1")
+    checkpoint.commit(ExtractTask("act_1", "2024-01-01", "2024-01-07"))
+
+    resumed = CheckpointStore(path).open_run("meta_ads", "2024-01-01", "2024-01-31", 31, "run-2")
+
+    assert resumed.resumed
+    assert resumed.extract_run_id == "run-1"
+    assert resumed.window_days == 7
+    assert resumed.is_done(ExtractTask("act_1", "2024-01-01", "2024-01-07"))
+    assert not resumed.is_done(ExtractTask("act_2", "2024-01-01", "2024-01-07"))
+    assert [p.name for p in path.parent.iterdir()] == ["ingestion.json"]
+
+
+def test_finish_and_discard_clear_the_run(tmp_path):
+    """Test that a finished or discarded run starts over, leaving other runs untouched."""
+    store = CheckpointStore(tmp_path / "ingestion.json")
+    for source in ("meta_ads", "google_ads"):
+        store.open_run(source, "2024-01-01", "2024-01-31", 31, f"{source}-run").commit(
+            ExtractTask(None, "2024-01-01", "2024-01-31")
+        )
+
+    store.open_run("meta_ads", "2024-01-01", "2024-01-31", 31, "next").finish()
+    assert list(store.runs()) == ["google_ads/2024-01-01/2024-01-31"]
+    assert store.discard("google_ads", "2024-01-01", "2024-01-31")
+    assert not store.discard("google_ads", "2024-01-01", "2024-01-31")
+    assert not store.open_run("google_ads", "2024-01-01", "2024-01-31", 31, "fresh").resumed
@@ -0,0 +1,52 @@
+"""Unit tests for the Arrow / Parquet raw load path."""
+
+import io
+
+import pytest
+
+from ingestion.schemas import coerce_rows, get_raw_schema
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from ingestion.columnar import to_parquet_bytes, to_record_batch  # noqa: E402  # pylint: disable=wrong-import-position
+
+
+def _rows(count):
+    return coerce_rows(
+        [
+            {
+                "date": "2024-01-01",
+                "campaign_id": f"c{i}",
+                "impressions": 100 + i,
+                "cost_usd": 10,
+                "ingested_at": "2024-01-02T03:04:05+00:00",
+                "extract_run_id": "run-1",
+                "source": "google_ads",
+            }
+            for i in range(count)
+        ],
+        get_raw_schema("google_ads_campaign_daily"),
+    )
+
+
+def test_record_batch_types_and_dictionary_encoded_metadata():
+    """Test that columns get BigQuery-compatible types and metadata is dictionary-encoded."""
+    batch = to_record_batch(_rows(3), get_raw_schema("google_ads_campaign_daily"))
+
+    assert batch.num_rows == 3
+    assert batch.schema.field("date").type == pa.date32()
+    assert batch.schema.field("cost_usd").type == pa.float64()
+    assert pa.types.is_dictionary(batch.schema.field("extract_run_id").type)
+    assert len(batch.column(batch.schema.get_field_index("source")).dictionary) == 1
+
+
+def test_parquet_round_trip():
+    """Test that the Parquet payload reads back to the same values."""
+    rows = _rows(5)
+    table = pq.read_table(io.BytesIO(to_parquet_bytes(
+        to_record_batch(rows, get_raw_schema("google_ads_campaign_daily"))
+    )))
+
+    assert table.column("campaign_id").to_pylist() == [r["campaign_id"] for r in rows]
+    assert table.column("conversions").null_count == 5
@@ -3,8 +3,11 @@
 # pylint: disable=unused-import
 # Add src to PYTHONPATH to fix relative imports in VS Code, pytest, pylint, etc.
 """
-from fake_apis.google_ads_api import get_campaign_daily as get_google_ads
-from fake_apis.meta_ads_api import get_campaign_daily as get_meta_ads
+import numpy as np
+
+from fake_apis.generator import CampaignDailyGenerator
+from fake_apis.google_ads_api import FakeGoogleAdsAPI, get_campaign_daily as get_google_ads
+from fake_apis.meta_ads_api import FakeMetaAdsAPI, get_campaign_daily as get_meta_ads
 
 
 class TestGoogleAdsAPI:
@@ -70,3 +73,83 @@ class TestMetaAdsAPI:
         for record in result:
             for field in meta_fields:
                 assert field in record, f"Missing Meta field: {field}"
+
+    def test_accounts_are_generated_separately(self):
+        """Test that each simulated account can be fetched on its own, reproducibly."""
+        api = FakeMetaAdsAPI(n_accounts=3, campaigns_per_account=2, seed=5)
+        accounts = api.list_accounts()
+        first = [r for chunk in api.iter_campaign_daily_data("2024-01-01", "2024-01-02", account_id=accounts[0])
+                 for r in chunk]
+        again = [r for chunk in FakeMetaAdsAPI(seed=5, campaigns_per_account=2).iter_campaign_daily_data(
+            "2024-01-01", "2024-01-02", account_id=accounts[0]) for r in chunk]
+
+        assert len(accounts) == 3
+        assert len(first) == 4
+        assert {r["account_id"] for r in first} == {accounts[0]}
+        assert first == again
+
+    def test_account_alone_matches_its_rows_among_all_accounts(self):
+        """Test that fetching one account returns the same rows as that account within every account's data."""
+        api = FakeMetaAdsAPI(n_accounts=3, campaigns_per_account=2)
+        every = [r for chunk in api.iter_campaign_daily_data("2024-01-01", "2024-01-03") for r in chunk]
+
+        for account in api.list_accounts():
+            alone = [r for chunk in api.iter_campaign_daily_data("2024-01-01", "2024-01-03", account_id=account)
+                     for r in chunk]
+            assert alone == [r for r in every if r["account_id"] == account]
+
+    def test_from_env_sets_the_scale_of_both_apis(self, monkeypatch):
+        """Test that the FAKE_ADS_* variables set the accounts, campaigns and seed of each fake API."""
+        monkeypatch.setenv("FAKE_ADS_ACCOUNTS", "3")
+        monkeypatch.setenv("FAKE_ADS_CAMPAIGNS_PER_ACCOUNT", "4")
+        monkeypatch.setenv("FAKE_ADS_SEED", "11")
+
+        for api in (FakeMetaAdsAPI.from_env(), FakeGoogleAdsAPI.from_env()):
+            assert len(api.list_accounts()) == 3
+            assert api.campaigns_per_account == 4
+            assert api.seed == 11
+
+
+class TestCampaignDailyGenerator:
+    """Test the vectorized fake data generator."""
+
+    def test_scale_and_identifiers(self):
+        """Test that every account × campaign × day combination is generated once."""
+        generator = CampaignDailyGenerator("google_ads", n_accounts=3, campaigns_per_account=4, seed=1)
+        chunk = generator.generate("2024-01-01", "2024-01-10")
+
+        assert len(chunk["date"]) == 3 * 4 * 10
+        assert len(set(zip(chunk["date"].tolist(), chunk["campaign_id"].tolist()))) == 120
+        assert len(set(chunk["account_id"].tolist())) == 3
+
+    def test_account_campaign_ids_do_not_depend_on_other_accounts(self):
+        """Test that explicit account IDs namespace the campaign IDs of each account."""
+        generator = CampaignDailyGenerator("meta_ads", campaigns_per_account=2, account_ids=["act_1", "act_2"])
+
+        assert generator.campaign_ids.tolist() == [
+            "fb_campaign_act_1_001", "fb_campaign_act_1_002", "fb_campaign_act_2_001", "fb_campaign_act_2_002",
+        ]
+        assert generator.account_ids.tolist() == ["act_1", "act_1", "act_2", "act_2"]
+
+    def test_seed_is_reproducible_whatever_the_chunking(self):
+        """Test that a seed yields identical data in one block or in chunks."""
+        whole = CampaignDailyGenerator("meta_ads", campaigns_per_account=50, seed=7).generate(
+            "2024-01-01", "2024-01-31"
+        )
+        chunks = list(CampaignDailyGenerator("meta_ads", campaigns_per_account=50, seed=7).iter_chunks(
+            "2024-01-01", "2024-01-31", chunk_rows=120
+        ))
+
+        assert len(chunks) > 1
+        assert np.array_equal(whole["likes"], np.concatenate([c["likes"] for c in chunks]))
+
+    def test_metrics_are_consistent(self):
+        """Test clicks <= impressions, conversions <= clicks and no spend without clicks."""
+        chunk = CampaignDailyGenerator("google_ads", campaigns_per_account=500, seed=3).generate(
+            "2024-01-01", "2024-02-29"
+        )
+
+        assert (chunk["clicks"] <= chunk["impressions"]).all()
+        assert (chunk["conversions"] <= chunk["clicks"]).all()
+        assert (chunk["cost_usd"][chunk["clicks"] == 0] == 0).all()
+        assert np.corrcoef(chunk["clicks"], chunk["cost_usd"])[0, 1] > 0.5
@@ -0,0 +1,100 @@
+"""Unit tests for the local HTTP stand-in of the ads APIs."""
+
+import json
+import urllib.error
+import urllib.request
+from urllib.parse import urlencode
+
+import pytest
+
+from fake_apis.http_server import ServerConfig, serve_in_background
+from ingestion.google_ads.connector import GoogleAdsConnector
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read())
+
+
+def _insights_url(server, **params):
+    query = {"time_range": json.dumps({"since": "2024-01-01", "until": "2024-01-10"}), **params}
+    return f"{server.base_url}/v19.0/act_123/insights?{urlencode(query)}"
+
+
+def test_meta_insights_pages_follow_next_links():
+    """Test that following paging.next returns every campaign-day exactly once."""
+    with serve_in_background(ServerConfig(page_size=7, campaigns_per_account=3)) as server:
+        url, rows = _insights_url(server, limit=100), []
+        while url:
+            status, headers, body = _get(url)
+            assert status == 200
+            assert "X-Business-Use-Case-Usage" in headers
+            assert len(body["data"]) <= 7
+            rows += body["data"]
+            url = body["paging"].get("next")
+
+    assert len(rows) == 30
+    assert len({(r["date_start"], r["campaign_id"]) for r in rows}) == 30
+
+
+def test_meta_rate_limit_returns_throttling_error():
+    """Test that calls above the per-account budget get Meta's error code 80000."""
+    with serve_in_background(ServerConfig(rate_limit_calls=2)) as server:
+        statuses = [_get(_insights_url(server))[0] for _ in range(3)]
+        _, headers, body = _get(_insights_url(server))
+
+    assert statuses == [200, 200, 400]
+    assert body["error"]["code"] == 80000
+    usage = json.loads(headers["X-Business-Use-Case-Usage"])["123"][0]
+    assert usage["call_count"] == 100
+
+
+def test_google_search_stream_batches():
+    """Test that searchStream returns the date range split into result batches."""
+    query = ("SELECT campaign.id, segments.date, metrics.impressions FROM campaign "
+             "WHERE segments.date BETWEEN '2024-01-01' AND '2024-01-04'")
+    with serve_in_background(ServerConfig(page_size=5, campaigns_per_account=3)) as server:
+        request = urllib.request.Request(
+            f"{server.base_url}/v17/customers/1234567890/googleAds:searchStream",
+            data=json.dumps({"query": query}).encode(),
+            method="POST",
+        )
+        with urllib.request.urlopen(request) as response:
+            batches = json.loads(response.read())
+
+    assert [len(b["results"]) for b in batches] == [5, 5, 2]
+    assert batches[0]["results"][0]["segments"]["date"] == "2024-01-01"
+
+
+def test_google_connector_extracts_from_the_server(monkeypatch):
+    """Test that GOOGLE_ADS_API_BASE_URL runs the connector's real-API path against the server."""
+    with serve_in_background(ServerConfig(page_size=4, campaigns_per_account=3)) as server:
+        monkeypatch.setenv("GOOGLE_ADS_API_BASE_URL", server.base_url)
+        connector = GoogleAdsConnector(use_real_api=True, accounts=["123-456-7890"])
+        pages = list(connector.extract_pages("2024-01-01", "2024-01-05", account="1234567890"))
+
+    assert [len(page) for page in pages] == [4, 4, 4, 3]
+    rows = [row for page in pages for row in page]
+    assert {row.account_id for row in rows} == {"1234567890"}
+    assert len({(row.date, row.campaign_id) for row in rows}) == 15
+    assert server.stats["requests"] == 1
+
+
+def test_meta_connector_extracts_from_the_server(monkeypatch):
+    """Test that META_ADS_API_BASE_URL routes the SDK's insights calls and paging to the server."""
+    pytest.importorskip("facebook_business")
+    from ingestion.meta_ads.connector import MetaAdsConnector  # pylint: disable=import-outside-toplevel
+
+    for name in ("META_ADS_APP_ID", "META_ADS_APP_SECRET", "META_ADS_ACCESS_TOKEN"):
+        monkeypatch.setenv(name, "test")
+    with serve_in_background(ServerConfig(page_size=4, campaigns_per_account=3)) as server:
+        monkeypatch.setenv("META_ADS_API_BASE_URL", server.base_url)
+        connector = MetaAdsConnector(use_real_api=True, insights_mode="sync", accounts=["act_123"])
+        rows = [row for page in connector.extract_pages("2024-01-01", "2024-01-05", account="act_123")
+                for row in page]
+
+    assert len({(row.date, row.campaign_id) for row in rows}) == 15
+    assert server.stats["requests"] == 4
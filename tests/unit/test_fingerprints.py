@@ -0,0 +1,33 @@
+"""Unit tests for raw row fingerprints."""
+
+from ingestion.fingerprints import fingerprint_columns, partition_digest, row_fingerprint
+from ingestion.schemas import coerce_rows, get_raw_schema
+
+SCHEMA = get_raw_schema("google_ads_campaign_daily")
+METADATA = {"ingested_at": "2024-01-02T00:00:00+00:00", "extract_run_id": "run", "source": "google_ads"}
+
+
+def fingerprint(row):
+    [coerced] = coerce_rows([{**METADATA, **row}], SCHEMA)
+    return row_fingerprint(coerced, fingerprint_columns(SCHEMA))
+
+
+def test_fingerprint_ignores_metadata_and_value_types():
+    """Test that fingerprints only depend on the coerced source values."""
+    row = {"date": "2024-01-01", "campaign_id": "c1", "impressions": 100, "cost_usd": 2}
+    rerun = {**row, "impressions": "100", "cost_usd": 2.0,
+             "ingested_at": "2024-02-01T00:00:00+00:00", "extract_run_id": "other", "source": "google_ads"}
+
+    assert "ingested_at" not in fingerprint_columns(SCHEMA)
+    assert fingerprint(row) == fingerprint(rerun)
+    assert fingerprint(row) != fingerprint({**row, "cost_usd": 2.01})
+    assert -2**63 <= fingerprint(row) < 2**63
+
+
+def test_partition_digest_is_order_independent():
+    """Test that a partition digest changes with its content, not its row order."""
+    fingerprints = [fingerprint({"date": "2024-01-01", "campaign_id": f"c{i}", "clicks": i}) for i in range(5)]
+
+    assert partition_digest(fingerprints) == partition_digest(reversed(fingerprints))
+    assert partition_digest(fingerprints)[0] == 5
+    assert partition_digest(fingerprints) != partition_digest(fingerprints[:4])
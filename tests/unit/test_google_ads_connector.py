@@ -0,0 +1,97 @@
+"""Unit tests for Google Ads GAQL extraction, against a recorded searchStream response."""
+
+from pathlib import Path
+
+import pytest
+
+from fake_apis.google_ads_recorded import RecordedGoogleAdsClient
+from ingestion.archive import PayloadArchive
+from ingestion.google_ads.connector import GoogleAdsConnector
+from ingestion.records import GoogleAdsCampaignDaily
+from ingestion.response_cache import ResponseCache
+from ingestion.schemas import coerce_rows, get_raw_schema
+
+RECORDING = Path(__file__).parent / "fixtures" / "google_ads_search_stream.json"
+
+
+def make_connector():
+    return GoogleAdsConnector(client=RecordedGoogleAdsClient.from_file(RECORDING))
+
+
+def test_stream_batches_become_pages_of_records():
+    """Test that each streamed batch is converted into one page of typed records."""
+    pages = list(make_connector().extract_pages("2024-01-01", "2024-01-02"))
+
+    assert [len(page) for page in pages] == [2, 1]
+    first = pages[0][0]
+    assert isinstance(first, GoogleAdsCampaignDaily)
+    assert first.to_dict() == {
+        "date": "2024-01-01", "campaign_id": "111", "campaign_name": "Summer Sale Campaign",
+        "impressions": 12034, "clicks": 231, "conversions": 12.4, "cost_usd": 184.56,
+        "account_id": "1234567890",
+    }
+
+
+def test_missing_metrics_read_as_zero():
+    """Test that metrics omitted by the API (zero values) become 0, not errors."""
+    record = make_connector().extract("2024-01-01", "2024-01-02")[1]
+    assert (record.clicks, record.conversions, record.cost_usd) == (0, 0, 0.0)
+
+
+def test_fields_outside_the_recording_raise():
+    """Test that only the omitted metrics of the field mask have a default."""
+    batch = next(RecordedGoogleAdsClient.from_file(RECORDING).get_service("GoogleAdsService")
+                 .search_stream(customer_id="1234567890", query="SELECT ..."))
+    row = batch.results[1]
+
+    assert row.metrics.cost_micros == 0
+    with pytest.raises(AttributeError):
+        _ = row.metrics.video_views
+    with pytest.raises(AttributeError):
+        _ = row.campaign.status
+
+
+def test_query_filters_on_the_requested_dates():
+    """Test that the GAQL query is built for the window being extracted."""
+    connector = make_connector()
+    list(connector.extract_pages("2024-03-01", "2024-03-31"))
+
+    query = connector._client.service.requests[0]["query"]  # pylint: disable=protected-access
+    assert "FROM campaign" in query
+    assert "segments.date BETWEEN '2024-03-01' AND '2024-03-31'" in query
+
+
+def test_records_match_the_raw_schema():
+    """Test that extracted records pass raw-zone validation."""
+    rows = make_connector().extract("2024-01-01", "2024-01-02")
+    schema = [f for f in get_raw_schema("google_ads_campaign_daily") if f.name in rows[0]]
+    assert len(coerce_rows(rows, schema)) == 3
+
+
+def test_extract_archives_without_a_cache_under_the_customer_id(tmp_path, monkeypatch):
+    """Test that extract() archives each range when only the archive is enabled, keyed on the customer ID."""
+    monkeypatch.setenv("GOOGLE_ADS_CUSTOMER_ID", "123-456-7890")
+    connector = make_connector()
+    connector.response_cache = None
+    connector.archive = PayloadArchive(tmp_path)
+
+    connector.extract("2024-01-01", "2024-01-02")
+
+    files = connector.archive.latest_files("google_ads", ["2024-01-01", "2024-01-02"])
+    assert [name.split("/")[-2] for names in files.values() for name in names] == ["account=1234567890"] * 2
+
+
+def test_cache_is_keyed_on_the_configured_customer_id(tmp_path, monkeypatch):
+    """Test that changing GOOGLE_ADS_CUSTOMER_ID does not serve the previous customer's cached rows."""
+    cache = ResponseCache(tmp_path)
+    monkeypatch.setenv("GOOGLE_ADS_CUSTOMER_ID", "1111111111")
+    first = make_connector()
+    first.response_cache = cache
+    first.extract("2024-01-01", "2024-01-02")
+
+    monkeypatch.setenv("GOOGLE_ADS_CUSTOMER_ID", "2222222222")
+    other = make_connector()
+    other.response_cache = cache
+    other.extract("2024-01-01", "2024-01-02")
+
+    assert len(other._client.service.requests) == 1  # pylint: disable=protected-access
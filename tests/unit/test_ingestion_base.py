@@ -0,0 +1,698 @@
+"""Unit tests for the DataSourceConnector base class (no BigQuery access)."""
+
+import pytest
+
+import threading
+import time
+
+import pyarrow.parquet as pq
+
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery  # pylint: disable=no-name-in-module
+
+from ingestion.base import DataSourceConnector
+from ingestion.concurrency import ConcurrencyController, run_concurrently
+from ingestion.records import EnrichedRows
+from ingestion.windowing import batched, iter_days, split_date_range
+from ingestion.checkpoints import CheckpointStore
+from ingestion.archive import PayloadArchive
+from ingestion.fingerprints import partition_digest
+from ingestion.response_cache import ResponseCache
+from ingestion.staging import staging_table_id
+from ingestion.watermarks import WatermarkStore
+
+
+class DummyConnector(DataSourceConnector):
+    """Connector yielding one page per day and recording BigQuery writes."""
+
+    def __init__(self):
+        super().__init__(source_name="google_ads", project_id="test-project")
+        self.written_batches = []
+
+    def extract(self, start_date, end_date):
+        return [row for page in self.extract_pages(start_date, end_date) for row in page]
+
+    def extract_pages(self, start_date, end_date, account=None):
+        for day in iter_days(start_date, end_date):
+            yield [{"date": day, "campaign_id": f"c{i}", **({"account_id": account} if account else {})}
+                   for i in range(3)]
+
+    def write_to_bigquery(self, rows, staged_slices=None, run_metadata=None):
+        self.written_batches.append(list(EnrichedRows(rows, run_metadata or {})))
+
+    def _discard_uncommitted(self, extract_run_id, committed):
+        return False
+
+
+class FakeLoadJob:  # pylint: disable=too-few-public-methods
+    """Completed load job stand-in."""
+
+    def __init__(self, rows):
+        self.output_rows = len(rows)
+
+    def result(self):
+        return self
+
+
+class FakeBigQueryClient:
+    """Records load jobs, queries and staging tables instead of calling BigQuery."""
+
+    def __init__(self, stored_schema=None):
+        self.loads = []
+        self.queries = []
+        self.tables = set()
+        self.deleted_tables = []
+        self.stored_schema = stored_schema
+        self.lock = threading.Lock()
+
+    def create_table(self, table, exists_ok=False):
+        self.tables.add(f"{table.project}.{table.dataset_id}.{table.table_id}")
+        if self.stored_schema is not None:
+            # The table already exists: BigQuery returns it as stored
+            return bigquery.Table(table.reference, schema=self.stored_schema)
+        return table
+
+    def get_table(self, table_id):
+        if table_id not in self.tables:
+            raise NotFound(table_id)
+        return bigquery.Table(table_id)
+
+    def delete_table(self, table_id, not_found_ok=False):
+        self.tables.discard(table_id)
+        self.deleted_tables.append(table_id)
+
+    def query(self, query, job_config=None):
+        with self.lock:
+            self.queries.append((query, job_config))
+        return FakeLoadJob([])
+
+    def load_table_from_json(self, rows, table_id, job_config):
+        rows = list(rows)
+        with self.lock:
+            self.loads.append((table_id, job_config.write_disposition, rows))
+        return FakeLoadJob(rows)
+
+    def load_table_from_file(self, file_obj, table_id, job_config):
+        rows = pq.read_table(file_obj).to_pylist()
+        with self.lock:
+            self.loads.append((table_id, job_config.write_disposition, rows))
+        return FakeLoadJob(rows)
+
+
+def test_batched_splits_rows():
+    """Test that batched yields full batches and a shorter remainder."""
+    batches = list(batched(range(7), 3))
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_batched_rejects_invalid_size():
+    """Test that a batch size below 1 is rejected."""
+    with pytest.raises(ValueError):
+        list(batched([1], 0))
+
+
+def test_iter_days_is_inclusive():
+    """Test that iter_days covers both bounds, across a month boundary."""
+    assert list(iter_days("2024-01-30", "2024-02-02")) == [
+        "2024-01-30", "2024-01-31", "2024-02-01", "2024-02-02"
+    ]
+
+
+def test_load_raw_adds_metadata():
+    """Test that load_raw attaches the same run metadata to every row."""
+    rows = DummyConnector().load_raw([{"date": "2024-01-01"}, {"date": "2024-01-02"}])
+    assert {r["source"] for r in rows} == {"google_ads"}
+    assert len({r["extract_run_id"] for r in rows}) == 1
+    assert all("ingested_at" in r for r in rows)
+
+
+def test_enriched_rows_do_not_copy_raw_rows():
+    """Test that enrichment keeps raw rows untouched and builds dicts on access."""
+    raw = [{"date": "2024-01-01"}, {"date": "2024-01-02"}]
+    rows = EnrichedRows(raw, {"source": "google_ads"})
+
+    assert rows.rows is raw
+    assert "source" not in raw[0]
+    assert rows[-1] == {"date": "2024-01-02", "source": "google_ads"}
+    assert [r["date"] for r in rows[:1]] == ["2024-01-01"]
+
+
+def test_run_streaming_flushes_bounded_batches():
+    """Test that streaming mode never writes more than batch_size rows at once."""
+    connector = DummyConnector()
+    stats = connector.run_streaming("2024-01-01", "2024-01-05", batch_size=4)
+
+    assert stats["rows"] == 15
+    assert stats["batches"] == 4
+    assert max(len(b) for b in connector.written_batches) <= 4
+    run_ids = {r["extract_run_id"] for b in connector.written_batches for r in b}
+    assert run_ids == {stats["extract_run_id"]}
+
+
+def test_split_date_range_windows():
+    """Test that windows are contiguous, bounded and cover the full range."""
+    windows = split_date_range("2024-01-01", "2024-03-10", 31)
+    assert windows == [
+        ("2024-01-01", "2024-01-31"),
+        ("2024-02-01", "2024-03-02"),
+        ("2024-03-03", "2024-03-10"),
+    ]
+
+
+def test_run_concurrently_bounds_in_flight_calls():
+    """Test that no more than max_workers calls run at the same time."""
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def work(item):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+        return item * 2
+
+    results = dict(run_concurrently(work, list(range(10)), max_workers=3))
+    assert results == {i: i * 2 for i in range(10)}
+    assert state["peak"] <= 3
+
+
+def test_run_loads_each_window_and_returns_rows_in_date_order():
+    """Test that run() loads one batch per window and returns rows sorted by window."""
+    connector = DummyConnector()
+    rows = connector.run("2024-01-01", "2024-01-10", window_days=3, max_workers=2)
+
+    assert len(connector.written_batches) == 4
+    assert [r["date"] for r in rows] == sorted(r["date"] for r in rows)
+    assert len(rows) == 30
+    # A plain list of dicts, as before the metadata envelope
+    assert isinstance(rows, list) and rows[0]["source"] == "google_ads"
+
+
+def transactions(client):
+    """Multi-statement transactions sent to the client."""
+    return [query for query, _ in client.queries if "BEGIN TRANSACTION" in query]
+
+
+def test_write_to_bigquery_stages_run_batches_and_commits_them_once():
+    """Test that a run's batches are only loaded into its staging table until the run commits them."""
+    connector = DummyConnector()
+    client = FakeBigQueryClient()
+    connector.bq_client = client
+    run_metadata = connector.new_run_metadata()
+    staging_id = staging_table_id(connector.raw_table_id, run_metadata["extract_run_id"])
+
+    def rows(start_date, end_date, account):
+        return [row for page in connector.extract_pages(start_date, end_date, account) for row in page]
+
+    staged = set()
+    DataSourceConnector.write_to_bigquery(connector, rows("2024-01-01", "2024-01-02", "a1"), staged, run_metadata)
+    DataSourceConnector.write_to_bigquery(connector, [{"date": "2024-01-02", "campaign_id": "c0", "account_id": ""}],
+                                          staged, run_metadata)
+
+    assert staged == {("2024-01-01", "a1"), ("2024-01-02", "a1"), ("2024-01-02", "")}
+    assert not any(query.lstrip().startswith(("DELETE", "INSERT")) or "TRANSACTION" in query
+                   for query, _ in client.queries)
+    assert sorted(table_id for table_id, _, _ in client.loads) == [
+        f"{staging_id}$20240101", f"{staging_id}$20240102", f"{staging_id}$20240102",
+    ]
+
+    connector._commit_staged(run_metadata["extract_run_id"])  # pylint: disable=protected-access
+    (script,) = transactions(client)
+    assert script.index("DELETE FROM") < script.index("INSERT INTO") < script.index("COMMIT TRANSACTION")
+    # '' and NULL accounts are different slices
+    assert "IFNULL" not in script and "staged.account_id = stored.account_id" in script
+    assert client.deleted_tables == [staging_id]
+
+
+def test_write_to_bigquery_without_a_run_commits_right_away():
+    """Test that a standalone write stages its rows and replaces their slices in one transaction."""
+    connector = DummyConnector()
+    client = FakeBigQueryClient()
+    connector.bq_client = client
+
+    DataSourceConnector.write_to_bigquery(connector, connector.load_raw([{"date": "2024-01-01", "campaign_id": "c1"}]))
+
+    assert len(transactions(client)) == 1
+    assert client.loads[0][0].split("$")[0] == client.deleted_tables[0]
+
+
+def test_integer_columns_now_declared_float_are_widened_before_loading():
+    """Test that fractional conversions are loaded as is into a table created with an INTEGER column."""
+    connector = DummyConnector()
+    stored = [bigquery.SchemaField("conversions", "INTEGER") if field.name == "conversions" else field
+              for field in connector.raw_schema]
+    client = FakeBigQueryClient(stored_schema=stored)
+    connector.bq_client = client
+
+    rows = [{"date": "2024-01-01", "campaign_id": "c1", "conversions": 0.4}]
+    DataSourceConnector.write_to_bigquery(connector, connector.load_raw(rows))
+
+    assert client.queries[0][0] == (
+        f"ALTER TABLE `{connector.raw_table_id}` ALTER COLUMN conversions SET DATA TYPE FLOAT64"
+    )
+    assert client.loads[0][2][0]["conversions"] == 0.4
+
+
+def test_existing_table_is_aligned_with_the_registered_schema_before_commits():
+    """Test that stored REQUIRED columns are relaxed and missing ones added, as staged rows are inserted as is."""
+    connector = DummyConnector()
+    stored = [bigquery.SchemaField(field.name, field.field_type, mode="REQUIRED") if field.name == "campaign_id"
+              else field for field in connector.raw_schema if field.name != "account_id"]
+    client = FakeBigQueryClient(stored_schema=stored)
+    connector.bq_client = client
+
+    DataSourceConnector.write_to_bigquery(connector, connector.load_raw([{"date": "2024-01-01", "campaign_id": "c1"}]))
+
+    alters = [query for query, _ in client.queries if query.startswith("ALTER TABLE")]
+    assert alters == [
+        f"ALTER TABLE `{connector.raw_table_id}` ALTER COLUMN campaign_id DROP NOT NULL",
+        f"ALTER TABLE `{connector.raw_table_id}` ADD COLUMN IF NOT EXISTS account_id STRING",
+    ]
+
+
+class SlowConnector(DummyConnector):
+    """Dummy connector whose extraction and loads each take a fixed time."""
+
+    def __init__(self, extract_delay=0.0, load_delay=0.0, fail_on_write=False):
+        super().__init__()
+        self.extract_delay = extract_delay
+        self.load_delay = load_delay
+        self.fail_on_write = fail_on_write
+        self.pages_extracted = 0
+        self.max_ahead = 0
+
+    def extract_pages(self, start_date, end_date, account=None):
+        for page in super().extract_pages(start_date, end_date, account):
+            time.sleep(self.extract_delay)
+            self.pages_extracted += 1
+            yield page
+
+    def write_to_bigquery(self, rows, staged_slices=None, run_metadata=None):
+        if self.fail_on_write:
+            raise RuntimeError("load failed")
+        self.max_ahead = max(self.max_ahead, self.pages_extracted - len(self.written_batches))
+        time.sleep(self.load_delay)
+        super().write_to_bigquery(rows, staged_slices, run_metadata)
+
+
+def test_run_pipelined_loads_every_row_and_overlaps_stages():
+    """Test that pipelined mode writes all rows while extraction overlaps the loads."""
+    connector = SlowConnector(extract_delay=0.05, load_delay=0.05)
+    stats = connector.run_pipelined("2024-01-01", "2024-01-08", batch_size=3,
+                                    window_days=1, max_workers=1)
+
+    assert stats["rows"] == 24
+    assert stats["batches"] == 8
+    assert sum(len(b) for b in connector.written_batches) == 24
+    assert stats["overlap_seconds"] > 0.1
+    assert stats["wall_seconds"] < stats["extract_seconds"] + stats["load_seconds"]
+
+
+def test_run_pipelined_applies_backpressure():
+    """Test that extraction never runs more than the queue size ahead of the loads."""
+    connector = SlowConnector(load_delay=0.02)
+    connector.run_pipelined("2024-01-01", "2024-01-20", batch_size=3,
+                            window_days=1, max_workers=1, queue_size=2)
+
+    # Batch being loaded + 2 queued + 1 being handed over + 1 window done in the extract pool
+    assert 2 < connector.max_ahead <= 5
+
+
+def test_run_pipelined_propagates_load_errors():
+    """Test that a failing load stops the pipeline and is raised to the caller."""
+    connector = SlowConnector(fail_on_write=True)
+    with pytest.raises(RuntimeError, match="load failed"):
+        connector.run_pipelined("2024-01-01", "2024-01-30", batch_size=3, window_days=1)
+    assert connector.pages_extracted < 30
+
+
+def test_controller_bounds_in_flight_calls_per_account():
+    """Test that concurrent calls for one account never exceed the concurrency limit."""
+    controller = ConcurrencyController(initial_concurrency=2, max_concurrency=2)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def call():
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.01)
+        with lock:
+            state["running"] -= 1
+
+    results = list(run_concurrently(lambda _: controller.call("acc", call), range(12), max_workers=6))
+    assert len(results) == 12
+    assert state["peak"] == 2
+    assert controller.metrics()["calls"] == 12
+    assert controller.metrics()["throttled_seconds"] > 0
+
+
+def test_controller_adapts_concurrency_to_usage():
+    """Test additive increase on low usage and multiplicative decrease on high usage."""
+    controller = ConcurrencyController(initial_concurrency=4, max_concurrency=8)
+    for _ in range(20):
+        controller.call("acc", lambda: None, usage=lambda _: (10.0, None))
+    assert controller.metrics()["accounts"]["acc"]["concurrency_limit"] > 4
+
+    controller.call("acc", lambda: None, usage=lambda _: (90.0, None))
+    controller.call("acc", lambda: None, usage=lambda _: (90.0, None))
+    assert controller.metrics()["accounts"]["acc"]["concurrency_limit"] <= 2
+
+
+def test_controller_token_bucket_limits_call_rate():
+    """Test that calls beyond the burst are spaced by the token rate."""
+    controller = ConcurrencyController(rate_per_second=50.0)
+    started = time.monotonic()
+    for _ in range(60):
+        controller.call("acc", lambda: None)
+    assert time.monotonic() - started >= 0.15
+
+
+def test_controller_raises_non_throttling_errors_without_retry():
+    """Test that errors not classified as throttling propagate immediately."""
+    controller = ConcurrencyController()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        controller.call("acc", fail, throttle_delay=lambda e: None)
+    assert len(calls) == 1
+    assert controller.metrics()["accounts"]["acc"]["calls"] == 1
+
+
+class MultiAccountConnector(DummyConnector):
+    """Connector with accounts of different sizes, one of which fails."""
+
+    sizes = {"small": 1, "large": 10, "broken": 5}
+
+    def __init__(self, broken=("broken",)):
+        super().__init__()
+        self.broken = broken
+        self.started = []
+
+    def discover_accounts(self):
+        return list(self.sizes)
+
+    def estimate_account_size(self, account):
+        return self.sizes[account]
+
+    def extract_pages(self, start_date, end_date, account=None):
+        self.started.append(account)
+        if account in self.broken:
+            raise RuntimeError("account disabled")
+        yield from super().extract_pages(start_date, end_date, account)
+
+
+def test_plan_tasks_schedules_largest_accounts_first():
+    """Test that tasks are ordered by estimated rows: account size × window days."""
+    tasks = MultiAccountConnector().plan_tasks("2024-01-01", "2024-01-10", window_days=5)
+
+    assert [task.account for task in tasks] == ["large", "large", "broken", "broken", "small", "small"]
+
+
+def test_run_reports_failed_accounts_and_loads_the_others():
+    """Test that a failing account is reported while the other accounts are still loaded."""
+    connector = MultiAccountConnector()
+    stats = connector.run_streaming("2024-01-01", "2024-01-04", batch_size=100, window_days=2, max_workers=1)
+
+    assert connector.started[:2] == ["large", "large"]
+    assert stats["failed_accounts"] == ["broken"]
+    assert stats["accounts"]["large"] == {"status": "success", "windows": 2, "failed_windows": 0,
+                                          "rows": 12, "errors": []}
+    assert stats["accounts"]["broken"]["failed_windows"] == 2
+    loaded = [row for batch in connector.written_batches for row in batch]
+    assert {row["account_id"] for row in loaded} == {"large", "small"}
+    assert len(loaded) == 24
+
+
+class BigQueryWritingConnector(MultiAccountConnector):
+    """Multi-account connector writing through the real write path to a fake client."""
+
+    def __init__(self, broken=(), bq_client=None):
+        super().__init__(broken=broken)
+        self.bq_client = bq_client or FakeBigQueryClient()
+
+    def write_to_bigquery(self, rows, staged_slices=None, run_metadata=None):
+        DataSourceConnector.write_to_bigquery(self, rows, staged_slices, run_metadata)
+
+    def _discard_uncommitted(self, extract_run_id, committed):
+        return DataSourceConnector._discard_uncommitted(self, extract_run_id, committed)  # pylint: disable=protected-access
+
+
+def test_failed_account_keeps_its_stored_rows():
+    """Test that a run with a failed account stages and commits only the accounts that were extracted."""
+    connector = BigQueryWritingConnector(broken=("broken",))
+    stats = connector.run_streaming("2024-01-01", "2024-01-02", batch_size=5, window_days=2, max_workers=1)
+
+    staged = {(str(row["date"]), row["account_id"]) for _, _, rows in connector.bq_client.loads for row in rows}
+    assert staged == {(f"2024-01-0{d}", account) for d in (1, 2) for account in ("large", "small")}
+    assert {disposition for _, disposition, _ in connector.bq_client.loads} == {
+        bigquery.WriteDisposition.WRITE_APPEND
+    }
+    # Several batches, one transaction: the stored slices of broken are not part of it
+    assert stats["batches"] > 1
+    assert len(transactions(connector.bq_client)) == 1
+
+
+class FlakyLoadConnector(DummyConnector):
+    """Dummy connector whose load fails once it reaches a given date."""
+
+    def __init__(self, fail_from=None):
+        super().__init__()
+        self.fail_from = fail_from
+        self.extracted = []
+
+    def extract_pages(self, start_date, end_date, account=None):
+        self.extracted.append((start_date, end_date))
+        yield from super().extract_pages(start_date, end_date, account)
+
+    def write_to_bigquery(self, rows, replaced_slices=None, run_metadata=None):
+        if self.fail_from and any(row["date"] >= self.fail_from for row in rows):
+            raise RuntimeError("load failed")
+        super().write_to_bigquery(rows, replaced_slices, run_metadata)
+
+
+@pytest.mark.parametrize("mode", ["run", "run_streaming", "run_pipelined"])
+def test_interrupted_run_resumes_from_checkpoint(tmp_path, mode):
+    """Test that a rerun of the same range only extracts the tasks not committed before the failure."""
+    checkpoints = CheckpointStore(tmp_path / "state.json")
+    kwargs = {"window_days": 2, "max_workers": 1, "checkpoints": checkpoints}
+    if mode != "run":
+        kwargs["batch_size"] = 6
+
+    failing = FlakyLoadConnector(fail_from="2024-01-05")
+    with pytest.raises(RuntimeError):
+        getattr(failing, mode)("2024-01-01", "2024-01-06", **kwargs)
+    (entry,) = checkpoints.runs().values()
+    assert entry["completed_tasks"] == [[None, "2024-01-01", "2024-01-02"], [None, "2024-01-03", "2024-01-04"]]
+
+    resumed = FlakyLoadConnector()
+    getattr(resumed, mode)("2024-01-01", "2024-01-06", **kwargs)
+
+    assert resumed.extracted == [("2024-01-05", "2024-01-06")]
+    assert {row["extract_run_id"] for batch in resumed.written_batches for row in batch} == {entry["extract_run_id"]}
+    assert checkpoints.runs() == {}
+
+
+class PartialLoadConnector(BigQueryWritingConnector):
+    """Two-account connector whose load fails on a given batch, after the earlier ones were written."""
+
+    sizes = {"first": 2, "second": 1}
+
+    def __init__(self, fail_on_batch=None, bq_client=None):
+        super().__init__(bq_client=bq_client)
+        self.fail_on_batch = fail_on_batch
+        self.batches = 0
+
+    def write_to_bigquery(self, rows, staged_slices=None, run_metadata=None):
+        self.batches += 1
+        if self.batches == self.fail_on_batch:
+            raise RuntimeError("load failed")
+        super().write_to_bigquery(rows, staged_slices, run_metadata)
+
+
+def test_resume_discards_the_staged_rows_of_a_partially_loaded_account(tmp_path):
+    """Test that a resumed run keeps the staged rows of committed tasks only, then commits everything once."""
+    checkpoints = CheckpointStore(tmp_path / "state.json")
+    kwargs = {"batch_size": 3, "window_days": 2, "max_workers": 1, "checkpoints": checkpoints}
+    client = FakeBigQueryClient()
+
+    interrupted = PartialLoadConnector(fail_on_batch=4, bq_client=client)
+    with pytest.raises(RuntimeError):
+        interrupted.run_streaming("2024-01-01", "2024-01-02", **kwargs)
+    (entry,) = checkpoints.runs().values()
+    assert entry["completed_tasks"] == [["first", "2024-01-01", "2024-01-02"]]
+    staged = [row for _, _, rows in client.loads for row in rows]
+    assert ("2024-01-01", "second") in {(str(row["date"]), row["account_id"]) for row in staged}
+    # Nothing reached the raw table, and the staging table is kept for the resumed run
+    assert not transactions(client)
+    staging_id = staging_table_id(interrupted.raw_table_id, entry["extract_run_id"])
+    assert staging_id in client.tables
+
+    resumed = PartialLoadConnector(bq_client=client)
+    resumed.run_streaming("2024-01-01", "2024-01-02", **kwargs)
+
+    assert resumed.started == ["second"]
+    (discard, job_config), = [(query, config) for query, config in client.queries
+                              if query.lstrip().startswith(f"DELETE FROM `{staging_id}`")]
+    (committed,) = job_config.query_parameters[0].values
+    assert [str(value) for value in committed.struct_values.values()] == ["first", "2024-01-01", "2024-01-02"]
+    assert "NOT EXISTS" in discard
+    assert len(transactions(client)) == 1
+    assert client.deleted_tables == [staging_id]
+    assert checkpoints.runs() == {}
+
+
+def test_checkpoint_keeps_failed_accounts_for_the_next_run(tmp_path):
+    """Test that only the accounts that failed are extracted again, appending to shared dates."""
+    checkpoints = CheckpointStore(tmp_path / "state.json")
+    connector = MultiAccountConnector()
+    stats = connector.run_streaming("2024-01-01", "2024-01-04", window_days=2, max_workers=2,
+                                    checkpoints=checkpoints)
+    assert stats["failed_accounts"] == ["broken"]
+    assert len(checkpoints.runs()) == 1
+
+    retry = MultiAccountConnector(broken=())
+    stats = retry.run_streaming("2024-01-01", "2024-01-04", window_days=2, max_workers=2, checkpoints=checkpoints)
+
+    assert retry.started == ["broken", "broken"]
+    assert stats["skipped_windows"] == 4 and stats["resumed"]
+    assert checkpoints.runs() == {}
+
+
+def test_run_incremental_starts_from_watermark_minus_lookback(tmp_path):
+    """Test that each run extracts from the watermark minus the lookback and advances it."""
+    watermarks = WatermarkStore(tmp_path / "watermarks.json")
+    connector = FlakyLoadConnector()
+
+    stats = connector.run_incremental("2024-01-10", lookback_days=3, initial_start_date="2024-01-01",
+                                      watermarks=watermarks)
+    assert (stats["start_date"], stats["rows"]) == ("2024-01-01", 30)
+    assert watermarks.get("google_ads") == "2024-01-10"
+
+    stats = connector.run_incremental("2024-01-12", lookback_days=3, watermarks=watermarks)
+    assert stats["start_date"] == "2024-01-08"
+    assert connector.extracted[-1] == ("2024-01-08", "2024-01-12")
+    assert watermarks.get("google_ads") == "2024-01-12"
+
+    assert connector.run_incremental("2024-01-12", lookback_days=0, watermarks=watermarks)["rows"] == 0
+
+
+def test_run_incremental_keeps_watermark_of_failed_accounts(tmp_path):
+    """Test that failed accounts keep their watermark and pull the next run's start back."""
+    watermarks = WatermarkStore(tmp_path / "watermarks.json")
+    watermarks.advance("google_ads", {account: "2024-01-10" for account in MultiAccountConnector.sizes})
+
+    stats = MultiAccountConnector().run_incremental("2024-01-20", lookback_days=1, watermarks=watermarks)
+    assert stats["start_date"] == "2024-01-10"
+    assert stats["watermarks"] == {"small": "2024-01-20", "large": "2024-01-20"}
+    assert watermarks.get("google_ads", "broken") == "2024-01-10"
+
+    with pytest.raises(ValueError):
+        DummyConnector().run_incremental("2024-01-20", watermarks=WatermarkStore(tmp_path / "empty.json"))
+
+
+class RepullConnector(MultiAccountConnector):
+    """Accounts re-pulled over dates already stored, one of them corrected on `changed_day`."""
+
+    def __init__(self, changed_day=None):
+        super().__init__(broken=())
+        self.skip_unchanged = True
+        self.changed_day = changed_day
+        self.digest_queries = []
+        self.bq_client = FakeBigQueryClient()
+
+    def extract_pages(self, start_date, end_date, account=None):
+        for page in super().extract_pages(start_date, end_date, account):
+            yield [{**row, "clicks": 2 if (row["date"], account) == (self.changed_day, "small") else 1}
+                   for row in page]
+
+    def stored_partition_digests(self, dates):
+        self.digest_queries.append(sorted(dates))
+        stored = RepullConnector()
+        rows = [row for account in self.sizes for page in stored.extract_pages(dates[0], dates[-1], account)
+                for row in page]
+        return {
+            day: partition_digest(stored.fingerprint_rows([row for row in rows if row["date"] == day]))
+            for day in dates
+        }
+
+
+def test_unchanged_partitions_are_not_rewritten():
+    """Test that only the dates whose re-pulled rows differ from the stored ones are loaded."""
+    connector = RepullConnector(changed_day="2024-01-03")
+    stats = connector.run_streaming("2024-01-01", "2024-01-04", batch_size=100, window_days=2, max_workers=3)
+
+    loaded = [row for batch in connector.written_batches for row in batch]
+    assert {row["date"] for row in loaded} == {"2024-01-03"}
+    assert len(loaded) == 9
+    assert (stats["skipped_partitions"], stats["skipped_rows"]) == (3, 27)
+    # One digest query per window, once every account of the window is extracted
+    assert connector.digest_queries == [["2024-01-01", "2024-01-02"], ["2024-01-03", "2024-01-04"]]
+    # Unchanged partitions keep their load time: each check is recorded for the backfill planner
+    checks = [(table_id, row) for table_id, _, rows in connector.bq_client.loads for row in rows]
+    assert {table_id for table_id, _ in checks} == {"test-project.mdp_raw.partition_checks"}
+    assert [(row["date"], row["row_count"]) for _, row in checks] == [
+        ("2024-01-01", 9), ("2024-01-02", 9), ("2024-01-04", 9),
+    ]
+
+
+class CountingConnector(DummyConnector):
+    """Dummy connector recording the ranges it extracts from the source."""
+
+    def __init__(self, cache):
+        super().__init__()
+        self.response_cache = cache
+        self.extracted_ranges = []
+
+    def extract_pages(self, start_date, end_date, account=None):
+        self.extracted_ranges.append((start_date, end_date))
+        yield from super().extract_pages(start_date, end_date, account)
+
+
+def test_cached_dates_are_not_extracted_again(tmp_path):
+    """Test that a rerun only requests the dates missing from the response cache."""
+    cache = ResponseCache(tmp_path)
+    first = CountingConnector(cache)
+    first.run("2024-01-02", "2024-01-03")
+
+    second = CountingConnector(cache)
+    stats = second.run_streaming("2024-01-01", "2024-01-05", batch_size=100, window_days=5)
+
+    assert second.extracted_ranges == [("2024-01-01", "2024-01-01"), ("2024-01-04", "2024-01-05")]
+    assert stats["rows"] == 15
+    assert (stats["cache"]["hits"], stats["cache"]["puts"]) == (2, 5)
+
+
+def row_key(row):
+    """Identity of a dummy row."""
+    return row["date"], row["account_id"], row["campaign_id"]
+
+
+class OfflineConnector(DummyConnector):
+    """Connector whose API is unreachable."""
+
+    def extract_pages(self, start_date, end_date, account=None):
+        raise AssertionError("the API must not be called")
+
+
+def test_run_replay_reloads_archived_rows_without_api_calls(tmp_path):
+    """Test that the raw table is rebuilt from the archive of a previous run."""
+    extracting = MultiAccountConnector(broken=())
+    extracting.archive = PayloadArchive(tmp_path)
+    extracted = extracting.run("2024-01-01", "2024-01-03", window_days=2)
+
+    replaying = OfflineConnector()
+    replaying.archive = PayloadArchive(tmp_path)
+    stats = replaying.run_replay("2024-01-01", "2024-01-04", batch_size=10)
+
+    replayed = [row for batch in replaying.written_batches for row in batch]
+    assert sorted(map(row_key, replayed)) == sorted(map(row_key, extracted))
+    assert (stats["rows"], stats["dates"], stats["files"]) == (27, 3, 9)
+    assert stats["missing_dates"] == ["2024-01-04"]
+    assert {row["extract_run_id"] for row in replayed} == {stats["extract_run_id"]}
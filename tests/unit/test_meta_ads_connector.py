@@ -0,0 +1,221 @@
+"""Unit tests for Meta Ads insights extraction (sync and async report modes)."""
+
+import pytest
+
+from ingestion.concurrency import ConcurrencyController
+from ingestion.windowing import iter_days
+from ingestion.meta_ads.connector import MetaAdsConnector, parse_usage_headers
+
+
+def insights_rows(params):
+    """Insights rows of a fake account with 2 campaigns."""
+    time_range = params["time_range"]
+    return [
+        {"date_start": day, "campaign_id": f"c{i}", "campaign_name": f"Campaign {i}",
+         "impressions": "100", "clicks": "5", "spend": "1.50",
+         "actions": [{"action_type": "post_reaction", "value": "3"}]}
+        for day in iter_days(time_range["since"], time_range["until"])
+        for i in range(2)
+    ]
+
+
+class FakeCampaigns(list):
+    def total(self):
+        return len(self)
+
+
+class FakeReportRun(dict):
+    """AdReportRun stand-in completing after a number of status polls."""
+
+    def __init__(self, params, polls_needed, fail=False):
+        super().__init__(async_status="Job Running", async_percent_completion=0)
+        self.params = params
+        self.polls_needed = polls_needed
+        self.fail = fail
+
+    def api_get(self):
+        self.polls_needed -= 1
+        if self.polls_needed <= 0:
+            self.update(async_status="Job Failed" if self.fail else "Job Completed",
+                        async_percent_completion=100)
+        return self
+
+    def get_result(self, params):
+        return iter(insights_rows(self.params))
+
+
+class FakeAdAccount:
+    """AdAccount stand-in recording sync and async insights calls."""
+
+    def __init__(self, fail_async=False):
+        self.sync_calls = []
+        self.reports = []
+        self.max_in_flight = 0
+        self.fail_async = fail_async
+
+    def get_campaigns(self, fields, params):
+        return FakeCampaigns([{"id": "c0"}, {"id": "c1"}])
+
+    def get_insights(self, fields, params, is_async=False):
+        if not is_async:
+            self.sync_calls.append(params["time_range"])
+            return iter(insights_rows(params))
+        # Earlier windows take longer: completion order differs from submission order
+        report = FakeReportRun(params, polls_needed=3 - len(self.reports) % 3, fail=self.fail_async)
+        self.reports.append(report)
+        self.max_in_flight = max(self.max_in_flight,
+                                 sum(r["async_status"] == "Job Running" for r in self.reports))
+        return report
+
+
+def make_connector(account, **kwargs):
+    connector = MetaAdsConnector(ad_account=account, **kwargs)
+    connector.async_poll_seconds = 0
+    connector.controller = ConcurrencyController(throttle_backoff_seconds=0.01)
+    return connector
+
+
+def test_auto_mode_uses_sync_insights_below_threshold():
+    """Test that small ranges go through a single synchronous insights call."""
+    account = FakeAdAccount()
+    rows = make_connector(account).extract("2024-01-01", "2024-01-10")
+
+    assert len(rows) == 20
+    assert account.sync_calls and not account.reports
+    assert rows[0]["likes"] == 3
+
+
+def test_auto_mode_switches_to_async_reports_above_threshold():
+    """Test that large estimated ranges are split into async report runs per report window."""
+    account = FakeAdAccount()
+    connector = make_connector(account)
+    connector.async_row_threshold = 50
+    rows = connector.extract("2024-01-01", "2024-03-31")
+
+    assert not account.sync_calls
+    assert len(account.reports) == 13
+    assert len(rows) == 91 * 2
+    assert len({(r["date"], r["campaign_id"]) for r in rows}) == 91 * 2
+
+
+def test_async_reports_are_streamed_as_they_complete():
+    """Test that pages are yielded in report completion order, not submission order."""
+    connector = make_connector(FakeAdAccount(), insights_mode="async")
+    connector.async_report_days = 10
+    pages = list(connector.extract_pages("2024-01-01", "2024-01-30"))
+
+    first_dates = [page[0]["date"] for page in pages]
+    assert first_dates == ["2024-01-21", "2024-01-11", "2024-01-01"]
+
+
+def test_extraction_window_runs_several_async_reports_at_once():
+    """Test that one extraction window is split into report windows polled concurrently."""
+    account = FakeAdAccount()
+    connector = make_connector(account, insights_mode="async")
+    start, end = "2024-01-01", "2024-01-31"
+    assert connector.window_days >= 31  # The whole range is a single extraction task
+
+    rows = list(connector.extract_pages(start, end))
+
+    assert len(account.reports) == 5
+    assert account.max_in_flight == 4
+    assert len({(r["date"], r["campaign_id"]) for page in rows for r in page}) == 31 * 2
+
+
+def test_failed_async_report_raises():
+    """Test that a failed report run stops the extraction with an error."""
+    connector = make_connector(FakeAdAccount(fail_async=True), insights_mode="async")
+    with pytest.raises(RuntimeError, match="Job Failed"):
+        connector.extract("2024-01-01", "2024-01-31")
+
+
+def test_unknown_insights_mode_is_rejected():
+    """Test that an invalid insights mode fails at init."""
+    with pytest.raises(ValueError, match="insights mode"):
+        MetaAdsConnector(insights_mode="batch")
+
+
+class ThrottlingError(Exception):
+    """FacebookRequestError stand-in."""
+
+    def api_error_code(self):
+        return 80000
+
+    def http_headers(self):
+        return {"x-business-use-case-usage":
+                '{"123": [{"call_count": 100, "total_time": 20, "estimated_time_to_regain_access": 0}]}'}
+
+
+class ThrottledOnceAccount(FakeAdAccount):
+    """Account rejecting the first insights call with a rate-limit error."""
+
+    def get_insights(self, fields, params, is_async=False):
+        if not self.sync_calls:
+            self.sync_calls.append("throttled")
+            raise ThrottlingError("too many calls")
+        return super().get_insights(fields, params, is_async)
+
+
+def test_throttled_calls_are_retried_and_counted():
+    """Test that a Meta throttling error pauses, cuts concurrency and retries the call."""
+    account = ThrottledOnceAccount()
+    connector = make_connector(account, insights_mode="sync")
+    rows = connector.extract("2024-01-01", "2024-01-05")
+
+    metrics = connector.controller.metrics()
+    assert len(rows) == 10
+    assert metrics["throttled_calls"] == 1
+    assert metrics["retries"] == 1
+    assert metrics["accounts"][connector.account_id]["concurrency_limit"] < 4
+
+
+class ThrottledCursor:
+    """Insights cursor whose next page load is throttled once, after some rows were read."""
+
+    def __init__(self, rows, throttle_at):
+        self.rows = rows
+        self.position = 0
+        self.throttle_at = throttle_at
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position == self.throttle_at:
+            self.throttle_at = None
+            raise ThrottlingError("too many calls")
+        if self.position >= len(self.rows):
+            raise StopIteration
+        self.position += 1
+        return self.rows[self.position - 1]
+
+
+class ThrottledMidPageAccount(FakeAdAccount):
+    """Account whose insights cursor is throttled in the middle of the first page."""
+
+    def get_insights(self, fields, params, is_async=False):
+        self.sync_calls.append(params["time_range"])
+        return ThrottledCursor(insights_rows(params), throttle_at=3)
+
+
+def test_rows_read_before_a_mid_page_throttle_are_kept():
+    """Test that a throttled page load resumes after the rows already read, without losing them."""
+    connector = make_connector(ThrottledMidPageAccount(), insights_mode="sync")
+    rows = connector.extract("2024-01-01", "2024-01-05")
+
+    assert len(rows) == 10
+    assert len({(r["date"], r["campaign_id"]) for r in rows}) == 10
+    assert connector.controller.metrics()["throttled_calls"] == 1
+
+
+def test_parse_usage_headers():
+    """Test that the highest reported usage and the regain delay are read from headers."""
+    usage, retry_after = parse_usage_headers({
+        "X-Business-Use-Case-Usage": '{"123": [{"type": "ads_insights", "call_count": 28, '
+                                     '"total_cputime": 12, "total_time": 41, '
+                                     '"estimated_time_to_regain_access": 2}]}',
+        "X-Ad-Account-Usage": '{"acc_id_util_pct": 9.5, "reset_time_duration": 0}',
+    })
+    assert usage == 41
+    assert retry_after == 120
+    assert parse_usage_headers({}) == (None, None)
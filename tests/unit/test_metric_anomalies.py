@@ -0,0 +1,92 @@
+"""Unit tests for the per-campaign metric anomaly detection."""
+
+import zlib
+from datetime import date
+
+import numpy as np
+import pyarrow as pa
+
+from monitoring import metric_anomalies
+from monitoring.metric_anomalies import METRICS, build_campaign_matrix, detect_anomalies, get_metric_anomalies
+from monitoring.volume_checks import format_volume_report
+
+START = date(2024, 1, 1)
+DAYS = 29
+
+
+def campaign_rows(key, days, spend, impressions):
+    """Noisy long-format rows of a campaign: (key, name, day_index, spend, impressions, clicks, conversions)."""
+    rng = np.random.default_rng(zlib.crc32(key.encode()))
+    return [
+        (key, f"Campaign {key}", day, spend(day) + rng.normal(0, 1), impressions + rng.integers(0, 50),
+         impressions // 50, 6)
+        for day in days
+    ]
+
+
+def make_matrix(rows):
+    """Pivot test rows into a campaign matrix."""
+    keys, names, days, *metrics = zip(*rows)
+    return build_campaign_matrix(START, DAYS, keys=np.array(keys), names=np.array(names), day_index=np.array(days),
+                                 metrics={metric: np.array(values, dtype=float)
+                                          for metric, values in zip(METRICS, metrics)})
+
+
+def test_matrix_pivots_rows_and_fills_missing_days_with_zero():
+    """Test that each (campaign, day) row lands in its cell."""
+    matrix = make_matrix([("b", "B", 3, 5.0, 50, 1, 0), ("a", "A", 0, 1.0, 10, 2, 3)])
+    assert list(matrix.campaign_keys) == ["a", "b"]
+    assert matrix.values.shape == (len(METRICS), 2, DAYS)
+    assert matrix.values[0, 1, 3] == 5.0 and matrix.values[1, 0, 0] == 10
+    assert matrix.values[:, 0, 1:].sum() == 0
+
+
+def test_detects_spikes_and_drops_to_zero_of_single_campaigns():
+    """Test that only the campaigns deviating from their own history are flagged."""
+    days = range(DAYS)
+    last = DAYS - 1
+    rows = (
+        campaign_rows("google_ads:steady", days, lambda d: 100, 5000)
+        + campaign_rows("meta_ads:spike", days, lambda d: 1000 if d == last else 100, 5000)
+        + campaign_rows("meta_ads:paused", range(last), lambda d: 100, 5000)
+        + campaign_rows("google_ads:new", range(last - 2, DAYS), lambda d: 5000 if d == last else 100, 5000)
+    )
+    results = detect_anomalies(make_matrix(rows), baseline_days=28)
+
+    flagged = {entry["table"].split(" ")[0]: entry for entry in results["tables_checked"]}
+    assert set(flagged) == {"meta_ads:spike", "meta_ads:paused"}
+    assert flagged["meta_ads:spike"]["metrics"]["spend"]["robust_z"] > 5
+    assert "spend dropped to zero" in " ".join(flagged["meta_ads:paused"]["issues"])
+    # The new campaign has no baseline yet and is not judged
+    assert results["summary"]["total_tables"] == 3
+    assert (results["summary"]["passed"], results["summary"]["warned"]) == (1, 2)
+    assert "meta_ads:spike" in format_volume_report({**results, "summary": {**results["summary"], "wall_seconds": 0}})
+
+
+class FakeMatrixClient:  # pylint: disable=too-few-public-methods
+    """Returns the matrix query result as an Arrow table."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def query(self, sql, job_config=None):
+        self.queries.append((sql, {p.name: p.value for p in job_config.query_parameters}))
+        columns = ("campaign_key", "campaign_name", "day_index", *METRICS)
+        table = pa.table({name: [row[i] for row in self.rows] for i, name in enumerate(columns)})
+        return type("Job", (), {"total_bytes_processed": 4096, "result": lambda job: type(
+            "Result", (), {"to_arrow": lambda result: table})()})()
+
+
+def test_get_metric_anomalies_reads_the_matrix_in_one_query(monkeypatch):
+    """Test that one query covers the baseline window and the check date."""
+    rows = campaign_rows("meta_ads:spike", range(DAYS), lambda d: 1000 if d == DAYS - 1 else 100, 5000)
+    client = FakeMatrixClient(rows)
+    monkeypatch.setattr(metric_anomalies, "get_client", lambda project_id: client)
+
+    results = get_metric_anomalies("test-project", check_date="2024-01-29")
+
+    assert len(client.queries) == 1
+    assert client.queries[0][1] == {"start_date": START, "end_date": date(2024, 1, 29)}
+    assert results["summary"]["warned"] == 1
+    assert results["summary"]["bytes_processed"] == 4096
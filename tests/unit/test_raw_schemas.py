@@ -0,0 +1,57 @@
+"""Unit tests for the raw-zone schema registry."""
+
+import pytest
+
+from ingestion.schemas import NOT_NULL_FIELDS, RAW_SCHEMAS, coerce_rows, get_raw_schema
+
+METADATA = {
+    "ingested_at": "2024-01-02T03:04:05+00:00",
+    "extract_run_id": "run-1",
+    "source": "google_ads",
+}
+
+
+def test_registry_covers_both_raw_tables():
+    """Test that a schema is registered for each source's raw table."""
+    assert set(RAW_SCHEMAS) == {"google_ads_campaign_daily", "meta_ads_campaign_daily"}
+    with pytest.raises(ValueError):
+        get_raw_schema("tiktok_ads_campaign_daily")
+
+
+def test_coerce_rows_casts_to_declared_types():
+    """Test that round amounts stay FLOAT and counters become INTEGER."""
+    schema = get_raw_schema("google_ads_campaign_daily")
+    row = {"date": "2024-01-01", "campaign_id": 123, "impressions": "10",
+           "clicks": 2.0, "cost_usd": 100, "campaign_name": None, **METADATA}
+
+    [coerced] = coerce_rows([row], schema)
+
+    assert coerced["cost_usd"] == 100.0 and isinstance(coerced["cost_usd"], float)
+    assert coerced["impressions"] == 10 and coerced["clicks"] == 2
+    assert coerced["campaign_id"] == "123"
+    assert "campaign_name" not in coerced
+
+
+@pytest.mark.parametrize("row", [
+    {"date": "2024-01-01", "campaign_id": "c1", "unexpected": 1, **METADATA},
+    {"date": "2024-01-01", **METADATA},
+    {"date": "2024-13-01", "campaign_id": "c1", **METADATA},
+    {"date": "2024-01-01", "campaign_id": "c1", "clicks": 1.5, **METADATA},
+])
+def test_coerce_rows_rejects_invalid_rows(row):
+    """Test that unknown columns, missing keys and bad values are rejected."""
+    with pytest.raises(ValueError):
+        coerce_rows([row], get_raw_schema("google_ads_campaign_daily"))
+
+
+@pytest.mark.parametrize("table_name", sorted(RAW_SCHEMAS))
+def test_raw_columns_are_nullable_but_key_fields_are_enforced(table_name):
+    """Test that loads match NULLABLE legacy tables while rows without key fields are still rejected."""
+    schema = get_raw_schema(table_name)
+    assert all(field.mode == "NULLABLE" for field in schema)
+
+    row = {"date": "2024-01-01", "campaign_id": "c1", **METADATA}
+    assert coerce_rows([row], schema)
+    for name in NOT_NULL_FIELDS:
+        with pytest.raises(ValueError, match=name):
+            coerce_rows([{key: value for key, value in row.items() if key != name}], schema)
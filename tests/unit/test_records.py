@@ -0,0 +1,23 @@
+"""Unit tests for typed campaign-daily record classes."""
+
+import pytest
+
+from ingestion.records import GoogleAdsCampaignDaily, MetaAdsCampaignDaily
+
+
+def test_records_are_slotted():
+    """Test that records carry no per-instance dict."""
+    record = GoogleAdsCampaignDaily("2024-01-01", "c1", "Campaign", 100, 10, 1, 12.5)
+    assert not hasattr(record, "__dict__")
+
+
+def test_records_behave_like_read_only_mappings():
+    """Test dict-style access used by enrichment and serialization."""
+    record = MetaAdsCampaignDaily("2024-01-01", "c1", "Campaign", 100, 10, 12.5, likes=3)
+
+    assert record["likes"] == 3 and "likes" in record
+    assert record.get("video_views") is None
+    assert record.get("unknown", 0) == 0
+    assert {**record}["spend_usd"] == 12.5
+    with pytest.raises(KeyError):
+        _ = record["get"]
@@ -0,0 +1,62 @@
+"""Unit tests for the on-disk API response cache."""
+
+import time
+
+from datetime import date, timedelta
+
+from ingestion.response_cache import ResponseCache
+
+FIELDS = ("campaign_id", "clicks")
+OLD_DAY = "2024-01-01"
+
+
+def test_get_returns_stored_rows_and_counts_hits_and_misses(tmp_path):
+    """Test that rows come back from disk, including empty dates, and that lookups are counted."""
+    cache = ResponseCache(tmp_path)
+    assert cache.get("meta_ads", "act_1", OLD_DAY, FIELDS) is None
+
+    cache.put("meta_ads", "act_1", OLD_DAY, FIELDS, [{"date": OLD_DAY, "clicks": 3}])
+    cache.put("meta_ads", "act_1", "2024-01-02", FIELDS, [])
+
+    reopened = ResponseCache(tmp_path)
+    assert reopened.get("meta_ads", "act_1", OLD_DAY, FIELDS) == [{"date": OLD_DAY, "clicks": 3}]
+    assert reopened.get("meta_ads", "act_1", "2024-01-02", FIELDS) == []
+    # Any part of the key changing is a different entry
+    assert reopened.get("meta_ads", "act_2", OLD_DAY, FIELDS) is None
+    assert reopened.get("meta_ads", "act_1", OLD_DAY, ("campaign_id",)) is None
+
+    stats = reopened.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 2, 2)
+
+
+def test_recent_dates_expire_but_settled_dates_never_do(tmp_path):
+    """Test that only dates within the late-data window get a TTL."""
+    cache = ResponseCache(tmp_path, ttl_seconds=0.01, late_days=7)
+    recent = (date.today() - timedelta(days=1)).isoformat()
+    cache.put("google_ads", None, recent, FIELDS, [{"date": recent}])
+    cache.put("google_ads", None, OLD_DAY, FIELDS, [{"date": OLD_DAY}])
+    time.sleep(0.05)
+
+    assert cache.get("google_ads", None, recent, FIELDS) is None
+    assert cache.get("google_ads", None, OLD_DAY, FIELDS) == [{"date": OLD_DAY}]
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_size_cap_evicts_least_recently_used_entries(tmp_path):
+    """Test that entries read recently survive eviction while the oldest unused one goes."""
+    cache = ResponseCache(tmp_path)
+    days = ["2024-01-01", "2024-01-02", "2024-01-03"]
+    for day in days[:2]:
+        cache.put("meta_ads", None, day, FIELDS, [{"date": day, "campaign_id": "c" * 200}])
+    # Room for two entries, not three
+    cache.max_bytes = int(cache.stats()["bytes"] * 1.25)
+
+    assert cache.get("meta_ads", None, days[0], FIELDS) is not None
+    cache.put("meta_ads", None, days[2], FIELDS, [{"date": days[2], "campaign_id": "c" * 200}])
+
+    assert cache.get("meta_ads", None, days[1], FIELDS) is None
+    assert cache.get("meta_ads", None, days[0], FIELDS) is not None
+    assert cache.get("meta_ads", None, days[2], FIELDS) is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
@@ -0,0 +1,151 @@
+"""Unit tests for the volume checks (BigQuery client stubbed)."""
+
+import re
+from datetime import date
+from types import SimpleNamespace
+
+from monitoring import volume_checks
+from monitoring.volume_checks import VOLUME_THRESHOLDS, format_volume_report, get_volume_checks
+
+PARTITIONED = {"mdp_raw.google_ads_campaign_daily", "mdp_raw.meta_ads_campaign_daily",
+               "mdp_marts.mart_campaign_daily"}
+
+
+class FakeJob:  # pylint: disable=too-few-public-methods
+    """Query job returning fixed rows, or raising."""
+
+    def __init__(self, rows=None, error=None, total_bytes_processed=0):
+        self.rows = rows or []
+        self.error = error
+        self.total_bytes_processed = total_bytes_processed
+
+    def result(self):
+        if self.error:
+            raise self.error
+        return self.rows
+
+
+class FakeCountsClient:
+    """Serves table metadata and count queries from {table_id: (check date, day before)}."""
+
+    project = "test-project"
+
+    def __init__(self, counts, broken=(), baselines=None):
+        self.counts = counts
+        self.broken = broken
+        self.baselines = baselines or {}
+        self.queries = []
+        self.history = {}
+
+    def create_table(self, table, exists_ok=False):
+        assert exists_ok and table.time_partitioning.field == "check_date"
+
+    def get_table(self, table_id):
+        if table_id not in self.counts:
+            raise RuntimeError(f"Not found: Table {table_id}")
+        column = VOLUME_THRESHOLDS[table_id].get("date_column", "date")
+        partitioning = SimpleNamespace(type_="DAY", field=column)
+        return SimpleNamespace(table_type="TABLE" if table_id in PARTITIONED else "VIEW",
+                               time_partitioning=partitioning if table_id in PARTITIONED else None)
+
+    def query(self, sql, job_config=None):
+        self.queries.append(sql)
+        params = {p.name: p for p in job_config.query_parameters}
+        if sql.lstrip().startswith("MERGE"):
+            for struct in params["counts"].values:
+                self.history[(struct.struct_values["table_id"], params["check_date"].value)] = \
+                    struct.struct_values["row_count"]
+            return FakeJob(total_bytes_processed=512)
+        if "same_weekday" in sql:
+            return FakeJob([{"table_id": table_id, **baseline} for table_id, baseline in self.baselines.items()
+                            if table_id in params["table_ids"].values])
+        if "INFORMATION_SCHEMA.PARTITIONS" in sql:
+            dataset = re.search(r"FROM `([^.]+)\.INFORMATION_SCHEMA", sql).group(1)
+            before_id, check_id = params["partition_ids"].values
+            rows = []
+            for name in params["table_names"].values:
+                today, yesterday = self.counts[f"{dataset}.{name}"]
+                rows += [{"table_name": name, "partition_id": check_id, "total_rows": today},
+                         {"table_name": name, "partition_id": before_id, "total_rows": yesterday}]
+            return FakeJob(rows, total_bytes_processed=10_485_760)
+
+        assert "BETWEEN DATE_SUB(@check_date" in sql
+        tables = re.findall(r"FROM `([^`]+)`", sql)
+        if any(table in self.broken for table in tables):
+            return FakeJob(error=RuntimeError("Unrecognized name: report_date"))
+        return FakeJob([{"table_id": table, "today_count": self.counts[table][0],
+                         "yesterday_count": self.counts[table][1]} for table in tables],
+                       total_bytes_processed=2048 * len(tables))
+
+
+def test_partitioned_tables_are_counted_from_partition_metadata(monkeypatch):
+    """Test that partitioned tables read metadata per dataset and views one pruned scan."""
+    client = FakeCountsClient({table_id: (100, 90) for table_id in VOLUME_THRESHOLDS})
+    monkeypatch.setattr(volume_checks, "get_client", lambda project_id: client)
+
+    results = get_volume_checks("test-project", check_date="2024-01-02")
+
+    # mdp_raw and mdp_marts metadata, one scan for both staging views, then the history upsert and baselines
+    assert len(client.queries) == 5
+    methods = {table["table"]: table["method"] for table in results["tables_checked"]}
+    assert {table for table, method in methods.items() if method == "partition_metadata"} == PARTITIONED
+    assert results["summary"]["passed"] == len(VOLUME_THRESHOLDS)
+    assert results["summary"]["bytes_processed"] == 2 * 10_485_760 + 2 * 2048 + 512
+    report = format_volume_report(results)
+    assert "bytes processed" in report
+    assert "Check date: 2024-01-02" in report
+    assert "Check date: 100 | Day before: 90" in report
+
+
+def test_raw_and_staging_tables_share_their_thresholds():
+    """Test that a source's staging view, which holds its raw rows, is held to the same volume."""
+    for source in ("google_ads", "meta_ads"):
+        raw = VOLUME_THRESHOLDS[f"mdp_raw.{source}_campaign_daily"]
+        staging = VOLUME_THRESHOLDS[f"mdp_staging.stg_{source}__campaign_daily"]
+        for key in ("min_daily_records", "max_daily_records", "max_variance_percent"):
+            assert raw[key] == staging[key]
+
+
+def test_volume_checks_isolate_the_errors_of_each_table(monkeypatch):
+    """Test that a missing table and a failing scan fail alone, the other tables being checked."""
+    counts = {table_id: (100, 20) for table_id in VOLUME_THRESHOLDS if table_id != "mdp_raw.meta_ads_campaign_daily"}
+    client = FakeCountsClient(counts, broken=("mdp_staging.stg_meta_ads__campaign_daily",))
+    monkeypatch.setattr(volume_checks, "get_client", lambda project_id: client)
+
+    results = get_volume_checks("test-project", check_date="2024-01-02")
+
+    statuses = {table["table"]: table["status"] for table in results["tables_checked"]}
+    assert statuses.pop("mdp_raw.meta_ads_campaign_daily") == "ERROR"
+    assert statuses.pop("mdp_staging.stg_meta_ads__campaign_daily") == "ERROR"
+    assert set(statuses.values()) == {"WARN"}
+
+
+def test_weekday_baseline_replaces_day_over_day_variance(monkeypatch):
+    """Test that a table with enough history is scored against its same-weekday median."""
+    counts = {table_id: (100, 20) for table_id in VOLUME_THRESHOLDS}
+    usual = {"median": 100.0, "mad": 4.0, "baseline_days": 8}
+    client = FakeCountsClient(counts, baselines={
+        "mdp_raw.google_ads_campaign_daily": usual,
+        "mdp_raw.meta_ads_campaign_daily": {**usual, "median": 1000.0},
+        "mdp_marts.mart_campaign_daily": {**usual, "baseline_days": 2},
+    })
+    monkeypatch.setattr(volume_checks, "get_client", lambda project_id: client)
+
+    results = get_volume_checks("test-project", check_date="2024-01-06")
+
+    tables = {table["table"]: table for table in results["tables_checked"]}
+    # Usual weekday volume despite a 400% day-over-day jump
+    assert tables["mdp_raw.google_ads_campaign_daily"]["status"] == "PASS"
+    assert tables["mdp_raw.google_ads_campaign_daily"]["robust_z"] == 0
+    assert tables["mdp_raw.meta_ads_campaign_daily"]["status"] == "WARN"
+    assert tables["mdp_raw.meta_ads_campaign_daily"]["robust_z"] < -3.5
+    # Too little history: day-over-day variance still applies
+    assert tables["mdp_marts.mart_campaign_daily"]["status"] == "WARN"
+    assert "robust_z" not in tables["mdp_marts.mart_campaign_daily"]
+    assert client.history[("mdp_raw.google_ads_campaign_daily", date(2024, 1, 6))] == 100
+
+
+def test_robust_z_floors_the_spread_of_flat_histories():
+    """Test that a constant history does not turn a one-row difference into an anomaly."""
+    assert volume_checks._robust_z(101, 100.0, 0.0) == 0.2  # pylint: disable=protected-access
+    assert volume_checks._robust_z(0, 100.0, 0.0) == -20.0  # pylint: disable=protected-access